@@ -0,0 +1,84 @@
+"""
+Measures peak memory of an init load held as pydantic models (Node, LineageEdge, model_dump
+per graph node) against the compact pipeline representation (NodeRecord, EdgeArray).
+
+Usage: python -m omd_airflow_utils.benchmarks.bench_graph_memory [--nodes 200000] [--edges 1000000]
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+from datetime import datetime
+
+from omd_airflow_utils.lineage_core.adapters.node_repository import NodeRepository
+from omd_airflow_utils.lineage_core.domain.models import (
+    EdgeArray,
+    EntityRef,
+    EntityType,
+    LineageEdge,
+    Node,
+)
+from omd_airflow_utils.lineage_core.services.lineage_graph_builder import (
+    LineageGraphService,
+)
+from omd_airflow_utils.lineage_core.utils.simple_graph import SimpleDiGraph
+
+
+def legacy_load(node_rows, edge_rows):
+    nodes = [
+        Node(id=i, name=name, namespace_id=ns, db_schema=schema, updated=updated)
+        for i, name, ns, schema, updated in node_rows
+    ]
+    edges = [
+        LineageEdge(
+            from_entity=EntityRef(id=str(src), type=EntityType.TABLE),
+            to_entity=EntityRef(id=str(dst), type=EntityType.TABLE),
+        )
+        for src, dst in edge_rows
+    ]
+    graph = SimpleDiGraph()
+    for node in nodes:
+        graph.add_node(node.id, node.model_dump())
+    for edge in edges:
+        graph.add_edge(int(edge.from_entity.id), int(edge.to_entity.id))
+    return nodes, edges, graph
+
+
+def compact_load(node_rows, edge_rows):
+    repo = NodeRepository(conn=None)
+    nodes = list(repo._iter_rows_to_nodes(node_rows))
+    edges = EdgeArray(repo._iter_rows_to_edge_pairs(edge_rows))
+    graph = LineageGraphService().build_graph(nodes, edges)
+    return nodes, edges, graph
+
+
+def measure(label, load, node_rows, edge_rows):
+    gc.collect()
+    tracemalloc.start()
+    result = load(node_rows, edge_rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    print(f'{label:<8} peak {peak / 2 ** 20:8.1f} MiB')
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--nodes', type=int, default=200_000)
+    parser.add_argument('--edges', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    updated = datetime(2024, 1, 1)
+    node_rows = [
+        (i, f'table_{i}', i % 50, ''.join(['schema_', str(i % 4)]), updated) for i in range(args.nodes)
+    ]
+    edge_rows = [(random.randrange(args.nodes), random.randrange(args.nodes)) for _ in range(args.edges)]
+
+    legacy = measure('legacy', legacy_load, node_rows, edge_rows)
+    compact = measure('compact', compact_load, node_rows, edge_rows)
+    print(f'ratio    {legacy / compact:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Compares trigger collapsing on synthetic graphs with thousands of trigger nodes: the previous
+list-scanning algorithm against the predecessor-index one with trigger-chain closure.
+
+Usage: python -m omd_airflow_utils.benchmarks.bench_trigger_collapse [--nodes 20000] [--triggers 2000]
+"""
+import argparse
+import random
+import time
+
+from omd_airflow_utils.lineage_core.domain.models import NodeRecord
+from omd_airflow_utils.lineage_core.services.lineage_graph_builder import (
+    LineageGraphService,
+)
+from omd_airflow_utils.lineage_core.utils.simple_graph import SimpleDiGraph
+
+TRIGGER = 14
+
+
+def legacy_collapse(graph, trigger_operator_id):
+    trigger_nodes = [
+        node_id for node_id in graph.nodes()
+        if getattr(graph.get_node(node_id), 'operator_id', None) == trigger_operator_id
+    ]
+    new_graph = SimpleDiGraph()
+    for node_id in graph.nodes():
+        if node_id not in trigger_nodes:
+            new_graph.add_node(node_id, graph.get_node(node_id))
+    for trigger_id in trigger_nodes:
+        incoming_nodes = [node_id for node_id in graph.nodes() if trigger_id in graph.adj.get(node_id, [])]
+        for from_node in incoming_nodes:
+            for to_node in graph.adj.get(trigger_id, []):
+                if from_node not in trigger_nodes and to_node not in trigger_nodes:
+                    new_graph.add_edge(from_node, to_node)
+    for node_id in graph.nodes():
+        if node_id not in trigger_nodes:
+            for target_id in graph.adj.get(node_id, []):
+                if target_id not in trigger_nodes:
+                    new_graph.add_edge(node_id, target_id)
+    return new_graph
+
+
+def make_graph(node_count, trigger_count, edges_per_node):
+    triggers = set(random.sample(range(node_count), trigger_count))
+    graph = SimpleDiGraph()
+    for node_id in range(node_count):
+        operator_id = TRIGGER if node_id in triggers else None
+        graph.add_node(node_id, NodeRecord(node_id, f't{node_id}', 1, 's', None, operator_id=operator_id))
+    for src in range(node_count - 1):
+        for _ in range(edges_per_node):
+            graph.add_edge(src, random.randrange(src + 1, node_count))
+    return graph
+
+
+def measure(label, collapse, graph):
+    started = time.perf_counter()
+    collapsed = collapse(graph, TRIGGER)
+    elapsed = time.perf_counter() - started
+    print(f'{label:<8} {collapsed.number_of_nodes():>8} nodes {collapsed.number_of_edges():>9} edges  {elapsed:8.2f}s')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--nodes', type=int, default=20_000)
+    parser.add_argument('--triggers', type=int, default=2_000)
+    parser.add_argument('--edges-per-node', type=int, default=3)
+    parser.add_argument('--skip-legacy', action='store_true')
+    args = parser.parse_args()
+
+    graph = make_graph(args.nodes, args.triggers, args.edges_per_node)
+    print(f'input    {graph.number_of_nodes():>8} nodes {graph.number_of_edges():>9} edges  {args.triggers} triggers')
+    if not args.skip_legacy:
+        measure('legacy', legacy_collapse, graph)
+    measure('indexed', LineageGraphService().collapse_trigger_nodes, graph)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+import logging
+import sqlite3
+import threading
+import time
+from typing import (
+    Callable,
+    Iterable,
+    Optional,
+)
+
+from omd_airflow_utils.lineage_core.adapters.config.config import CacheConfig
+from omd_airflow_utils.lineage_core.adapters.omd.omd_response_models import (
+    OMDResponseEntity,
+)
+from omd_airflow_utils.lineage_core.domain.types import EntityType
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 2
+
+CREATE_ENTITIES_TABLE = """
+create table if not exists entities (
+    entity_type text not null,
+    fqn text not null,
+    id text not null,
+    entity_fqn text not null,
+    name text,
+    version real,
+    fetched_at real not null,
+    primary key (entity_type, fqn)
+)
+"""
+
+CREATE_ENTITIES_ID_INDEX = """
+create index if not exists entities_id_idx on entities (id)
+"""
+
+CREATE_MISSING_TABLE = """
+create table if not exists missing_entities (
+    entity_type text not null,
+    fqn text not null,
+    checked_at real not null,
+    primary key (entity_type, fqn)
+)
+"""
+
+
+class SqliteEntityStore:
+    """Persistent cross-run store of OMD entity IDs and known-missing FQNs keyed by (entity_type, fqn)."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = 7 * 24 * 3600,
+        negative_ttl_seconds: float = 24 * 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._init_schema()
+
+    @classmethod
+    def from_config(cls, config: CacheConfig) -> Optional['SqliteEntityStore']:
+        """Opens the store configured in CacheConfig, or returns None if it is disabled."""
+        if not config.store_path:
+            return None
+        return cls(
+            config.store_path,
+            ttl_seconds=config.store_ttl_seconds,
+            negative_ttl_seconds=config.negative_ttl_seconds,
+        )
+
+    def _init_schema(self) -> None:
+        with self._lock, self._conn:
+            user_version = self._conn.execute('pragma user_version').fetchone()[0]
+            if user_version != SCHEMA_VERSION:
+                logger.info('Entity store %s has schema v%s, recreating as v%s', self.path, user_version, SCHEMA_VERSION)
+                self._conn.execute('drop table if exists entities')
+                self._conn.execute('drop table if exists missing_entities')
+                self._conn.execute(f'pragma user_version = {SCHEMA_VERSION}')
+            self._conn.execute(CREATE_ENTITIES_TABLE)
+            self._conn.execute(CREATE_ENTITIES_ID_INDEX)
+            self._conn.execute(CREATE_MISSING_TABLE)
+
+    def get(self, entity_type: EntityType, fqn: str) -> Optional[OMDResponseEntity]:
+        """Returns the stored entity if it is still fresh."""
+        with self._lock:
+            row = self._conn.execute(
+                'select id, entity_fqn, name, version from entities '
+                'where entity_type = ? and fqn = ? and fetched_at >= ?',
+                (entity_type.value, fqn, self._fresh_after()),
+            ).fetchone()
+        if row is None:
+            return None
+
+        entity_id, stored_fqn, name, version = row
+        return OMDResponseEntity(
+            id=entity_id,
+            type=entity_type.value,
+            fully_qualified_name=stored_fqn,
+            name=name,
+            version=version,
+        )
+
+    def get_fqn_by_id(self, entity_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                'select entity_fqn from entities where id = ? and fetched_at >= ?',
+                (entity_id, self._fresh_after()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, entity_type: EntityType, fqn: str, entity: OMDResponseEntity) -> None:
+        self.put_many(entity_type, [(fqn, entity)])
+
+    def put_many(self, entity_type: EntityType, entities: Iterable[tuple[str, OMDResponseEntity]]) -> None:
+        """Upserts entities under both the requested and the canonical FQN."""
+        now = self._clock()
+        rows = [
+            (entity_type.value, key_fqn, entity.id, entity.fully_qualified_name or fqn,
+             entity.name, entity.version, now)
+            for fqn, entity in entities
+            if entity.id
+            for key_fqn in {fqn, entity.fully_qualified_name or fqn}
+        ]
+        if not rows:
+            return
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'insert into entities (entity_type, fqn, id, entity_fqn, name, version, fetched_at) '
+                'values (?, ?, ?, ?, ?, ?, ?) '
+                'on conflict (entity_type, fqn) do update set '
+                'id = excluded.id, entity_fqn = excluded.entity_fqn, name = excluded.name, '
+                'version = excluded.version, fetched_at = excluded.fetched_at',
+                rows,
+            )
+            self._conn.executemany(
+                'delete from missing_entities where entity_type = ? and fqn = ?',
+                [(row[0], row[1]) for row in rows],
+            )
+
+    def is_missing(self, entity_type: EntityType, fqn: str) -> bool:
+        """Returns True if the FQN was recently confirmed missing in OMD."""
+        with self._lock:
+            row = self._conn.execute(
+                'select 1 from missing_entities where entity_type = ? and fqn = ? and checked_at >= ?',
+                (entity_type.value, fqn, self._clock() - self.negative_ttl_seconds),
+            ).fetchone()
+        return row is not None
+
+    def put_missing(self, entity_type: EntityType, fqns: Iterable[str]) -> None:
+        now = self._clock()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'insert into missing_entities (entity_type, fqn, checked_at) values (?, ?, ?) '
+                'on conflict (entity_type, fqn) do update set checked_at = excluded.checked_at',
+                [(entity_type.value, fqn, now) for fqn in fqns],
+            )
+
+    def invalidate(self, entity_type: EntityType, fqn: str) -> None:
+        """Drops the entity stored under the FQN together with its aliases sharing the same ID."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'delete from entities where id in '
+                '(select id from entities where entity_type = ? and fqn = ?)',
+                (entity_type.value, fqn),
+            )
+            self._conn.execute(
+                'delete from missing_entities where entity_type = ? and fqn = ?',
+                (entity_type.value, fqn),
+            )
+
+    def _fresh_after(self) -> float:
+        return self._clock() - self.ttl_seconds
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> 'SqliteEntityStore':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
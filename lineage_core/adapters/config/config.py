@@ -1,22 +1,38 @@
+from typing import Optional
 
 from pydantic import (
     BaseModel,
     Field,
 )
 
-from omd_airflow_utils.lineage_core.domain.types import MappingType
+from omd_airflow_utils.lineage_core.domain.types import (
+    GraphEngine,
+    MappingType,
+)
 
 
 class RetryConfig(BaseModel):
     total: int = 3
     backoff_factor: float = 3.0
-    status_codes: list[int] = [500, 502, 503, 504]
+    status_codes: list[int] = [429, 500, 502, 503, 504]
+
+
+class RateLimitConfig(BaseModel):
+    calls_per_second: float = Field(default=10.0, gt=0)
+    burst: int = Field(default=20, ge=1)
+    adaptive: bool = True
+    min_calls_per_second: float = Field(default=1.0, gt=0)
+    max_calls_per_second: float = Field(default=50.0, gt=0)
+    increase_step: float = 0.1
+    decrease_factor: float = Field(default=0.5, gt=0, le=1)
 
 
 class HttpxClientConfig(BaseModel):
     retry: RetryConfig = Field(default_factory=RetryConfig)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
     timeout: float = 10.0
     verify_ssl: bool = True
+    max_in_flight: int = Field(default=8, ge=1)
 
 
 class APIPathsConfig(BaseModel):
@@ -33,10 +49,40 @@ class APIConfig(BaseModel):
     paths: APIPathsConfig = Field(default_factory=APIPathsConfig)
 
 
+class CacheConfig(BaseModel):
+    resolver_max_size: int = Field(default=50_000, ge=1)
+    resolver_ttl_seconds: Optional[float] = 3600.0
+    store_path: Optional[str] = None
+    store_ttl_seconds: float = Field(default=7 * 24 * 3600, gt=0)
+    negative_ttl_seconds: float = Field(default=24 * 3600, gt=0)
+
+
+class SearchConfig(BaseModel):
+    batch_size: int = Field(default=100, ge=1)
+    verify_missing: bool = False
+
+
+class PrefetchConfig(BaseModel):
+    enabled: bool = False
+    page_size: int = Field(default=500, ge=1)
+    fields: list[str] = Field(default_factory=list)
+
+
+class DescriptionSyncConfig(BaseModel):
+    batch_size: int = Field(default=1000, ge=1)
+    parallelism: int = Field(default=8, ge=1)
+
+
+class GraphConfig(BaseModel):
+    engine: GraphEngine = GraphEngine.SIMPLE
+    csr_min_edges: int = Field(default=1_000_000, ge=0)
+
+
 class OperatorDefaultsConfig(BaseModel):
     verify_ssl: bool = True
     fail_silently: bool = False
     mapping: MappingType = MappingType.ONE_TO_ONE
+    max_workers: int = Field(default=8, ge=1)
 
 
 class OperatorConfig(BaseModel):
@@ -48,5 +94,10 @@ class OperatorConfig(BaseModel):
 class LineageConfig(BaseModel):
     http_client: HttpxClientConfig = Field(default_factory=HttpxClientConfig)
     api: APIConfig = Field(default_factory=APIConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    search: SearchConfig = Field(default_factory=SearchConfig)
+    prefetch: PrefetchConfig = Field(default_factory=PrefetchConfig)
+    description_sync: DescriptionSyncConfig = Field(default_factory=DescriptionSyncConfig)
+    graph: GraphConfig = Field(default_factory=GraphConfig)
     operator: OperatorConfig = Field(default_factory=OperatorConfig)
 
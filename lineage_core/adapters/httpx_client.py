@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import (
     Any,
@@ -6,9 +7,13 @@ from typing import (
 
 import backoff
 from httpx import (
+    AsyncBaseTransport,
+    AsyncClient,
+    AsyncHTTPTransport,
     BaseTransport,
     Client,
     HTTPTransport,
+    Limits,
     Request,
     RequestError,
     Response,
@@ -17,6 +22,11 @@ from httpx import (
 from omd_airflow_utils.lineage_core.adapters.config.config import (
     HttpxClientConfig,
 )
+from omd_airflow_utils.lineage_core.utils.rate_limiter import (
+    AdaptiveTokenBucket,
+    RateLimiterRegistry,
+    parse_retry_after,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,11 +39,13 @@ class RetryTransportWrapper(BaseTransport):
         retry_total: int,
         retry_backoff: float,
         retry_status_codes: set[int],
+        rate_limiter: Optional[AdaptiveTokenBucket] = None,
     ) -> None:
         self._transport = transport
         self._retry_total = retry_total
         self._retry_backoff = retry_backoff
         self._retry_status_codes = retry_status_codes
+        self._rate_limiter = rate_limiter
 
     def handle_request(self, request: Request) -> Response:
         """Handles HTTP request with automatic retry logic."""
@@ -54,13 +66,76 @@ class RetryTransportWrapper(BaseTransport):
             logger=logger,
         )
         def _handle_request_with_retry() -> Response:
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
             response = self._transport.handle_request(request)
+            self._observe(response)
             if response.status_code in self._retry_status_codes:
                 logger.warning('HTTP request failed with status %s, retrying', response.status_code)
             return response
 
         return _handle_request_with_retry()
 
+    def _observe(self, response: Response) -> None:
+        if self._rate_limiter:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            self._rate_limiter.on_response(response.status_code, retry_after)
+
+
+class AsyncRetryTransportWrapper(AsyncBaseTransport):
+    """Async transport wrapper that adds retry functionality to HTTP requests."""
+
+    def __init__(
+        self,
+        transport: AsyncHTTPTransport,
+        retry_total: int,
+        retry_backoff: float,
+        retry_status_codes: set[int],
+        rate_limiter: Optional[AdaptiveTokenBucket] = None,
+    ) -> None:
+        self._transport = transport
+        self._retry_total = retry_total
+        self._retry_backoff = retry_backoff
+        self._retry_status_codes = retry_status_codes
+        self._rate_limiter = rate_limiter
+
+    async def handle_async_request(self, request: Request) -> Response:
+        """Handles HTTP request with automatic retry logic."""
+        retry_exceptions = (RequestError,)
+
+        @backoff.on_exception(
+            backoff.expo,
+            retry_exceptions,
+            max_tries=self._retry_total,
+            factor=self._retry_backoff,
+            logger=logger,
+        )
+        @backoff.on_predicate(
+            backoff.expo,
+            predicate=lambda r: r.status_code in self._retry_status_codes,
+            max_tries=self._retry_total,
+            factor=self._retry_backoff,
+            logger=logger,
+        )
+        async def _handle_request_with_retry() -> Response:
+            if self._rate_limiter:
+                await self._rate_limiter.acquire_async()
+            response = await self._transport.handle_async_request(request)
+            self._observe(response)
+            if response.status_code in self._retry_status_codes:
+                logger.warning('HTTP request failed with status %s, retrying', response.status_code)
+            return response
+
+        return await _handle_request_with_retry()
+
+    def _observe(self, response: Response) -> None:
+        if self._rate_limiter:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            self._rate_limiter.on_response(response.status_code, retry_after)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
 
 class HttpxClient:
     """HTTP client with retry and timeout capabilities."""
@@ -76,6 +151,7 @@ class HttpxClient:
             retry_total=config.retry.total,
             retry_backoff=config.retry.backoff_factor,
             retry_status_codes=set(config.retry.status_codes),
+            rate_limiter=RateLimiterRegistry.get(base_url or '', **config.rate_limit.model_dump()),
         )
 
         self.client = Client(
@@ -127,4 +203,81 @@ class HttpxClient:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        self.close()
\ No newline at end of file
+        self.close()
+
+
+class AsyncHttpxClient:
+    """Async HTTP client with retry, timeout and a bounded number of in-flight requests."""
+
+    def __init__(
+        self,
+        config: HttpxClientConfig = HttpxClientConfig(),
+        base_url: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> None:
+        transport = AsyncRetryTransportWrapper(
+            transport=AsyncHTTPTransport(
+                verify=config.verify_ssl,
+                limits=Limits(max_connections=config.max_in_flight),
+            ),
+            retry_total=config.retry.total,
+            retry_backoff=config.retry.backoff_factor,
+            retry_status_codes=set(config.retry.status_codes),
+            rate_limiter=RateLimiterRegistry.get(base_url or '', **config.rate_limit.model_dump()),
+        )
+
+        self.client = AsyncClient(
+            transport=transport,
+            timeout=config.timeout,
+            headers=headers or {},
+            base_url=base_url or '',
+        )
+        self._semaphore = asyncio.Semaphore(config.max_in_flight)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        async with self._semaphore:
+            return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, headers: Optional[dict[str, str]] = None) -> Response:
+        return await self.request('GET', url, headers=headers)
+
+    async def put(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        json: Optional[dict[str, Any]] = None,
+    ) -> Response:
+        return await self.request('PUT', url, headers=headers, json=json)
+
+    async def post(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        json: Optional[dict[str, Any]] = None,
+    ) -> Response:
+        return await self.request('POST', url, headers=headers, json=json)
+
+    async def patch(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        json: Optional[dict[str, Any]] = None,
+        content: Optional[str] = None,
+    ) -> Response:
+        return await self.request('PATCH', url, headers=headers, json=json, content=content)
+
+    async def delete(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+    ) -> Response:
+        return await self.request('DELETE', url, headers=headers)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> 'AsyncHttpxClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
@@ -1,10 +1,13 @@
 import logging
+import uuid
 from datetime import (
     datetime,
     timedelta,
 )
 from typing import (
     Any,
+    Iterable,
+    Iterator,
     Optional,
     Sequence,
 )
@@ -15,9 +18,11 @@ from psycopg2.extensions import connection
 
 from omd_airflow_utils.lineage_core.adapters.sql.fetch_description import (
     FETCH_COLUMNS_DESCRIPTIONS,
+    FETCH_DESCRIPTIONS,
     FETCH_TABLE_DESCRIPTION,
 )
 from omd_airflow_utils.lineage_core.adapters.sql.fetch_edges import FETCH_EDGES
+from omd_airflow_utils.lineage_core.adapters.sql.fetch_graph import FETCH_GRAPH
 from omd_airflow_utils.lineage_core.adapters.sql.fetch_nodes import FETCH_NODES
 from omd_airflow_utils.lineage_core.adapters.sql.fetch_nodes_additional import (
     FETCH_NODES_ADDITIONAL,
@@ -26,61 +31,125 @@ from omd_airflow_utils.lineage_core.adapters.sql.fetch_nodes_incremental import
     FETCH_NODES_INCREMENTAL,
 )
 from omd_airflow_utils.lineage_core.domain.models import (
+    EdgeArray,
+    EdgePair,
     EntityRef,
     EntityType,
     LineageEdge,
     Node,
+    NodeDescriptions,
+    NodeRecord,
 )
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_ITERSIZE = 2000
+
+NODE_COLUMNS = ('id', 'name', 'namespace_id', 'db_schema', 'updated')
+
 
 class NodeRepository:
     """Repository for database operations on nodes and edges."""
 
-    def __init__(self, conn: connection):
+    def __init__(self, conn: connection, itersize: int = DEFAULT_ITERSIZE):
         self.conn = conn
-
-    def _rows_to_nodes(self, rows: Sequence[Any]) -> list[Node]:
-        """Converts database rows to Node objects with error handling."""
-        nodes = []
+        self.itersize = itersize
+
+    def _stream_rows(self, query: str, params: dict[str, Any], name: str) -> Iterator[tuple]:
+        """Streams tuple rows through a named server-side cursor, fetching `itersize` rows per round trip."""
+        cursor_name = f'omd_{name}_{uuid.uuid4().hex[:8]}'
+        with self.conn.cursor(name=cursor_name) as cur:
+            cur.itersize = self.itersize
+            cur.execute(query, params)
+            while rows := cur.fetchmany(self.itersize):
+                yield from rows
+
+    @staticmethod
+    def _record_from_row(row: Sequence[Any]) -> NodeRecord:
+        """Builds a NodeRecord from a tuple row, validating with pydantic only if the row has unexpected types."""
+        node_id, name, namespace_id, db_schema, updated = row
+        if (
+            type(node_id) is int
+            and type(namespace_id) is int
+            and type(name) is str
+            and type(db_schema) is str
+            and (updated is None or isinstance(updated, datetime))
+        ):
+            return NodeRecord.create(node_id, name, namespace_id, db_schema, updated)
+        return NodeRecord.of(Node(**dict(zip(NODE_COLUMNS, row))))
+
+    def _iter_rows_to_nodes(self, rows: Iterable[Sequence[Any]]) -> Iterator[NodeRecord]:
+        """Converts streamed rows to NodeRecords, skipping and counting invalid ones."""
         failed_count = 0
-
+        total = 0
         for row in rows:
+            total += 1
             try:
-                row_dict = dict(row)
-                nodes.append(Node(**row_dict))
+                yield self._record_from_row(row)
             except Exception as e:
                 failed_count += 1
-                row_id = row.get('id', 'unknown') if hasattr(row, 'get') else 'unknown'
-                logger.warning('Failed to create Node from row id=%s: %s', row_id, e)
+                logger.warning('Failed to create Node from row id=%s: %s', row[0] if row else 'unknown', e)
 
         if failed_count > 0:
-            logger.warning('Failed to parse %d out of %d node records', failed_count, len(rows))
+            logger.warning('Failed to parse %d out of %d node records', failed_count, total)
 
-        return nodes
+    @staticmethod
+    def _iter_rows_to_edge_pairs(rows: Iterable[Sequence[Any]]) -> Iterator[EdgePair]:
+        """Converts streamed rows to (from_node_id, to_node_id) pairs, skipping invalid ones."""
+        for row in rows:
+            from_id, to_id = row
+            if type(from_id) is int and type(to_id) is int:
+                yield from_id, to_id
+                continue
+            try:
+                yield int(from_id), int(to_id)
+            except (TypeError, ValueError) as e:
+                logger.warning('Failed to create edge from row %s: %s', row, e)
 
-    def _rows_to_edges(self, rows: Sequence[Any]) -> list[LineageEdge]:
-        """Converts database rows to LineageEdge objects with error handling."""
-        edges = []
+    def _rows_to_nodes(self, rows: Sequence[Any]) -> list[NodeRecord]:
+        """Converts database rows to NodeRecords with error handling."""
+        nodes = []
         failed_count = 0
 
         for row in rows:
             try:
-                row_dict = dict(row) if hasattr(row, 'keys') else row
-                from_id = str(row_dict['from_node_id'])
-                to_id = str(row_dict['to_node_id'])
-                from_entity = EntityRef(id=from_id, type=EntityType.TABLE)
-                to_entity = EntityRef(id=to_id, type=EntityType.TABLE)
-                edges.append(LineageEdge(from_entity=from_entity, to_entity=to_entity))
+                row_dict = dict(row)
+                nodes.append(NodeRecord.of(Node(**row_dict)))
             except Exception as e:
                 failed_count += 1
-                logger.warning('Failed to create LineageEdge from row: %s', e)
+                row_id = row.get('id', 'unknown') if hasattr(row, 'get') else 'unknown'
+                logger.warning('Failed to create Node from row id=%s: %s', row_id, e)
 
         if failed_count > 0:
-            logger.warning('Failed to parse %d out of %d edge records', failed_count, len(rows))
+            logger.warning('Failed to parse %d out of %d node records', failed_count, len(rows))
+
+        return nodes
+
+    def iter_nodes(
+        self,
+        tag_id: int,
+        schemas: list[str],
+        state: str,
+        operator_id: int,
+        last_executed: Optional[datetime] = None,
+        safety_window_hours: int = 48,
+    ) -> Iterator[NodeRecord]:
+        """Streams nodes based on filtering criteria with optional incremental support."""
+        query = FETCH_NODES.format(extra_filter=self._updated_since_filter(last_executed))
+        params = {
+            'tag_id': tag_id,
+            'schemas': schemas,
+            'state': state,
+            'operator_id': operator_id,
+            'last_executed': last_executed,
+            'safety_window_hours': safety_window_hours,
+        }
 
-        return edges
+        try:
+            yield from self._iter_rows_to_nodes(self._stream_rows(query, params, 'nodes'))
+        except Exception as e:
+            logger.error('Error fetching nodes: %s', e)
+            raise
 
     def fetch_nodes(
         self,
@@ -90,53 +159,102 @@ class NodeRepository:
         operator_id: int,
         last_executed: Optional[datetime] = None,
         safety_window_hours: int = 48,
-    ) -> list[Node]:
+    ) -> list[NodeRecord]:
         """Fetches nodes based on filtering criteria with optional incremental support."""
-        if last_executed:
-            extra_filter = """
-            and (n.updated > (%(last_executed)s - interval '%(safety_window_hours)s hours')
-            or (n.updated is null and n.created > (%(last_executed)s - interval '%(safety_window_hours)s hours')))
-            """
-        else:
-            extra_filter = ''
-
-        query = FETCH_NODES.format(extra_filter=extra_filter)
+        return list(self.iter_nodes(
+            tag_id=tag_id,
+            schemas=schemas,
+            state=state,
+            operator_id=operator_id,
+            last_executed=last_executed,
+            safety_window_hours=safety_window_hours,
+        ))
+
+    def fetch_graph(
+        self,
+        tag_id: int,
+        schemas: list[str],
+        state: str,
+        operator_id: int,
+        last_executed: Optional[datetime] = None,
+        safety_window_hours: int = 48,
+    ) -> tuple[list[NodeRecord], EdgeArray, set[int]]:
+        """
+        Fetches selected nodes, their edges and boundary nodes of those edges in one query.
+        Also returns the IDs of boundary nodes, whose own edges are not loaded.
+        """
+        query = FETCH_GRAPH.format(extra_filter=self._updated_since_filter(last_executed))
         params = {
             'tag_id': tag_id,
             'schemas': schemas,
             'state': state,
             'operator_id': operator_id,
+            'last_executed': last_executed,
             'safety_window_hours': safety_window_hours,
         }
 
+        node_rows = []
+        boundary_rows = []
+
+        def edge_rows() -> Iterator[Sequence[Any]]:
+            for row in self._stream_rows(query, params, 'graph'):
+                if row[0] == 'edge':
+                    yield row[6:8]
+                elif row[0] == 'boundary':
+                    boundary_rows.append(row[1:6])
+                else:
+                    node_rows.append(row[1:6])
+
         try:
-            with self.conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
-                cur.execute(query, params)
-                rows = cur.fetchall()
+            edges = EdgeArray(self._iter_rows_to_edge_pairs(edge_rows()))
         except Exception as e:
-            logger.error('Error fetching nodes: %s', e)
+            logger.error('Error fetching graph: %s', e)
             raise
 
-        return self._rows_to_nodes(rows)
+        boundary = list(self._iter_rows_to_nodes(boundary_rows))
+        return list(self._iter_rows_to_nodes(node_rows)) + boundary, edges, {n.id for n in boundary}
 
-    def fetch_edges(self, node_ids: list[int]) -> list[LineageEdge]:
-        """Fetches lineage edges for given node IDs."""
+    @staticmethod
+    def _updated_since_filter(last_executed: Optional[datetime]) -> str:
+        if not last_executed:
+            return ''
+        return """
+            and (n.updated > (%(last_executed)s - interval '%(safety_window_hours)s hours')
+            or (n.updated is null and n.created > (%(last_executed)s - interval '%(safety_window_hours)s hours')))
+            """
+
+    def iter_edge_pairs(self, node_ids: list[int]) -> Iterator[EdgePair]:
+        """Streams lineage edges for given node IDs as (from_node_id, to_node_id) pairs."""
         try:
-            with self.conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
-                cur.execute(FETCH_EDGES, {'node_ids': node_ids})
-                rows = cur.fetchall()
+            yield from self._iter_rows_to_edge_pairs(
+                self._stream_rows(FETCH_EDGES, {'node_ids': node_ids}, 'edges')
+            )
         except Exception as e:
             logger.error('Error fetching edges: %s', e)
             raise
 
-        return self._rows_to_edges(rows)
+    def fetch_edge_pairs(self, node_ids: list[int]) -> EdgeArray:
+        """Fetches lineage edges for given node IDs as (from_node_id, to_node_id) pairs."""
+        return EdgeArray(self.iter_edge_pairs(node_ids))
+
+    def iter_edges(self, node_ids: list[int]) -> Iterator[LineageEdge]:
+        """Streams lineage edges for given node IDs."""
+        for from_id, to_id in self.iter_edge_pairs(node_ids):
+            yield LineageEdge(
+                from_entity=EntityRef(id=str(from_id), type=EntityType.TABLE),
+                to_entity=EntityRef(id=str(to_id), type=EntityType.TABLE),
+            )
+
+    def fetch_edges(self, node_ids: list[int]) -> list[LineageEdge]:
+        """Fetches lineage edges for given node IDs."""
+        return list(self.iter_edges(node_ids))
 
     def fetch_nodes_additional_for_edges(
         self,
         operator_id: int,
         node_ids: list[int],
         state: str = 'accepted',
-    ) -> list[Node]:
+    ) -> list[NodeRecord]:
         """Fetches additional nodes needed for edge relationships."""
         if not node_ids:
             return []
@@ -148,15 +266,11 @@ class NodeRepository:
         }
 
         try:
-            with self.conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
-                cur.execute(FETCH_NODES_ADDITIONAL, params)
-                rows = cur.fetchall()
+            return list(self._iter_rows_to_nodes(self._stream_rows(FETCH_NODES_ADDITIONAL, params, 'nodes_additional')))
         except Exception as e:
             logger.error('Error fetching additional nodes: %s', e)
             raise
 
-        return self._rows_to_nodes(rows)
-
     def fetch_nodes_for_incremental(
         self,
         tag_id: int,
@@ -164,7 +278,7 @@ class NodeRepository:
         operator_id: int,
         last_executed: Optional[datetime],
         safety_window_hours: int = 48,
-    ) -> tuple[list[Node], list[Node]]:
+    ) -> tuple[list[NodeRecord], list[NodeRecord]]:
         """Fetches nodes for incremental processing, returning active and inactive separately."""
         params = {
             'tag_id': tag_id,
@@ -217,4 +331,26 @@ class NodeRepository:
                     descriptions[row['column_name']] = row['description']
         except Exception as e:
             logger.error('Error fetching column descriptions for node_id %s: %s', node_id, e)
-        return descriptions
\ No newline at end of file
+        return descriptions
+
+    def fetch_descriptions(self, node_ids: list[int]) -> dict[int, NodeDescriptions]:
+        """Fetches table and column descriptions for many nodes in one query, grouped by node."""
+        descriptions = {node_id: NodeDescriptions(node_id=node_id) for node_id in node_ids}
+        if not node_ids:
+            return descriptions
+
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(FETCH_DESCRIPTIONS, {'node_ids': node_ids})
+                rows = cur.fetchall()
+        except Exception as e:
+            logger.error('Error fetching descriptions for %d nodes: %s', len(node_ids), e)
+            raise
+
+        for node_id, column_name, description in rows:
+            node_descriptions = descriptions[node_id]
+            if column_name is None:
+                node_descriptions.description = description
+            else:
+                node_descriptions.columns[column_name] = description
+        return descriptions
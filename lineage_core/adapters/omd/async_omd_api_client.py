@@ -0,0 +1,350 @@
+import asyncio
+import json
+import logging
+from http import HTTPStatus
+from typing import (
+    Optional,
+    Set,
+    Tuple,
+)
+
+import backoff
+from airflow.exceptions import AirflowException
+
+from omd_airflow_utils.lineage_core.adapters.cache.entity_store import (
+    SqliteEntityStore,
+)
+from omd_airflow_utils.lineage_core.adapters.config.config import LineageConfig
+from omd_airflow_utils.lineage_core.adapters.httpx_client import AsyncHttpxClient
+from omd_airflow_utils.lineage_core.adapters.omd.exceptions import (
+    EntityNotFoundError,
+)
+from omd_airflow_utils.lineage_core.adapters.omd.http.lineage_url_builder import (
+    LineageUrlBuilder,
+)
+from omd_airflow_utils.lineage_core.adapters.omd.omd_response_models import (
+    EntityLookupResult,
+    OMDResponseEntity,
+)
+from omd_airflow_utils.lineage_core.adapters.omd.omd_response_parser import (
+    LineageResponseParser,
+)
+from omd_airflow_utils.lineage_core.adapters.omd.resolvers.entity_resolver import (
+    AsyncEntityResolver,
+)
+from omd_airflow_utils.lineage_core.domain.models import (
+    EntityRef,
+    LineageEdge,
+    LineagePayload,
+)
+from omd_airflow_utils.lineage_core.domain.registry import (
+    EntityRegistryPathResolver,
+)
+from omd_airflow_utils.lineage_core.domain.types import EntityType
+from omd_airflow_utils.lineage_core.utils.iter_utils import chunked
+from omd_airflow_utils.lineage_core.utils.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLineageAPIClient:
+    """Async counterpart of LineageAPIClient with a bounded number of in-flight requests."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_token: str,
+        config: Optional[LineageConfig] = None,
+        entity_store: Optional[SqliteEntityStore] = None,
+    ) -> None:
+        self.base_url = base_url.rstrip('/')
+        self.config = config or LineageConfig()
+        self.api_version = self.config.api.version
+
+        self._httpx = AsyncHttpxClient(
+            config=self.config.http_client,
+            base_url=self.base_url,
+            headers={
+                'Authorization': f'Bearer {api_token}',
+                'Content-Type': self.config.api.headers.content_type,
+            }
+        )
+
+        self._url_builder = LineageUrlBuilder(
+            self.api_version,
+            path_resolver=EntityRegistryPathResolver(),
+        )
+
+        self._resolver = AsyncEntityResolver(
+            http=self._httpx,
+            url_builder=self._url_builder,
+            cache=LRUCache(
+                max_size=self.config.cache.resolver_max_size,
+                ttl_seconds=self.config.cache.resolver_ttl_seconds,
+            ),
+            store=entity_store,
+        )
+
+        self._parser = LineageResponseParser()
+
+    @property
+    def resolver(self) -> AsyncEntityResolver:
+        return self._resolver
+
+    async def get_entity(
+            self,
+            entity_type: EntityType,
+            fqn: str,
+            fields: Optional[list[str]] = None,
+    ) -> OMDResponseEntity:
+        """Fetches an entity by FQN; only the requested extra fields (e.g. columns) are included."""
+        url = self._url_builder.by_fqn(entity_type, fqn, fields=fields)
+
+        response = await self._httpx.get(url)
+
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            raise EntityNotFoundError(f'{entity_type.value.capitalize()} with FQN {fqn} not found')
+
+        response.raise_for_status()
+
+        entity = OMDResponseEntity(**response.json())
+        self._resolver.remember(entity.id, entity.fully_qualified_name)
+        return entity
+
+    async def get_entity_by_id(self, entity_type: EntityType, entity_id: str) -> OMDResponseEntity:
+        url = self._url_builder.by_id(entity_type, entity_id)
+        response = await self._httpx.get(url)
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            raise EntityNotFoundError(f'{entity_type.value.capitalize()} with ID {entity_id} not found')
+        response.raise_for_status()
+        entity = OMDResponseEntity(**response.json())
+        self._resolver.remember(entity.id, entity.fully_qualified_name)
+        return entity
+
+    async def find_entities_by_fqns(self, entity_type: EntityType, fqns: list[str]) -> EntityLookupResult:
+        """Looks up many FQNs per request through the search endpoint, batched concurrently."""
+        batches = list(chunked(dict.fromkeys(fqns), self.config.search.batch_size))
+        lookups = await asyncio.gather(*(self._search_fqns(entity_type, batch) for batch in batches))
+
+        result = EntityLookupResult()
+        for lookup in lookups:
+            result.merge(lookup)
+        self._resolver.remember_entities(result.found.values())
+        return result
+
+    async def _search_fqns(self, entity_type: EntityType, fqns: list[str]) -> EntityLookupResult:
+        url = self._url_builder.search_query(
+            entity_type,
+            self._parser.fqn_terms_filter(fqns),
+            size=len(fqns),
+            source_fields=self._parser.SEARCH_SOURCE_FIELDS,
+        )
+        response = await self._httpx.get(url)
+        response.raise_for_status()
+        return self._parser.parse_fqn_lookup(response.json(), fqns)
+
+    async def list_schema_entities(
+            self,
+            entity_type: EntityType,
+            schema_fqn: str,
+            fields: Optional[list[str]] = None,
+    ) -> list[OMDResponseEntity]:
+        """Lists all entities of a database schema, following the paging cursor."""
+        entities: list[OMDResponseEntity] = []
+        after = None
+        while True:
+            url = self._url_builder.list_by_schema(
+                entity_type, schema_fqn, limit=self.config.prefetch.page_size, after=after, fields=fields,
+            )
+            response = await self._httpx.get(url)
+            response.raise_for_status()
+            page, after = self._parser.parse_entity_page(response.json())
+            entities.extend(page)
+            if not after:
+                break
+
+        self._resolver.remember_entities(entities)
+        return entities
+
+    async def get_edges_for_scope(
+            self,
+            fqns: Set[str],
+            schema_filter: Optional[Set[str]] = None
+    ) -> Set[Tuple[str, str]]:
+        """Fetches lineage edges concurrently and optionally filters by schema."""
+        lineages = await asyncio.gather(*(self._fetch_lineage(fqn) for fqn in fqns))
+
+        edge_ids: Set[Tuple[str, str]] = set()
+        id_to_fqn: dict[str, str | Exception] = {}
+        for raw_edges, payload_fqns in lineages:
+            edge_ids.update((from_id, to_id) for _, from_id, to_id in raw_edges)
+            id_to_fqn.update(payload_fqns)
+            for entity_id, entity_fqn in payload_fqns.items():
+                self._resolver.remember(entity_id, entity_fqn)
+
+        unresolved = list({entity_id for edge in edge_ids for entity_id in edge} - id_to_fqn.keys())
+        resolved = await asyncio.gather(
+            *(self._resolver.resolve_fqn_by_id(entity_id) for entity_id in unresolved),
+            return_exceptions=True,
+        )
+        id_to_fqn.update(zip(unresolved, resolved))
+
+        edges: Set[Tuple[str, str]] = set()
+        for from_id, to_id in edge_ids:
+            from_fqn = id_to_fqn[from_id]
+            to_fqn = id_to_fqn[to_id]
+            if isinstance(from_fqn, Exception) or isinstance(to_fqn, Exception):
+                error = from_fqn if isinstance(from_fqn, Exception) else to_fqn
+                logger.warning('Failed to resolve edge %s -> %s: %s', from_id, to_id, error)
+                continue
+
+            if schema_filter:
+                from_schema = from_fqn.split('.')[-2]
+                to_schema = to_fqn.split('.')[-2]
+                if from_schema not in schema_filter or to_schema not in schema_filter:
+                    continue
+
+            edges.add((from_fqn, to_fqn))
+        self._resolver.log_stats()
+        return edges
+
+    async def _fetch_lineage(self, fqn: str) -> tuple[list[tuple[str, str, str]], dict[str, str]]:
+        """Fetches direct upstream and downstream edges in one call, with IDs mapped from the payload."""
+        url = self._url_builder.lineage_table_by_fqn(fqn, upstream_depth=1, downstream_depth=1)
+        try:
+            response = await self._httpx.get(url)
+            if response.status_code == HTTPStatus.NOT_FOUND:
+                return [], {}
+            response.raise_for_status()
+            return self._parser.parse_lineage_graph(response.json(), fqn)
+        except Exception as e:
+            logger.warning('Failed to fetch lineage edges for %s: %s', fqn, e)
+            return [], {}
+
+    @backoff.on_exception(
+        backoff.expo,
+        AirflowException,
+        max_tries=3,
+        jitter=backoff.full_jitter,
+    )
+    async def add_lineage(
+        self,
+        from_entity: EntityRef,
+        to_entity: EntityRef,
+        from_fqn: str,
+        to_fqn: str,
+    ) -> None:
+        payload = LineagePayload(
+            edge=LineageEdge(from_entity=from_entity, to_entity=to_entity)
+        ).model_dump(by_alias=True)
+
+        url = self._url_builder.lineage_add_path()
+        try:
+            response = await self._httpx.put(
+                url=url,
+                json=payload
+            )
+            if response.status_code == HTTPStatus.NOT_FOUND:
+                self._resolver.forget(from_entity.id, from_entity.type, from_fqn)
+                self._resolver.forget(to_entity.id, to_entity.type, to_fqn)
+            response.raise_for_status()
+        except Exception as e:
+            logger.error('Failed to add lineage %s -> %s: %s', from_fqn, to_fqn, e)
+            raise
+
+    async def delete_lineage(self, from_entity: EntityRef, to_entity: EntityRef) -> None:
+        payload = LineagePayload(
+            edge=LineageEdge(from_entity=from_entity, to_entity=to_entity)
+        ).model_dump(by_alias=True)
+
+        url = self._url_builder.lineage_add_path()
+        response = await self._httpx.request('DELETE', url, json=payload)
+        response.raise_for_status()
+
+    async def delete_lineage_by_fqn(self, from_fqn: str, to_fqn: str) -> None:
+        url = self._url_builder.lineage_delete_path(from_fqn, to_fqn)
+        response = await self._httpx.delete(url)
+        if response.status_code not in {HTTPStatus.OK, HTTPStatus.NO_CONTENT}:
+            logger.error('Failed to delete lineage by FQN: %s -> %s. Status: %s, Body: %s',
+                         from_fqn, to_fqn, response.status_code, response.text)
+            response.raise_for_status()
+
+    async def patch_entity(self, entity_type: EntityType, fqn: str, operations: list[dict]) -> None:
+        """Applies a JSON Patch document to an entity in a single request."""
+        url = self._url_builder.by_fqn(entity_type, fqn)
+
+        patch_headers = {'Content-Type': 'application/json-patch+json'}
+
+        response = await self._httpx.patch(
+            url=url,
+            content=json.dumps(operations),
+            headers=patch_headers
+        )
+
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            logger.warning('%s %s not found in OMD. Cannot apply patch.', entity_type.value.capitalize(), fqn)
+            return
+
+        response.raise_for_status()
+        logger.info('Applied %d patch operations to %s', len(operations), fqn)
+
+    async def patch_table_description(self, fqn: str, description: str) -> None:
+        """Updates the description of a table entity in OMD."""
+        url = self._url_builder.by_fqn(EntityType.TABLE, fqn)
+
+        payload_list = [
+            {'op': 'add', 'path': '/description', 'value': description}
+        ]
+
+        patch_headers = {'Content-Type': 'application/json-patch+json'}
+
+        response = await self._httpx.patch(
+            url=url,
+            content=json.dumps(payload_list),
+            headers=patch_headers
+        )
+
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            logger.warning('Table %s not found in OMD. Cannot update description.', fqn)
+            return
+
+        response.raise_for_status()
+        logger.info('Successfully updated description for table %s', fqn)
+
+    async def patch_column_description_by_index(self, table_fqn: str, column_index: int, description: str) -> None:
+        """Updates the description of a specific column using its array index."""
+        url = self._url_builder.by_fqn(EntityType.TABLE, table_fqn)
+
+        payload_list = [
+            {
+                'op': 'add',
+                'path': f'/columns/{column_index}/description',
+                'value': description
+            }
+        ]
+
+        patch_headers = {'Content-Type': 'application/json-patch+json'}
+
+        response = await self._httpx.patch(
+            url=url,
+            content=json.dumps(payload_list),
+            headers=patch_headers
+        )
+
+        if response.status_code != 200:
+            logger.error(
+                'Failed to patch column at index %d for table %s. Status: %s. Response: %s',
+                column_index, table_fqn, response.status_code, response.text
+            )
+
+        response.raise_for_status()
+        logger.info('Successfully updated description for column at index %d in table %s', column_index, table_fqn)
+
+    async def aclose(self) -> None:
+        await self._httpx.aclose()
+
+    async def __aenter__(self) -> 'AsyncLineageAPIClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
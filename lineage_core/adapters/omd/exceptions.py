@@ -0,0 +1,5 @@
+from airflow.exceptions import AirflowException
+
+
+class EntityNotFoundError(AirflowException):
+    """Raised when OMD responds 404 for a requested entity."""
@@ -1,5 +1,9 @@
+import json
 import urllib.parse
-from typing import Optional
+from typing import (
+    Any,
+    Optional,
+)
 
 from omd_airflow_utils.lineage_core.domain.interfaces import (
     IEntityPathResolver,
@@ -40,6 +44,41 @@ class LineageUrlBuilder:
         entity_path = self.path_resolver.get_path(entity_type)
         return '/api/{}/{}/{}'.format(self.api_version, entity_path, entity_id)
 
+    def list_by_schema(
+        self,
+        entity_type: EntityType,
+        schema_fqn: str,
+        limit: int,
+        after: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> str:
+        """Build URL for one page of entities listed by database schema"""
+        entity_path = self.path_resolver.get_path(entity_type)
+        params = [('databaseSchema', schema_fqn), ('limit', limit)]
+        if fields:
+            params.append(('fields', ','.join(fields)))
+        if after:
+            params.append(('after', after))
+        return '/api/{}/{}?{}'.format(self.api_version, entity_path, urllib.parse.urlencode(params))
+
+    def search_query(
+        self,
+        entity_type: EntityType,
+        query_filter: dict[str, Any],
+        size: int,
+        source_fields: Optional[list[str]] = None,
+    ) -> str:
+        """Build URL for the search query endpoint over the entity type index"""
+        params = [
+            ('q', '*'),
+            ('index', f'{entity_type.value}_search_index'),
+            ('from', 0),
+            ('size', size),
+            ('query_filter', json.dumps(query_filter, separators=(',', ':'))),
+        ]
+        params.extend(('include_source_fields', field) for field in source_fields or [])
+        return '/api/{}/search/query?{}'.format(self.api_version, urllib.parse.urlencode(params))
+
     def lineage_table_by_fqn(self, fqn: str, upstream_depth: int, downstream_depth: int) -> str:
         """Build URL to fetch lineage for table by FQN"""
         fqn_encoded = urllib.parse.quote(fqn, safe='')
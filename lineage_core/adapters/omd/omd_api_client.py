@@ -4,17 +4,25 @@ from typing import (
     Optional, 
     Set, 
     Tuple, 
-    Any,
 )
 
 import backoff
 from airflow.exceptions import AirflowException
 
+from omd_airflow_utils.lineage_core.adapters.cache.entity_store import (
+    SqliteEntityStore,
+)
 from omd_airflow_utils.lineage_core.adapters.config.config import LineageConfig
 from omd_airflow_utils.lineage_core.adapters.httpx_client import HttpxClient
+from omd_airflow_utils.lineage_core.adapters.omd.exceptions import (
+    EntityNotFoundError,
+)
 from omd_airflow_utils.lineage_core.adapters.omd.http.lineage_url_builder import (
     LineageUrlBuilder,
 )
+from omd_airflow_utils.lineage_core.adapters.omd.omd_response_parser import (
+    LineageResponseParser,
+)
 from omd_airflow_utils.lineage_core.adapters.omd.resolvers.entity_resolver import (
     EntityResolver,
 )
@@ -27,8 +35,10 @@ from omd_airflow_utils.lineage_core.domain.registry import (
     EntityRegistryPathResolver,
 )
 from omd_airflow_utils.lineage_core.domain.types import EntityType
-from omd_airflow_utils.lineage_core.utils.decorators import rate_limit
+from omd_airflow_utils.lineage_core.utils.iter_utils import chunked
+from omd_airflow_utils.lineage_core.utils.lru_cache import LRUCache
 from omd_airflow_utils.lineage_core.adapters.omd.omd_response_models import (
+    EntityLookupResult,
     OMDResponseEntity,
 )
 
@@ -45,6 +55,7 @@ class LineageAPIClient:
         base_url: str,
         api_token: str,
         config: Optional[LineageConfig] = None,
+        entity_store: Optional[SqliteEntityStore] = None,
     ) -> None:
         self.base_url = base_url.rstrip('/')
         self.config = config or LineageConfig()
@@ -66,30 +77,89 @@ class LineageAPIClient:
 
         self._resolver = EntityResolver(
             http=self._httpx,
-            url_builder=self._url_builder
+            url_builder=self._url_builder,
+            cache=LRUCache(
+                max_size=self.config.cache.resolver_max_size,
+                ttl_seconds=self.config.cache.resolver_ttl_seconds,
+            ),
+            store=entity_store,
         )
 
-    @rate_limit(calls_per_second=10)
-    def get_entity(self, entity_type: EntityType, fqn: str) -> OMDResponseEntity:
-        url = self._url_builder.by_fqn(entity_type, fqn, fields=['columns'])
+        self._parser = LineageResponseParser()
+
+    @property
+    def resolver(self) -> EntityResolver:
+        return self._resolver
+
+    def get_entity(
+            self,
+            entity_type: EntityType,
+            fqn: str,
+            fields: Optional[list[str]] = None,
+    ) -> OMDResponseEntity:
+        """Fetches an entity by FQN; only the requested extra fields (e.g. columns) are included."""
+        url = self._url_builder.by_fqn(entity_type, fqn, fields=fields)
 
         response = self._httpx.get(url)
 
         if response.status_code == HTTPStatus.NOT_FOUND:
-            raise AirflowException(f'{entity_type.value.capitalize()} with FQN {fqn} not found')
+            raise EntityNotFoundError(f'{entity_type.value.capitalize()} with FQN {fqn} not found')
 
         response.raise_for_status()
 
-        return OMDResponseEntity(**response.json())
+        entity = OMDResponseEntity(**response.json())
+        self._resolver.remember(entity.id, entity.fully_qualified_name)
+        return entity
 
-    @rate_limit(calls_per_second=10)
     def get_entity_by_id(self, entity_type: EntityType, entity_id: str) -> OMDResponseEntity:
         url = self._url_builder.by_id(entity_type, entity_id)
         response = self._httpx.get(url)
         if response.status_code == HTTPStatus.NOT_FOUND:
-            raise AirflowException(f'{entity_type.value.capitalize()} with ID {entity_id} not found')
+            raise EntityNotFoundError(f'{entity_type.value.capitalize()} with ID {entity_id} not found')
         response.raise_for_status()
-        return OMDResponseEntity(**response.json())
+        entity = OMDResponseEntity(**response.json())
+        self._resolver.remember(entity.id, entity.fully_qualified_name)
+        return entity
+
+    def find_entities_by_fqns(self, entity_type: EntityType, fqns: list[str]) -> EntityLookupResult:
+        """Looks up many FQNs per request through the search endpoint."""
+        result = EntityLookupResult()
+        for batch in chunked(dict.fromkeys(fqns), self.config.search.batch_size):
+            url = self._url_builder.search_query(
+                entity_type,
+                self._parser.fqn_terms_filter(batch),
+                size=len(batch),
+                source_fields=self._parser.SEARCH_SOURCE_FIELDS,
+            )
+            response = self._httpx.get(url)
+            response.raise_for_status()
+            result.merge(self._parser.parse_fqn_lookup(response.json(), batch))
+
+        self._resolver.remember_entities(result.found.values())
+        return result
+
+    def list_schema_entities(
+            self,
+            entity_type: EntityType,
+            schema_fqn: str,
+            fields: Optional[list[str]] = None,
+    ) -> list[OMDResponseEntity]:
+        """Lists all entities of a database schema, following the paging cursor."""
+        entities: list[OMDResponseEntity] = []
+        after = None
+        while True:
+            url = self._url_builder.list_by_schema(
+                entity_type, schema_fqn, limit=self.config.prefetch.page_size, after=after, fields=fields,
+            )
+            response = self._httpx.get(url)
+            response.raise_for_status()
+            page, after = self._parser.parse_entity_page(response.json())
+            entities.extend(page)
+            if not after:
+                break
+
+        self._resolver.remember_entities(entities)
+        return entities
 
     def get_edges_for_scope(
             self,
@@ -100,12 +170,13 @@ class LineageAPIClient:
         edges: Set[Tuple[str, str]] = set()
         for fqn in fqns:
             try:
-                downstream = self._fetch_lineage_edges(fqn, upstream_depth=0, downstream_depth=1)
-                upstream = self._fetch_lineage_edges(fqn, upstream_depth=1, downstream_depth=0)
-                for _, from_id, to_id in downstream + upstream:
+                raw_edges, id_to_fqn = self._fetch_lineage(fqn)
+                for entity_id, entity_fqn in id_to_fqn.items():
+                    self._resolver.remember(entity_id, entity_fqn)
+                for _, from_id, to_id in raw_edges:
                     try:
-                        from_fqn = self._resolver.resolve_fqn_by_id(from_id)
-                        to_fqn = self._resolver.resolve_fqn_by_id(to_id)
+                        from_fqn = id_to_fqn.get(from_id) or self._resolver.resolve_fqn_by_id(from_id)
+                        to_fqn = id_to_fqn.get(to_id) or self._resolver.resolve_fqn_by_id(to_id)
 
                         if schema_filter:
                             from_schema = from_fqn.split('.')[-2]
@@ -119,44 +190,21 @@ class LineageAPIClient:
                         logger.warning('Failed to resolve edge %s -> %s: %s', from_id, to_id, e)
             except Exception as e:
                 logger.warning('Failed to fetch lineage for %s: %s', fqn, e)
+        self._resolver.log_stats()
         return edges
 
-    def _fetch_lineage_edges(
-        self,
-        fqn: str,
-        upstream_depth: int,
-        downstream_depth: int
-    ) -> list[tuple[str, str, str]]:
-        url = self._url_builder.lineage_table_by_fqn(fqn, upstream_depth, downstream_depth)
+    def _fetch_lineage(self, fqn: str) -> tuple[list[tuple[str, str, str]], dict[str, str]]:
+        """Fetches direct upstream and downstream edges in one call, with IDs mapped from the payload."""
+        url = self._url_builder.lineage_table_by_fqn(fqn, upstream_depth=1, downstream_depth=1)
         try:
             response = self._httpx.get(url)
             if response.status_code == HTTPStatus.NOT_FOUND:
-                return []
+                return [], {}
             response.raise_for_status()
-            return self._parse_edges(response.json(), fqn, direction='up' if upstream_depth else 'down')
+            return self._parser.parse_lineage_graph(response.json(), fqn)
         except Exception as e:
             logger.warning('Failed to fetch lineage edges for %s: %s', fqn, e)
-            return []
-
-    def _parse_edges(
-        self,
-        data: dict[str, Any],
-        fqn: str,
-        direction: str
-    ) -> list[tuple[str, str, str]]:
-        key = 'upstreamEdges' if direction == 'up' else 'downstreamEdges'
-        edges = []
-        edge_data = data.get(key, [])
-        if not isinstance(edge_data, list):
-            logger.warning('Lineage response for %s: %s not a list', fqn, key)
-            return []
-        for edge in edge_data:
-            if isinstance(edge, dict):
-                from_id = edge.get('fromEntity')
-                to_id = edge.get('toEntity')
-                if isinstance(from_id, str) and isinstance(to_id, str):
-                    edges.append((fqn, from_id, to_id))
-        return edges
+            return [], {}
 
     @backoff.on_exception(
         backoff.expo,
@@ -164,7 +212,6 @@ class LineageAPIClient:
         max_tries=3,
         jitter=backoff.full_jitter,
     )
-    @rate_limit(calls_per_second=10)
     def add_lineage(
         self,
         from_entity: EntityRef,
@@ -177,11 +224,18 @@ class LineageAPIClient:
         ).model_dump(by_alias=True)
 
         url = self._url_builder.lineage_add_path()
-        response = self._httpx.put(
-            url=url,
-            json=payload
-        )
-        response.raise_for_status()
+        try:
+            response = self._httpx.put(
+                url=url,
+                json=payload
+            )
+            if response.status_code == HTTPStatus.NOT_FOUND:
+                self._resolver.forget(from_entity.id, from_entity.type, from_fqn)
+                self._resolver.forget(to_entity.id, to_entity.type, to_fqn)
+            response.raise_for_status()
+        except Exception as e:
+            logger.error('Failed to add lineage %s -> %s: %s', from_fqn, to_fqn, e)
+            raise
 
     def delete_lineage(self, from_entity: EntityRef, to_entity: EntityRef) -> None:
         payload = LineagePayload(
@@ -203,7 +257,25 @@ class LineageAPIClient:
                          from_fqn, to_fqn, response.status_code, response.text)
             response.raise_for_status()
 
-    @rate_limit(calls_per_second=10)
+    def patch_entity(self, entity_type: EntityType, fqn: str, operations: list[dict]) -> None:
+        """Applies a JSON Patch document to an entity in a single request."""
+        url = self._url_builder.by_fqn(entity_type, fqn)
+
+        patch_headers = {'Content-Type': 'application/json-patch+json'}
+
+        response = self._httpx.patch(
+            url=url,
+            content=json.dumps(operations),
+            headers=patch_headers
+        )
+
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            logger.warning('%s %s not found in OMD. Cannot apply patch.', entity_type.value.capitalize(), fqn)
+            return
+
+        response.raise_for_status()
+        logger.info('Applied %d patch operations to %s', len(operations), fqn)
+
     def patch_table_description(self, fqn: str, description: str) -> None:
         """Updates the description of a table entity in OMD."""
         url = self._url_builder.by_fqn(EntityType.TABLE, fqn)
@@ -227,7 +299,6 @@ class LineageAPIClient:
         response.raise_for_status()
         logger.info('Successfully updated description for table %s', fqn)
 
-    @rate_limit(calls_per_second=10)
     def patch_column_description_by_index(self, table_fqn: str, column_index: int, description: str) -> None:
         """Updates the description of a specific column using its array index."""
         url = self._url_builder.by_fqn(EntityType.TABLE, table_fqn)
@@ -3,10 +3,16 @@ from typing import Optional
 
 from airflow.exceptions import AirflowException
 
+from omd_airflow_utils.lineage_core.adapters.cache.entity_store import (
+    SqliteEntityStore,
+)
 from omd_airflow_utils.lineage_core.adapters.config.config import LineageConfig
 from omd_airflow_utils.lineage_core.adapters.db.connection_providers import (
     AirflowConnectionParamsProvider,
 )
+from omd_airflow_utils.lineage_core.adapters.omd.async_omd_api_client import (
+    AsyncLineageAPIClient,
+)
 from omd_airflow_utils.lineage_core.adapters.omd.omd_api_client import (
     LineageAPIClient,
 )
@@ -20,26 +26,17 @@ class LineageAPIClientFactory:
     @staticmethod
     def create_from_connection(
             conn_id: str,
-            config: Optional[LineageConfig] = None
+            config: Optional[LineageConfig] = None,
+            entity_store: Optional[SqliteEntityStore] = None,
     ) -> LineageAPIClient:
         """Creates client from Airflow connection."""
         try:
-            connection_provider = AirflowConnectionParamsProvider(conn_id)
-            conn_params = connection_provider.get_params()
-
-            base_url = conn_params.get('host')
-            token = conn_params.get('password')
-
-            if not base_url:
-                raise AirflowException(f'Connection {conn_id} is missing host')
-
-            if not token:
-                raise AirflowException(f'Connection {conn_id} is missing token/password')
-
+            base_url, token = LineageAPIClientFactory._get_connection_credentials(conn_id)
             return LineageAPIClient(
                 base_url=base_url,
                 api_token=token,
                 config=config,
+                entity_store=entity_store,
             )
 
         except ValueError as e:
@@ -69,4 +66,43 @@ class LineageAPIClientFactory:
             )
         except Exception as e:
             logger.error('Failed to create LineageAPIClient: %s', e)
-            raise AirflowException(f'Failed to create API client: {e}') from e
\ No newline at end of file
+            raise AirflowException(f'Failed to create API client: {e}') from e
+
+    @staticmethod
+    def create_async_from_connection(
+            conn_id: str,
+            config: Optional[LineageConfig] = None,
+            entity_store: Optional[SqliteEntityStore] = None,
+    ) -> AsyncLineageAPIClient:
+        """Creates async client from Airflow connection."""
+        try:
+            base_url, token = LineageAPIClientFactory._get_connection_credentials(conn_id)
+            return AsyncLineageAPIClient(
+                base_url=base_url,
+                api_token=token,
+                config=config,
+                entity_store=entity_store,
+            )
+
+        except ValueError as e:
+            raise AirflowException(f'Invalid connection {conn_id}: {e}') from e
+        except Exception as e:
+            logger.error('Failed to create AsyncLineageAPIClient from connection %s: %s', conn_id, e)
+            raise AirflowException(f'Failed to create async API client: {e}') from e
+
+    @staticmethod
+    def _get_connection_credentials(conn_id: str) -> tuple[str, str]:
+        """Reads OMD host and token from Airflow connection."""
+        connection_provider = AirflowConnectionParamsProvider(conn_id)
+        conn_params = connection_provider.get_params()
+
+        base_url = conn_params.get('host')
+        token = conn_params.get('password')
+
+        if not base_url:
+            raise AirflowException(f'Connection {conn_id} is missing host')
+
+        if not token:
+            raise AirflowException(f'Connection {conn_id} is missing token/password')
+
+        return base_url, token
@@ -1,6 +1,8 @@
 from typing import (
+    Dict,
     Optional,
     List,
+    Set,
 )
 from pydantic import (
     BaseModel,
@@ -29,4 +31,15 @@ class OMDResponseEntity(BaseModel):
     fully_qualified_name: Optional[str] = Field(default=None, alias='fullyQualifiedName')
     name: Optional[str] = None
     description: Optional[str] = Field(default=None, alias='description')
-    columns: List[OMDColumn] = Field(default_factory=list)
\ No newline at end of file
+    version: Optional[float] = None
+    columns: List[OMDColumn] = Field(default_factory=list)
+
+
+class EntityLookupResult(BaseModel):
+    """Result of a bulk FQN lookup: entities found in OMD and FQNs that are missing."""
+    found: Dict[str, OMDResponseEntity] = Field(default_factory=dict)
+    missing: Set[str] = Field(default_factory=set)
+
+    def merge(self, other: 'EntityLookupResult') -> None:
+        self.found.update(other.found)
+        self.missing.update(other.missing)
@@ -1,12 +1,57 @@
 import logging
+from typing import (
+    Any,
+    Optional,
+)
 
 from httpx import Response
 
+from omd_airflow_utils.lineage_core.adapters.omd.omd_response_models import (
+    EntityLookupResult,
+    OMDResponseEntity,
+)
+
 logger = logging.getLogger(__name__)
 
 
 class LineageResponseParser:
-    """Parser for OpenMetadata API lineage responses."""
+    """Parser for OpenMetadata API lineage and search responses."""
+
+    SEARCH_SOURCE_FIELDS = ['id', 'name', 'fullyQualifiedName', 'entityType']
+
+    @staticmethod
+    def fqn_terms_filter(fqns: list[str]) -> dict[str, Any]:
+        """Builds a search query_filter matching any of the given FQNs."""
+        return {'query': {'bool': {'filter': [{'terms': {'fullyQualifiedName': fqns}}]}}}
+
+    def parse_fqn_lookup(self, data: dict[str, Any], requested_fqns: list[str]) -> EntityLookupResult:
+        """Matches search hits to requested FQNs (case-insensitively); unmatched FQNs are missing."""
+        requested = {fqn.lower(): fqn for fqn in requested_fqns}
+        result = EntityLookupResult()
+
+        hits = data.get('hits', {}).get('hits', []) if isinstance(data, dict) else []
+        if not isinstance(hits, list):
+            logger.warning('Search response: hits not a list')
+            hits = []
+        for hit in hits:
+            source = hit.get('_source') if isinstance(hit, dict) else None
+            if not isinstance(source, dict) or not source.get('id') or not source.get('fullyQualifiedName'):
+                continue
+            requested_fqn = requested.get(source['fullyQualifiedName'].lower())
+            if requested_fqn:
+                result.found[requested_fqn] = OMDResponseEntity(**source)
+
+        result.missing = set(requested_fqns) - result.found.keys()
+        return result
+
+    def parse_entity_page(self, data: dict[str, Any]) -> tuple[list[OMDResponseEntity], Optional[str]]:
+        """Parses a paginated entity list into entities and the next-page cursor."""
+        if not isinstance(data, dict):
+            logger.warning('Unexpected entity list response: not a dict')
+            return [], None
+        entities = [OMDResponseEntity(**item) for item in data.get('data', []) if isinstance(item, dict)]
+        paging = data.get('paging') or {}
+        return entities, paging.get('after')
 
     def parse_lineage_raw_edges_response(
         self, response: Response, src_fqn: str
@@ -56,4 +101,42 @@ class LineageResponseParser:
                         raw_edges.append((target_fqn, from_id, to_id))
         except Exception as e:
             logger.warning('Failed to parse upstream lineage for %s: %s', target_fqn, e)
-        return raw_edges
\ No newline at end of file
+        return raw_edges
+
+    def parse_edges(
+        self, data: dict[str, Any], fqn: str, direction: str
+    ) -> list[tuple[str, str, str]]:
+        """Parses upstream ('up') or downstream ('down') edges from a lineage payload."""
+        key = 'upstreamEdges' if direction == 'up' else 'downstreamEdges'
+        edges = []
+        edge_data = data.get(key, [])
+        if not isinstance(edge_data, list):
+            logger.warning('Lineage response for %s: %s not a list', fqn, key)
+            return []
+        for edge in edge_data:
+            if isinstance(edge, dict):
+                from_id = edge.get('fromEntity')
+                to_id = edge.get('toEntity')
+                if isinstance(from_id, str) and isinstance(to_id, str):
+                    edges.append((fqn, from_id, to_id))
+        return edges
+
+    def parse_lineage_graph(
+        self, data: dict[str, Any], fqn: str
+    ) -> tuple[list[tuple[str, str, str]], dict[str, str]]:
+        """Parses a combined upstream+downstream payload into raw edges and an ID->FQN map."""
+        edges = self.parse_edges(data, fqn, direction='up') + self.parse_edges(data, fqn, direction='down')
+
+        id_to_fqn: dict[str, str] = {}
+        nodes = data.get('nodes', [])
+        if not isinstance(nodes, list):
+            logger.warning('Lineage response for %s: nodes not a list', fqn)
+            nodes = []
+        for node in [data.get('entity'), *nodes]:
+            if isinstance(node, dict):
+                node_id = node.get('id')
+                node_fqn = node.get('fullyQualifiedName')
+                if isinstance(node_id, str) and isinstance(node_fqn, str):
+                    id_to_fqn[node_id] = node_fqn
+
+        return edges, id_to_fqn
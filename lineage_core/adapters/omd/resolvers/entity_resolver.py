@@ -1,7 +1,19 @@
 import logging
 from http import HTTPStatus
+from typing import (
+    Iterable,
+    Optional,
+)
+
+from httpx import Response
 
-from omd_airflow_utils.lineage_core.adapters.httpx_client import HttpxClient
+from omd_airflow_utils.lineage_core.adapters.cache.entity_store import (
+    SqliteEntityStore,
+)
+from omd_airflow_utils.lineage_core.adapters.httpx_client import (
+    AsyncHttpxClient,
+    HttpxClient,
+)
 from omd_airflow_utils.lineage_core.adapters.omd.http.lineage_url_builder import (
     LineageUrlBuilder,
 )
@@ -9,21 +21,94 @@ from omd_airflow_utils.lineage_core.adapters.omd.omd_response_models import (
     OMDResponseEntity,
 )
 from omd_airflow_utils.lineage_core.domain.types import EntityType
+from omd_airflow_utils.lineage_core.utils.lru_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
 
-class EntityResolver:
+def _entity_from_response(entity_id: str, response: Response) -> OMDResponseEntity:
+    """Parses an entity-by-ID response, raising on missing entities or FQN."""
+    if response.status_code == HTTPStatus.NOT_FOUND:
+        raise ValueError(f'Entity not found: {entity_id}')
+    if response.status_code != HTTPStatus.OK:
+        logger.error('Failed to resolve entity %s. Status: %s - %s', entity_id, response.status_code, response.text)
+        response.raise_for_status()
+
+    entity = OMDResponseEntity(**response.json())
+    if not entity.fully_qualified_name:
+        raise ValueError(f'Entity {entity_id} resolved with missing FQN')
+    return entity
+
+
+class _CachingResolver:
+    """Shared ID->FQN cache handling for sync and async resolvers."""
+
+    def __init__(
+        self,
+        cache: Optional[LRUCache] = None,
+        store: Optional[SqliteEntityStore] = None,
+    ):
+        self.cache = cache or LRUCache()
+        self.store = store
+
+    def lookup(self, entity_id: str) -> Optional[str]:
+        """Returns a known FQN from memory or the persistent store without any request."""
+        cached_fqn = self.cache.get(entity_id)
+        if cached_fqn:
+            return cached_fqn
+        if self.store:
+            stored_fqn = self.store.get_fqn_by_id(entity_id)
+            if stored_fqn:
+                self.cache.set(entity_id, stored_fqn)
+                return stored_fqn
+        return None
+
+    def remember(self, entity_id: Optional[str], fqn: Optional[str]) -> None:
+        """Seeds the cache with an already known ID->FQN mapping."""
+        if entity_id and fqn:
+            self.cache.set(entity_id, fqn)
+
+    def remember_entities(self, entities: Iterable[OMDResponseEntity]) -> None:
+        for entity in entities:
+            self.remember(entity.id, entity.fully_qualified_name)
+
+    def forget(self, entity_id: str, entity_type: EntityType, fqn: str) -> None:
+        """Drops a mapping OMD no longer recognises, e.g. after the table was dropped and recreated."""
+        self.cache.discard(entity_id)
+        if self.store:
+            self.store.invalidate(entity_type, fqn)
+
+    def _remember_resolved(self, entity: OMDResponseEntity) -> str:
+        self.remember(entity.id, entity.fully_qualified_name)
+        if self.store:
+            self.store.put(EntityType.TABLE, entity.fully_qualified_name, entity)
+        return entity.fully_qualified_name
+
+    def log_stats(self) -> None:
+        logger.info(
+            'Entity resolver cache: %d hits, %d misses, %d entries',
+            self.cache.hits, self.cache.misses, len(self.cache)
+        )
+
+
+class EntityResolver(_CachingResolver):
     def __init__(
         self,
         http: HttpxClient,
-        url_builder: LineageUrlBuilder
+        url_builder: LineageUrlBuilder,
+        cache: Optional[LRUCache] = None,
+        store: Optional[SqliteEntityStore] = None,
     ):
+        super().__init__(cache, store)
         self.http = http
         self.urls = url_builder
 
     def resolve_fqn_by_id(self, entity_id: str) -> str:
-        """Resolve FQN from ID."""
+        """Resolve FQN from ID, using the cache when possible."""
+        known_fqn = self.lookup(entity_id)
+        if known_fqn:
+            return known_fqn
+
         url = self.urls.by_id(EntityType.TABLE, entity_id)
         try:
             response = self.http.get(url)
@@ -31,13 +116,32 @@ class EntityResolver:
             logger.error('Request failed while resolving entity %s: %s', entity_id, e)
             raise
 
-        if response.status_code == HTTPStatus.NOT_FOUND:
-            raise ValueError(f'Entity not found: {entity_id}')
-        if response.status_code != HTTPStatus.OK:
-            logger.error('Failed to resolve entity %s. Status: %s - %s', entity_id, response.status_code, response.text)
-            response.raise_for_status()
+        return self._remember_resolved(_entity_from_response(entity_id, response))
+
+
+class AsyncEntityResolver(_CachingResolver):
+    def __init__(
+        self,
+        http: AsyncHttpxClient,
+        url_builder: LineageUrlBuilder,
+        cache: Optional[LRUCache] = None,
+        store: Optional[SqliteEntityStore] = None,
+    ):
+        super().__init__(cache, store)
+        self.http = http
+        self.urls = url_builder
+
+    async def resolve_fqn_by_id(self, entity_id: str) -> str:
+        """Resolve FQN from ID, using the cache when possible."""
+        known_fqn = self.lookup(entity_id)
+        if known_fqn:
+            return known_fqn
+
+        url = self.urls.by_id(EntityType.TABLE, entity_id)
+        try:
+            response = await self.http.get(url)
+        except Exception as e:
+            logger.error('Request failed while resolving entity %s: %s', entity_id, e)
+            raise
 
-        entity = OMDResponseEntity(**response.json())
-        if not entity.fully_qualified_name:
-            raise ValueError(f'Entity {entity_id} resolved with missing FQN')
-        return entity.fully_qualified_name
\ No newline at end of file
+        return self._remember_resolved(_entity_from_response(entity_id, response))
@@ -16,4 +16,26 @@ from
 where 
     node_id = %(node_id)s
     and description is not null;
-"""
\ No newline at end of file
+"""
+
+FETCH_DESCRIPTIONS = """
+select
+    n.id as node_id
+    , null as column_name
+    , n.description
+from
+    graph.nodes n
+where
+    n.id = any(%(node_ids)s)
+    and n.description is not null
+union all
+select
+    c.node_id
+    , c."name" as column_name
+    , c.description
+from
+    graph."columns" c
+where
+    c.node_id = any(%(node_ids)s)
+    and c.description is not null;
+"""
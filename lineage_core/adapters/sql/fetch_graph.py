@@ -0,0 +1,99 @@
+FETCH_GRAPH = """
+with selected_nodes as (
+    select
+        n.id
+        , n.name
+        , n.namespace_id
+        , ns.name as db_schema
+        , n.updated
+    from
+        graph.nodes n
+    join
+        graph.nodes_tags nt
+    on
+        n.id = nt.node_id
+    join
+        graph.namespaces ns
+    on
+        n.namespace_id = ns.id
+    where
+        nt.tag_id = %(tag_id)s
+        and ns.name = any(%(schemas)s)
+        and n.state = %(state)s
+        and n.operator_id != %(operator_id)s
+        {extra_filter}
+),
+selected_edges as (
+    select
+        d.source_id as from_node_id
+        , d.target_id as to_node_id
+    from
+        graph.dependencies d
+    where
+        d.removed_commit_id is null
+        and (
+        d.source_id in (select id from selected_nodes)
+        or
+        d.target_id in (select id from selected_nodes))
+),
+boundary_ids as (
+    select from_node_id as id from selected_edges
+    union
+    select to_node_id from selected_edges
+    except
+    select id from selected_nodes
+),
+boundary_nodes as (
+    select
+        n.id
+        , n.name
+        , n.namespace_id
+        , ns.name as db_schema
+        , n.updated
+    from
+        graph.nodes n
+    join
+        graph.namespaces ns
+    on
+        n.namespace_id = ns.id
+    where
+        n.id in (select id from boundary_ids)
+        and n.state = %(state)s
+        and n.operator_id != %(operator_id)s
+)
+select
+    'node' as kind
+    , id
+    , name
+    , namespace_id
+    , db_schema
+    , updated
+    , null::bigint as from_node_id
+    , null::bigint as to_node_id
+from
+    selected_nodes
+union all
+select
+    'boundary'
+    , id
+    , name
+    , namespace_id
+    , db_schema
+    , updated
+    , null
+    , null
+from
+    boundary_nodes
+union all
+select
+    'edge'
+    , null
+    , null
+    , null
+    , null
+    , null
+    , from_node_id
+    , to_node_id
+from
+    selected_edges
+"""
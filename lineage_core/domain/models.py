@@ -1,5 +1,14 @@
+import sys
+from array import array
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
 
 from dateutil.parser import isoparse
 from pydantic import (
@@ -27,6 +36,40 @@ class LineageEdge(BaseModel):
     to_entity: EntityRef = Field(alias='toEntity')
 
 
+EdgePair = tuple[int, int]
+
+
+def edge_endpoints(edge: Union[LineageEdge, EdgePair]) -> EdgePair:
+    """Returns integer (from, to) node IDs of an edge given as a model or as a compact pair."""
+    if isinstance(edge, tuple):
+        return edge
+    return int(edge.from_entity.id), int(edge.to_entity.id)
+
+
+class EdgeArray:
+    """Edges stored as parallel int64 arrays of source and target node IDs."""
+    __slots__ = ('sources', 'targets')
+
+    def __init__(self, pairs: Iterable[EdgePair] = ()):
+        self.sources = array('q')
+        self.targets = array('q')
+        for src, dst in pairs:
+            self.append(src, dst)
+
+    def append(self, src: int, dst: int) -> None:
+        self.sources.append(src)
+        self.targets.append(dst)
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def __iter__(self) -> Iterator[EdgePair]:
+        return zip(self.sources, self.targets)
+
+    def __repr__(self) -> str:
+        return f'EdgeArray({list(self)!r})'
+
+
 class LineagePayload(BaseModel):
     edge: LineageEdge
 
@@ -39,6 +82,80 @@ class Node(BaseModel):
     updated: Optional[datetime]
     state: str = 'accepted'
     description: Optional[str] = None
+    operator_id: Optional[int] = None
+
+
+@dataclass(frozen=True, slots=True)
+class NodeRecord:
+    """Compact node representation used inside the graph pipeline; schema and name are interned."""
+    id: int
+    name: str
+    namespace_id: int
+    db_schema: str
+    updated: Optional[datetime]
+    state: str = 'accepted'
+    description: Optional[str] = None
+    operator_id: Optional[int] = None
+
+    @classmethod
+    def create(
+        cls,
+        id: int,
+        name: str,
+        namespace_id: int,
+        db_schema: str,
+        updated: Optional[datetime],
+        state: str = 'accepted',
+        description: Optional[str] = None,
+        operator_id: Optional[int] = None,
+    ) -> 'NodeRecord':
+        return cls(
+            id, sys.intern(name), namespace_id, sys.intern(db_schema), updated, state, description, operator_id
+        )
+
+    @classmethod
+    def of(cls, node: Union[Node, 'NodeRecord']) -> 'NodeRecord':
+        """Returns the node itself if it is already a record, otherwise a record built from the model."""
+        if isinstance(node, NodeRecord):
+            return node
+        return cls.create(
+            node.id,
+            node.name,
+            node.namespace_id,
+            node.db_schema,
+            node.updated,
+            node.state,
+            node.description,
+            node.operator_id,
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        """Dict-style read access, kept for callers of the former dict node payload."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def to_node(self) -> Node:
+        return Node(
+            id=self.id,
+            name=self.name,
+            namespace_id=self.namespace_id,
+            db_schema=self.db_schema,
+            updated=self.updated,
+            state=self.state,
+            description=self.description,
+            operator_id=self.operator_id,
+        )
+
+
+class NodeDescriptions(BaseModel):
+    node_id: int
+    description: Optional[str] = None
+    columns: dict[str, str] = Field(default_factory=dict)
 
 
 class DatabaseContext(BaseModel):
@@ -48,6 +165,9 @@ class DatabaseContext(BaseModel):
     def fqn(self, schema: str, name: str) -> str:
         return f'{self.service_name}.{self.database_name}.{schema}.{name}'
 
+    def schema_fqn(self, schema: str) -> str:
+        return f'{self.service_name}.{self.database_name}.{schema}'
+
 
 class Settings(BaseModel):
     tag_id: int = 60
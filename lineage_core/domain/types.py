@@ -19,6 +19,11 @@ class LineageLoadType(str, Enum):
     INIT = 'init'
     INCREMENTAL = 'incremental'
 
+class GraphEngine(str, Enum):
+    SIMPLE = 'simple'
+    CSR = 'csr'
+    AUTO = 'auto'
+
 @dataclass(frozen=True)
 class TypedFQN:
     type: EntityType
@@ -38,4 +38,15 @@ class LineageSyncResult:
 
     @property
     def total_changes(self) -> int:
-        return len(self.pairs_to_add) + len(self.pairs_to_delete)
\ No newline at end of file
+        return len(self.pairs_to_add) + len(self.pairs_to_delete)
+
+@dataclass
+class DescriptionSyncResult:
+    patched: int = 0
+    skipped: int = 0
+    failed: int = 0
+
+    def merge(self, other: 'DescriptionSyncResult') -> None:
+        self.patched += other.patched
+        self.skipped += other.skipped
+        self.failed += other.failed
@@ -12,11 +12,12 @@ from omd_airflow_utils.lineage_core.adapters.db.connection_providers import (
     SettingsConnectionParamsProvider,
 )
 from omd_airflow_utils.lineage_core.adapters.node_repository import (
+    DEFAULT_ITERSIZE,
     NodeRepository,
 )
 from omd_airflow_utils.lineage_core.domain.models import (
-    LineageEdge,
-    Node,
+    EdgeArray,
+    NodeRecord,
     Settings,
 )
 from omd_airflow_utils.lineage_core.domain.types import LineageLoadType
@@ -24,8 +25,8 @@ from omd_airflow_utils.lineage_core.domain.types import LineageLoadType
 
 @dataclass
 class LineageGraphResult:
-    nodes: List[Node]
-    edges: List[LineageEdge]
+    nodes: List[NodeRecord]
+    edges: EdgeArray
     affected_fqns: Optional[Set[str]] = None
 
 class LineageGraphFetcher:
@@ -36,10 +37,16 @@ class LineageGraphFetcher:
         settings: Settings,
         database_conn_id: Optional[str] = None,
         schema_filter: Optional[list[str]] = None,
+        itersize: int = DEFAULT_ITERSIZE,
+        skip_schemas: Optional[list[str]] = None,
+        path_cutoff: int = 20,
     ):
         self.settings = settings
         self.database_conn_id = database_conn_id
         self.schema_filter = schema_filter
+        self.itersize = itersize
+        self.skip_schemas = set(skip_schemas or ())
+        self.path_cutoff = path_cutoff
 
     def fetch(self) -> LineageGraphResult:
         if self.settings.load_type == LineageLoadType.INIT:
@@ -48,57 +55,88 @@ class LineageGraphFetcher:
             return self._fetch_incremental()
 
     def _fetch_init(self) -> LineageGraphResult:
-        schemas = self.schema_filter or self.settings.schema_filter
         provider = self._get_provider()
 
         with PostgresClient(params_provider=provider).get_connection() as conn:
-            repo = NodeRepository(conn)
-            nodes = repo.fetch_nodes(
-                tag_id=self.settings.tag_id,
-                schemas=schemas,
-                state=self.settings.state,
-                last_executed=self.settings.last_executed,
-                operator_id=self.settings.operator_id,
-            )
-            edges = repo.fetch_edges([n.id for n in nodes])
-            nodes = self._add_missing_nodes(repo, nodes, edges)
-            return LineageGraphResult(nodes=nodes, edges=edges)
+            return self._collect_init(NodeRepository(conn, itersize=self.itersize))
+
+    def _collect_init(self, repo: NodeRepository) -> LineageGraphResult:
+        nodes, edges, boundary_ids = repo.fetch_graph(
+            tag_id=self.settings.tag_id,
+            schemas=self.schema_filter or self.settings.schema_filter,
+            state=self.settings.state,
+            last_executed=self.settings.last_executed,
+            operator_id=self.settings.operator_id,
+        )
+        if self.skip_schemas:
+            expanded = {n.id for n in nodes if n.id not in boundary_ids}
+            nodes, edges = self._expand_through_skipped(repo, nodes, edges, expanded=expanded)
+        return LineageGraphResult(nodes=nodes, edges=edges)
 
     def _fetch_incremental(self) -> LineageGraphResult:
-        schemas = self.schema_filter or self.settings.schema_filter
         provider = self._get_provider()
 
         with PostgresClient(params_provider=provider).get_connection() as conn:
-            repo = NodeRepository(conn)
-            active, inactive = repo.fetch_nodes_for_incremental(
-                tag_id=self.settings.tag_id,
-                schemas=schemas,
-                operator_id=self.settings.operator_id,
-                last_executed=self.settings.last_executed,
-                safety_window_hours=48,
-            )
-            nodes = active
-            affected_fqns = {
-                self.settings.context.fqn(n.db_schema, n.name) for n in active + inactive
-            }
-            edges = repo.fetch_edges([n.id for n in nodes]) if nodes else []
-            nodes = self._add_missing_nodes(repo, nodes, edges) if edges else nodes
-            return LineageGraphResult(
-                nodes=nodes,
-                edges=edges,
-                affected_fqns=affected_fqns,
-            )
+            return self._collect_incremental(NodeRepository(conn, itersize=self.itersize))
+
+    def _collect_incremental(self, repo: NodeRepository) -> LineageGraphResult:
+        active, inactive = repo.fetch_nodes_for_incremental(
+            tag_id=self.settings.tag_id,
+            schemas=self.schema_filter or self.settings.schema_filter,
+            operator_id=self.settings.operator_id,
+            last_executed=self.settings.last_executed,
+            safety_window_hours=48,
+        )
+        nodes = active
+        affected_fqns = {
+            self.settings.context.fqn(n.db_schema, n.name) for n in active + inactive
+        }
+        edges = repo.fetch_edge_pairs([n.id for n in nodes]) if nodes else EdgeArray()
+        nodes = self._add_missing_nodes(repo, nodes, edges) if edges else nodes
+        if self.skip_schemas:
+            nodes, edges = self._expand_through_skipped(repo, nodes, edges, expanded={n.id for n in active})
+        return LineageGraphResult(
+            nodes=nodes,
+            edges=edges,
+            affected_fqns=affected_fqns,
+        )
+
+    def _expand_through_skipped(
+        self,
+        repo: NodeRepository,
+        nodes: List[NodeRecord],
+        edges: EdgeArray,
+        expanded: Set[int],
+    ) -> tuple[List[NodeRecord], EdgeArray]:
+        """
+        Loads edges of skipped-schema nodes not yet in `expanded` for up to `path_cutoff` hops,
+        so that pairs bridged through them are complete and not deleted by the incremental diff.
+        """
+        seen_edges = set(edges)
+        new_nodes = nodes
+        for _ in range(self.path_cutoff):
+            frontier = [n.id for n in new_nodes if n.db_schema in self.skip_schemas and n.id not in expanded]
+            if not frontier:
+                break
+            expanded.update(frontier)
+            new_edges = EdgeArray()
+            for pair in repo.fetch_edge_pairs(frontier):
+                if pair not in seen_edges:
+                    seen_edges.add(pair)
+                    new_edges.append(*pair)
+                    edges.append(*pair)
+            known = len(nodes)
+            nodes = self._add_missing_nodes(repo, nodes, new_edges) if new_edges else nodes
+            new_nodes = nodes[known:]
+        return nodes, edges
 
     def _add_missing_nodes(
-        self, repo: NodeRepository, nodes: List[Node], edges: List[LineageEdge]
-    ) -> List[Node]:
+        self, repo: NodeRepository, nodes: List[NodeRecord], edges: EdgeArray
+    ) -> List[NodeRecord]:
         existing = {n.id for n in nodes}
         required = set()
 
-        for edge in edges:
-            from_id = int(edge.from_entity.id)
-            to_id = int(edge.to_entity.id)
-
+        for from_id, to_id in edges:
             if from_id not in existing:
                 required.add(from_id)
             if to_id not in existing:
@@ -1,11 +1,15 @@
-
+import asyncio
 from typing import (
+    Callable,
     List,
     Optional,
     Set,
     Tuple,
 )
 
+from omd_airflow_utils.lineage_core.adapters.omd.async_omd_api_client import (
+    AsyncLineageAPIClient,
+)
 from omd_airflow_utils.lineage_core.adapters.omd.omd_api_client import (
     LineageAPIClient,
 )
@@ -16,7 +20,10 @@ from omd_airflow_utils.lineage_core.domain.types import (
     TypedFQN,
     LineageLoadType,
 )
-from omd_airflow_utils.lineage_core.domain.use_cases import LineageRequest
+from omd_airflow_utils.lineage_core.domain.use_cases import (
+    LineageProcessingResult,
+    LineageRequest,
+)
 from omd_airflow_utils.lineage_core.services.lineage_executor import (
     LineageOperationExecutor,
 )
@@ -32,11 +39,13 @@ class LineageSyncRunner:
         self,
         client: LineageAPIClient,
         service: LineageService,
-        executor: LineageOperationExecutor
+        executor: LineageOperationExecutor,
+        async_client_factory: Optional[Callable[[], AsyncLineageAPIClient]] = None,
     ):
         self.client = client
         self.service = service
         self.executor = executor
+        self.async_client_factory = async_client_factory
 
     def run_sync(
         self,
@@ -54,43 +63,35 @@ class LineageSyncRunner:
             target_entities=[p.target for p in lineage_pairs],
             mapping=MappingType.ONE_TO_ONE,
         )
-        result = self.service.prepare_lineage_processing(request, client=self.client)
-
-        if clean_before_update:
-            self._full_reload(lineage_pairs, result.entity_cache, schema_filter)
-        elif load_type == LineageLoadType.INCREMENTAL and affected_fqns:
-            self._diff_sync(lineage_pairs, result.entity_cache, affected_fqns)
+        full_reload = clean_before_update or not (load_type == LineageLoadType.INCREMENTAL and affected_fqns)
+        if full_reload:
+            scope_fqns = self._extract_target_schema_fqns(lineage_pairs, schema_filter)
+            result, existing = self._prepare_and_fetch_edges(request, scope_fqns, schema_filter)
+            self._full_reload(lineage_pairs, result.entity_cache, existing)
         else:
-            self._full_reload(lineage_pairs, result.entity_cache, schema_filter)
+            result, existing = self._prepare_and_fetch_edges(request, affected_fqns)
+            self._diff_sync(lineage_pairs, result.entity_cache, existing)
 
     def _full_reload(
         self,
         lineage_pairs: List[EntityPair],
         entity_cache: dict,
-        schema_filter: Set[str]
+        existing_edges: Set[Tuple[str, str]],
     ) -> None:
         """Performs full lineage reload: deletes and re-creates all edges."""
-        target_fqns = self._extract_target_schema_fqns(lineage_pairs, schema_filter)
-
-        existing_edges = self.client.get_edges_for_scope(
-            fqns=target_fqns,
-            schema_filter=schema_filter
-        )
-
         if existing_edges:
             delete_pairs = self._convert(existing_edges)
-            self.executor.execute_delete_operations_sequentially(delete_pairs, self.client)
+            self.executor.execute_delete_operations_concurrently(delete_pairs, self.client)
 
-        self.executor.execute_add_operations_sequentially(lineage_pairs, entity_cache, self.client)
+        self.executor.execute_add_operations_concurrently(lineage_pairs, entity_cache, self.client)
 
     def _diff_sync(
         self,
         lineage_pairs: List[EntityPair],
         entity_cache: dict,
-        affected_fqns: Set[str]
+        existing: Set[Tuple[str, str]],
     ) -> None:
         """Performs differential sync based on current and existing edges."""
-        existing = self.client.get_edges_for_scope(affected_fqns)
         current = {(p.source.fqn, p.target.fqn) for p in lineage_pairs}
 
         to_add = current - existing
@@ -100,9 +101,32 @@ class LineageSyncRunner:
         add_pairs = [p for p in lineage_pairs if (p.source.fqn, p.target.fqn) in to_add]
 
         if delete_pairs:
-            self.executor.execute_delete_operations_sequentially(delete_pairs, self.client)
+            self.executor.execute_delete_operations_concurrently(delete_pairs, self.client)
         if add_pairs:
-            self.executor.execute_add_operations_sequentially(add_pairs, entity_cache, self.client)
+            self.executor.execute_add_operations_concurrently(add_pairs, entity_cache, self.client)
+
+    def _prepare_and_fetch_edges(
+        self,
+        request: LineageRequest,
+        fqns: Set[str],
+        schema_filter: Optional[Set[str]] = None,
+    ) -> tuple[LineageProcessingResult, Set[Tuple[str, str]]]:
+        """
+        Preloads entities and fetches existing OMD edges of the scope. In async mode both phases
+        share one event loop and one client, so the ID-to-FQN cache seeded by the preload
+        serves the edge lookup.
+        """
+        if not self.async_client_factory:
+            result = self.service.prepare_lineage_processing(request, client=self.client)
+            return result, self.client.get_edges_for_scope(fqns=fqns, schema_filter=schema_filter)
+
+        async def _run() -> tuple[LineageProcessingResult, Set[Tuple[str, str]]]:
+            async with self.async_client_factory() as async_client:
+                result = await self.service.prepare_lineage_processing_async(request, client=async_client)
+                edges = await async_client.get_edges_for_scope(fqns=fqns, schema_filter=schema_filter)
+                return result, edges
+
+        return asyncio.run(_run())
 
     def _convert(self, fqn_pairs: Set[Tuple[str, str]]) -> List[EntityPair]:
         """Converts (source_fqn, target_fqn) pairs into EntityPair objects."""
@@ -1,7 +1,9 @@
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from typing import Callable
 
 from omd_airflow_utils.lineage_core.adapters.omd.omd_api_client import (
     LineageAPIClient,
@@ -43,7 +45,12 @@ class ExecutionResult:
 
 
 class LineageOperationExecutor:
-    """Executes add/delete lineage operations with delays and progress tracking."""
+    """Executes add/delete lineage operations sequentially with delays or on a worker pool."""
+
+    def __init__(self, max_workers: int = 8):
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        self.max_workers = max_workers
 
     def execute_add_operations_sequentially(
         self,
@@ -92,6 +99,55 @@ class LineageOperationExecutor:
 
         return self._create_execution_result(results)
 
+    def execute_add_operations_concurrently(
+        self,
+        pairs: list[EntityPair],
+        entity_cache: dict,
+        client: LineageAPIClient,
+    ) -> ExecutionResult:
+        """Runs add operations on a worker pool; throttling is left to the client's rate limiter."""
+        def add(indexed_pair: tuple[int, EntityPair]) -> OperationResult:
+            i, pair = indexed_pair
+            try:
+                logger.info('ADD %s/%s: source=%s -> target=%s', i, len(pairs), pair.source.fqn, pair.target.fqn)
+                self._execute_add_operation(pair, entity_cache, client)
+                return OperationResult(OperationType.ADD, pair, True)
+            except Exception as e:
+                return OperationResult(OperationType.ADD, pair, False, e)
+
+        return self._run_concurrently(add, pairs)
+
+    def execute_delete_operations_concurrently(
+        self,
+        pairs: list[EntityPair],
+        client: LineageAPIClient,
+    ) -> ExecutionResult:
+        """Runs delete operations on a worker pool; throttling is left to the client's rate limiter."""
+        def delete(indexed_pair: tuple[int, EntityPair]) -> OperationResult:
+            i, pair = indexed_pair
+            try:
+                logger.info('DELETE %s/%s: source=%s -> target=%s', i, len(pairs), pair.source.fqn, pair.target.fqn)
+                self._execute_delete_operation(pair, client)
+                return OperationResult(OperationType.DELETE, pair, True)
+            except Exception as e:
+                return OperationResult(OperationType.DELETE, pair, False, e)
+
+        return self._run_concurrently(delete, pairs)
+
+    def _run_concurrently(
+        self,
+        operation: Callable[[tuple[int, EntityPair]], OperationResult],
+        pairs: list[EntityPair],
+    ) -> ExecutionResult:
+        if not pairs:
+            return self._create_execution_result([])
+
+        workers = min(self.max_workers, len(pairs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='lineage-op') as pool:
+            results = list(pool.map(operation, enumerate(pairs, 1)))
+
+        return self._create_execution_result(results)
+
     def _execute_add_operation(
         self,
         pair: EntityPair,
@@ -1,6 +1,25 @@
 import logging
+from typing import (
+    Iterable,
+    Optional,
+    Union,
+)
 
-from omd_airflow_utils.lineage_core.domain.models import LineageEdge, Node
+from omd_airflow_utils.lineage_core.domain.models import (
+    EdgeArray,
+    EdgePair,
+    LineageEdge,
+    Node,
+    NodeRecord,
+    edge_endpoints,
+)
+from omd_airflow_utils.lineage_core.domain.types import GraphEngine
+from omd_airflow_utils.lineage_core.utils.csr_graph import (
+    CSRGraph,
+    numpy_available,
+)
+from omd_airflow_utils.lineage_core.utils.graph_algorithms import Condensation
+from omd_airflow_utils.lineage_core.utils.reachability_index import ReachabilityIndex
 from omd_airflow_utils.lineage_core.utils.simple_graph import SimpleDiGraph
 
 logger = logging.getLogger(__name__)
@@ -8,26 +27,22 @@ logger = logging.getLogger(__name__)
 class LineageGraphService:
     """Builds and transforms lineage graphs from nodes and edges."""
 
+    def __init__(self, engine: GraphEngine = GraphEngine.SIMPLE, csr_min_edges: int = 1_000_000):
+        self.engine = engine
+        self.csr_min_edges = csr_min_edges
+
     def build_graph(
         self,
-        nodes: list[Node],
-        edges: list[LineageEdge],
+        nodes: Iterable[Union[Node, NodeRecord]],
+        edges: Iterable[Union[LineageEdge, EdgePair]],
         collapse_triggers: bool = False,
         trigger_operator_id: int = None,
-    ) -> SimpleDiGraph:
+    ) -> Union[SimpleDiGraph, CSRGraph]:
         """Constructs a directed graph from nodes and edges with optional trigger collapsing."""
-        graph = SimpleDiGraph()
-        node_ids = set()
-
-        for node in nodes:
-            graph.add_node(node.id, **node.model_dump())
-            node_ids.add(node.id)
-
-        for edge in edges:
-            src = int(edge.from_entity.id)
-            dst = int(edge.to_entity.id)
-            if src in node_ids and dst in node_ids:
-                graph.add_edge(src, dst)
+        if self._use_csr(edges):
+            graph = self._build_csr_graph(nodes, edges)
+        else:
+            graph = self._build_simple_graph(nodes, edges)
 
         if collapse_triggers and trigger_operator_id is not None:
             graph = self.collapse_trigger_nodes(graph, trigger_operator_id)
@@ -35,14 +50,14 @@ class LineageGraphService:
 
         logger.info(
             'Graph stats: %d nodes, %d edges, %d sources, %d sinks',
-            len(graph.nodes()),
-            sum(len(adj) for adj in graph.adj.values()),
+            graph.number_of_nodes(),
+            graph.number_of_edges(),
             len(sources),
             len(sinks)
         )
         return graph
 
-    def find_sources_and_sinks(self, graph: SimpleDiGraph) -> tuple[list[int], list[int]]:
+    def find_sources_and_sinks(self, graph: Union[SimpleDiGraph, CSRGraph]) -> tuple[list[int], list[int]]:
         """Identifies source (no incoming) and sink (no outgoing) nodes in the graph."""
         in_deg = graph.in_degree()
         out_deg = graph.out_degree()
@@ -50,48 +65,246 @@ class LineageGraphService:
         sinks = [n for n in graph.nodes() if out_deg.get(n, 0) == 0]
         return sources, sinks
 
-    def collapse_trigger_nodes(self, graph: SimpleDiGraph, trigger_operator_id: int) -> SimpleDiGraph:
-        """Removes trigger nodes from graph and reconnects their predecessors to successors."""
-        trigger_nodes = [
+    def condense(self, graph: Union[SimpleDiGraph, CSRGraph]) -> Condensation:
+        """Collapses strongly connected components into a DAG and reports the cycles found."""
+        condensation = graph.condensation()
+        cycles = condensation.cycles()
+        if cycles:
+            logger.warning(
+                'Lineage graph has %d cycles covering %d nodes, e.g. %s',
+                len(cycles),
+                sum(len(members) for members in cycles),
+                sorted(max(cycles, key=len))[:20],
+            )
+        return condensation
+
+    def transitive_edges(
+        self,
+        graph: Union[SimpleDiGraph, CSRGraph],
+        skipped: set[int],
+        path_cutoff: int,
+        condensation: Optional[Condensation] = None,
+    ) -> EdgeArray:
+        """
+        Connects non-skipped nodes through paths of skipped nodes of at most `path_cutoff` edges.
+        With the graph's condensation, an acyclic skipped layer is resolved in one pass over the DAG.
+        """
+        edges = EdgeArray()
+        if path_cutoff < 1:
+            return edges
+
+        exits = None
+        if condensation is not None:
+            exits = self._skipped_exits_on_dag(graph, skipped, path_cutoff - 1, condensation)
+        if exits is None:
+            exits = self._skipped_exits(graph, skipped, path_cutoff - 1)
+        for src in graph.nodes():
+            if src in skipped:
+                continue
+            reached: set[int] = set()
+            for succ in graph.successors(src):
+                if succ not in skipped:
+                    reached.add(succ)
+                else:
+                    reached |= exits[succ]
+            reached.discard(src)
+            for dst in reached:
+                edges.append(src, dst)
+        return edges
+
+    @staticmethod
+    def _skipped_exits(
+        graph: Union[SimpleDiGraph, CSRGraph],
+        skipped: set[int],
+        budget: int,
+    ) -> dict[int, frozenset[int]]:
+        """
+        Maps each skipped node to the non-skipped nodes it reaches in at most `budget` edges through
+        skipped nodes only. Hop levels are built semi-naively: a node is recomputed only when one of
+        its skipped successors changed on the previous level, and the loop stops at the fixpoint.
+        """
+        if budget < 1:
+            return dict.fromkeys(skipped, frozenset())
+
+        direct = {
+            node_id: frozenset(succ for succ in graph.successors(node_id) if succ not in skipped)
+            for node_id in skipped
+        }
+        exits = dict(direct)
+        changed = {node_id for node_id, reached in direct.items() if reached}
+        for _ in range(budget - 1):
+            candidates = {pred for node_id in changed for pred in graph.predecessors(node_id) if pred in skipped}
+            updated: dict[int, frozenset[int]] = {}
+            for node_id in candidates:
+                reached = direct[node_id].union(
+                    *(exits[succ] for succ in graph.successors(node_id) if succ in skipped)
+                )
+                # Levels only grow, so an unchanged size means an unchanged set.
+                if len(reached) != len(exits[node_id]):
+                    updated[node_id] = frozenset(reached)
+            if not updated:
+                break
+            exits.update(updated)
+            changed = set(updated)
+        return exits
+
+    @staticmethod
+    def _skipped_exits_on_dag(
+        graph: Union[SimpleDiGraph, CSRGraph],
+        skipped: set[int],
+        budget: int,
+        condensation: Condensation,
+    ) -> Optional[dict[int, frozenset[int]]]:
+        """
+        Computes the same map as _skipped_exits in reverse topological order of the condensation.
+        Returns None when a skipped node lies on a cycle or a chain of skipped nodes is longer than
+        `budget`: only then do hop levels matter.
+        """
+        if budget < 1:
+            return None
+        component_of = condensation.component_of
+        if any(component_of[node_id] in condensation.cyclic for node_id in skipped):
+            return None
+
+        exits: dict[int, frozenset[int]] = {}
+        chain: dict[int, int] = {}
+        for node_id in sorted(skipped, key=component_of.__getitem__):
+            direct: set[int] = set()
+            inherited: dict[int, frozenset[int]] = {}
+            length = 0
+            for succ in graph.successors(node_id):
+                if succ not in skipped:
+                    direct.add(succ)
+                else:
+                    inherited[id(exits[succ])] = exits[succ]
+                    length = max(length, chain[succ])
+            if length >= budget:
+                return None
+            chain[node_id] = length + 1
+            if not direct and len(inherited) == 1:
+                exits[node_id] = next(iter(inherited.values()))
+            else:
+                exits[node_id] = frozenset(direct.union(*inherited.values()))
+        return exits
+
+    def build_reachability_index(
+        self,
+        graph: Union[SimpleDiGraph, CSRGraph],
+        label_count: int = 3,
+        condensation: Optional[Condensation] = None,
+    ) -> ReachabilityIndex:
+        """Builds an interval-labelled reachability index of the graph for impact-analysis queries."""
+        if condensation is None:
+            condensation = self.condense(graph)
+        index = ReachabilityIndex.from_condensation(condensation, label_count=label_count)
+        logger.info(
+            'Reachability index: %d nodes in %d components', graph.number_of_nodes(), len(index.components)
+        )
+        return index
+
+    def _use_csr(self, edges: Iterable) -> bool:
+        if self.engine == GraphEngine.CSR:
+            return True
+        if self.engine != GraphEngine.AUTO or not hasattr(edges, '__len__'):
+            return False
+        if len(edges) < self.csr_min_edges:
+            return False
+        if not numpy_available():
+            logger.warning('numpy is not installed, building %d edges with the simple graph engine', len(edges))
+            return False
+        return True
+
+    @staticmethod
+    def _build_simple_graph(
+        nodes: Iterable[Union[Node, NodeRecord]],
+        edges: Iterable[Union[LineageEdge, EdgePair]],
+    ) -> SimpleDiGraph:
+        graph = SimpleDiGraph()
+        for node in nodes:
+            graph.add_node(node.id, NodeRecord.of(node))
+
+        for edge in edges:
+            src, dst = edge_endpoints(edge)
+            if graph.has_node(src) and graph.has_node(dst):
+                graph.add_edge(src, dst)
+        return graph
+
+    @staticmethod
+    def _build_csr_graph(
+        nodes: Iterable[Union[Node, NodeRecord]],
+        edges: Iterable[Union[LineageEdge, EdgePair]],
+    ) -> CSRGraph:
+        records = [NodeRecord.of(node) for node in nodes]
+        if not isinstance(edges, EdgeArray):
+            edges = EdgeArray(map(edge_endpoints, edges))
+        return CSRGraph.from_edges(
+            [record.id for record in records], edges.sources, edges.targets, node_data=records
+        )
+
+    def collapse_trigger_nodes(
+        self,
+        graph: Union[SimpleDiGraph, CSRGraph],
+        trigger_operator_id: int,
+    ) -> Union[SimpleDiGraph, CSRGraph]:
+        """Removes trigger nodes and reconnects predecessors to the nodes reached through trigger chains."""
+        trigger_nodes = {
             node_id for node_id in graph.nodes()
-            if graph.get_node(node_id).get('operator_id') == trigger_operator_id
-        ]
+            if getattr(graph.get_node(node_id), 'operator_id', None) == trigger_operator_id
+        }
 
         if not trigger_nodes:
             return graph
 
-        new_graph = SimpleDiGraph()
+        exits = self._trigger_exits(graph, trigger_nodes)
+        kept_nodes = [node_id for node_id in graph.nodes() if node_id not in trigger_nodes]
+        edges = EdgeArray()
+
+        for node_id in kept_nodes:
+            for succ in graph.successors(node_id):
+                if succ not in trigger_nodes:
+                    edges.append(node_id, succ)
+                    continue
+                for target_id in exits[succ]:
+                    if target_id != node_id:
+                        edges.append(node_id, target_id)
 
-        for node_id in graph.nodes():
-            if node_id not in trigger_nodes:
-                node_data = graph.get_node(node_id)
-                new_graph.add_node(node_id, **node_data)
-
-        for trigger_id in trigger_nodes:
-            incoming_nodes = [
-                node_id for node_id in graph.nodes()
-                if trigger_id in graph.adj.get(node_id, [])
-            ]
-            outgoing_nodes = graph.adj.get(trigger_id, [])
-
-            for from_node in incoming_nodes:
-                for to_node in outgoing_nodes:
-                    if (
-                        from_node not in trigger_nodes and
-                        to_node not in trigger_nodes and
-                        from_node in new_graph.nodes() and
-                        to_node in new_graph.nodes()
-                    ):
-                        new_graph.add_edge(from_node, to_node)
-
-        for node_id in graph.nodes():
-            if node_id not in trigger_nodes:
-                for target_id in graph.adj.get(node_id, []):
-                    if (
-                        target_id not in trigger_nodes and
-                        node_id in new_graph.nodes() and
-                        target_id in new_graph.nodes()
-                    ):
-                        new_graph.add_edge(node_id, target_id)
+        if isinstance(graph, CSRGraph):
+            return CSRGraph.from_edges(
+                kept_nodes, edges.sources, edges.targets, node_data=[graph.get_node(n) for n in kept_nodes]
+            )
 
+        new_graph = SimpleDiGraph()
+        for node_id in kept_nodes:
+            new_graph.add_node(node_id, graph.get_node(node_id))
+        for src, dst in edges:
+            new_graph.add_edge(src, dst)
         return new_graph
+
+    @staticmethod
+    def _trigger_exits(
+        graph: Union[SimpleDiGraph, CSRGraph],
+        trigger_nodes: set[int],
+    ) -> dict[int, frozenset[int]]:
+        """
+        Maps each trigger to the non-trigger nodes reachable from it through trigger-only paths.
+        Exit sets are immutable and shared: a trigger component that only forwards to one other
+        component reuses its set, so chains cost O(N + E) and only real fan-in pays for a union.
+        """
+        exits: dict[int, frozenset[int]] = {}
+        for component in graph.strongly_connected_components(within=trigger_nodes):
+            members = set(component)
+            direct: set[int] = set()
+            inherited: dict[int, frozenset[int]] = {}
+            for trigger_id in component:
+                for succ in graph.successors(trigger_id):
+                    if succ not in trigger_nodes:
+                        direct.add(succ)
+                    elif succ not in members:
+                        inherited[id(exits[succ])] = exits[succ]
+            if not direct and len(inherited) == 1:
+                reachable = next(iter(inherited.values()))
+            else:
+                reachable = frozenset(direct.union(*inherited.values()))
+            for trigger_id in component:
+                exits[trigger_id] = reachable
+        return exits
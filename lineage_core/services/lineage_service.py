@@ -1,12 +1,28 @@
-from typing import Optional
+from typing import (
+    Iterable,
+    Optional,
+    Union,
+)
 
+from omd_airflow_utils.lineage_core.adapters.cache.entity_store import (
+    SqliteEntityStore,
+)
+from omd_airflow_utils.lineage_core.adapters.config.config import (
+    CacheConfig,
+    GraphConfig,
+)
+from omd_airflow_utils.lineage_core.adapters.omd.async_omd_api_client import (
+    AsyncLineageAPIClient,
+)
 from omd_airflow_utils.lineage_core.adapters.omd.omd_api_client import (
     LineageAPIClient,
 )
 from omd_airflow_utils.lineage_core.domain.models import (
     DatabaseContext,
+    EdgePair,
     LineageEdge,
     Node,
+    NodeRecord,
 )
 from omd_airflow_utils.lineage_core.domain.types import (
     EntityPair,
@@ -17,6 +33,9 @@ from omd_airflow_utils.lineage_core.domain.use_cases import (
     LineageProcessingResult,
     LineageRequest,
 )
+from omd_airflow_utils.lineage_core.services.lineage_graph_builder import (
+    LineageGraphService,
+)
 from omd_airflow_utils.lineage_core.services.omd_use_cases.lineage_diff_calculator import (
     LineageSyncService,
 )
@@ -39,11 +58,33 @@ class LineageService:
         self._pair_generation_service = pair_generation_service
         self._sync_service = sync_service
 
+    @property
+    def metadata_service(self) -> LineageMetadataService:
+        return self._metadata_service
+
     @classmethod
-    def create_default(cls) -> 'LineageService':
+    def create_default(
+        cls,
+        entity_store: Optional[SqliteEntityStore] = None,
+        graph_config: Optional[GraphConfig] = None,
+        cache_config: Optional[CacheConfig] = None,
+    ) -> 'LineageService':
+        cache_config = cache_config or CacheConfig()
+        metadata_service = LineageMetadataService(
+            entity_store=entity_store,
+            negative_ttl_seconds=cache_config.negative_ttl_seconds,
+        )
+        graph_config = graph_config or GraphConfig()
+        graph_service = LineageGraphService(
+            engine=graph_config.engine,
+            csr_min_edges=graph_config.csr_min_edges,
+        )
         return cls(
-            metadata_service=LineageMetadataService(),
-            pair_generation_service=LineagePairGenerationService(),
+            metadata_service=metadata_service,
+            pair_generation_service=LineagePairGenerationService(
+                graph_service=graph_service,
+                metadata_service=metadata_service,
+            ),
             sync_service=LineageSyncService(),
         )
 
@@ -52,30 +93,26 @@ class LineageService:
         request: LineageRequest,
         client: LineageAPIClient
     ) -> LineageProcessingResult:
-        validated_sources = self._validate_entities(request.source_entities, 'source')
-        validated_targets = self._validate_entities(request.target_entities, 'target')
+        result = self._generate_request_pairs(request)
+        if not result.pairs:
+            return result
 
-        pairs = self._pair_generation_service.generate_pairs(
-            request.mapping, validated_sources, validated_targets
-        )
+        unique_entities = self._extract_unique_entities(result.pairs)
+        result.entity_cache = self._metadata_service.preload_entities(client, unique_entities)
+        return result
 
-        if not pairs:
-            return LineageProcessingResult(
-                pairs=[],
-                entity_cache={},
-                validated_sources=validated_sources,
-                validated_targets=validated_targets
-            )
+    async def prepare_lineage_processing_async(
+        self,
+        request: LineageRequest,
+        client: AsyncLineageAPIClient
+    ) -> LineageProcessingResult:
+        result = self._generate_request_pairs(request)
+        if not result.pairs:
+            return result
 
-        unique_entities = self._extract_unique_entities(pairs)
-        entity_cache = self._metadata_service.preload_entities(client, unique_entities)
-
-        return LineageProcessingResult(
-            pairs=pairs,
-            entity_cache=entity_cache,
-            validated_sources=validated_sources,
-            validated_targets=validated_targets
-        )
+        unique_entities = self._extract_unique_entities(result.pairs)
+        result.entity_cache = await self._metadata_service.preload_entities_async(client, unique_entities)
+        return result
 
     def process_lineage_sync(
         self,
@@ -87,13 +124,14 @@ class LineageService:
 
     def extract_graph_lineage(
             self,
-            nodes: list[Node],
-            edges: list[LineageEdge],
+            nodes: list[Union[Node, NodeRecord]],
+            edges: Iterable[Union[LineageEdge, EdgePair]],
             db_context: DatabaseContext,
             path_cutoff: int,
             collapse_triggers: bool = False,
             trigger_operator_id: int = None,
             client: Optional[LineageAPIClient] = None,
+            skip_schemas: Optional[list[str]] = None,
     ) -> list[EntityPair]:
         return self._pair_generation_service.extract_pairs_from_graph_paths(
             nodes=nodes,
@@ -103,6 +141,18 @@ class LineageService:
             validate_existence=True,
             collapse_triggers=collapse_triggers,
             trigger_operator_id=trigger_operator_id,
+            skip_schemas=skip_schemas,
+            path_cutoff=path_cutoff,
+        )
+
+    def prefetch_schemas(
+        self,
+        client: LineageAPIClient,
+        db_context: DatabaseContext,
+        schemas: list[str],
+    ) -> int:
+        return self._metadata_service.prefetch_schemas(
+            client, [db_context.schema_fqn(schema) for schema in schemas]
         )
 
     def resolve_entity_fqn(
@@ -113,6 +163,21 @@ class LineageService:
     ) -> str:
         return self._metadata_service.get_fqn_from_entity_id(entity_id, client, entity_type)
 
+    def _generate_request_pairs(self, request: LineageRequest) -> LineageProcessingResult:
+        validated_sources = self._validate_entities(request.source_entities, 'source')
+        validated_targets = self._validate_entities(request.target_entities, 'target')
+
+        pairs = self._pair_generation_service.generate_pairs(
+            request.mapping, validated_sources, validated_targets
+        )
+
+        return LineageProcessingResult(
+            pairs=pairs,
+            entity_cache={},
+            validated_sources=validated_sources,
+            validated_targets=validated_targets
+        )
+
     def _validate_entities(self, entities: list[TypedFQN], label: str) -> list[TypedFQN]:
         if entities:
             self._metadata_service.validate_entities(entities, label)
@@ -1,73 +1,212 @@
+import asyncio
 import logging
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from omd_airflow_utils.lineage_core.adapters.node_repository import NodeRepository
+from omd_airflow_utils.lineage_core.adapters.omd.async_omd_api_client import AsyncLineageAPIClient
+from omd_airflow_utils.lineage_core.adapters.omd.exceptions import EntityNotFoundError
 from omd_airflow_utils.lineage_core.adapters.omd.omd_api_client import LineageAPIClient
-from omd_airflow_utils.lineage_core.domain.models import Node, DatabaseContext
-from omd_airflow_utils.lineage_core.domain.types import EntityType
+from omd_airflow_utils.lineage_core.adapters.omd.omd_response_models import OMDResponseEntity
+from omd_airflow_utils.lineage_core.domain.models import Node, NodeDescriptions, DatabaseContext
+from omd_airflow_utils.lineage_core.domain.types import EntityType, TypedFQN
+from omd_airflow_utils.lineage_core.domain.use_cases import DescriptionSyncResult
+from omd_airflow_utils.lineage_core.services.omd_use_cases.lineage_metadata_cache import (
+    LineageMetadataService,
+)
+from omd_airflow_utils.lineage_core.utils.iter_utils import chunked
 
 logger = logging.getLogger(__name__)
 
 
 class DescriptionSyncService:
-    def __init__(self, node_repo: NodeRepository, omd_client: LineageAPIClient, db_context: DatabaseContext):
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        omd_client: LineageAPIClient,
+        db_context: DatabaseContext,
+        async_client_factory: Optional[Callable[[], AsyncLineageAPIClient]] = None,
+        metadata_service: Optional[LineageMetadataService] = None,
+        batch_size: int = 1000,
+        parallelism: int = 8,
+    ):
         self.node_repo = node_repo
         self.omd_client = omd_client
         self.db_context = db_context
+        self.async_client_factory = async_client_factory
+        self.metadata_service = metadata_service
+        self.batch_size = batch_size
+        self.parallelism = parallelism
 
-    def _get_column_index(self, table_fqn: str, column_name: str) -> Optional[int]:
-        """Fetches table details and finds the index of a column by its simple name."""
-        try:
-            table_entity = self.omd_client.get_entity(EntityType.TABLE, table_fqn)
+    def _fetch_table(self, table_fqn: str, fields: Optional[list[str]]) -> OMDResponseEntity:
+        """Fetches table with the given fields, through the shared metadata cache if available."""
+        if self.metadata_service:
+            return self.metadata_service.fetch_entity(
+                self.omd_client, TypedFQN(EntityType.TABLE, table_fqn), fields=fields
+            )
+        return self.omd_client.get_entity(EntityType.TABLE, table_fqn, fields=fields)
 
-            for i, col in enumerate(table_entity.columns):
-                if col.name == column_name:
-                    return i
+    async def _fetch_table_async(
+        self,
+        client: AsyncLineageAPIClient,
+        table_fqn: str,
+        fields: Optional[list[str]],
+    ) -> OMDResponseEntity:
+        if self.metadata_service:
+            return await self.metadata_service.fetch_entity_async(
+                client, TypedFQN(EntityType.TABLE, table_fqn), fields=fields
+            )
+        return await client.get_entity(EntityType.TABLE, table_fqn, fields=fields)
 
-            logger.warning('Column "%s" not found in table "%s" in OMD.', column_name, table_fqn)
-            return None
-        except Exception as e:
-            logger.error('Failed to get entity or find column index for %s.%s: %s', table_fqn, column_name, e)
-            return None
-
-    def sync_descriptions_for_nodes(self, nodes: List[Node]):
+    def sync_descriptions_for_nodes(self, nodes: List[Node]) -> DescriptionSyncResult:
         """
-        Iterates through nodes, fetches their descriptions from the source DB,
-        and updates them in OpenMetadata.
+        Loads descriptions from the source DB in batches of nodes and patches only
+        the descriptions that differ from OpenMetadata, one JSON Patch per table.
         """
         logger.info('Starting description sync for %d nodes.', len(nodes))
 
-        for i, node in enumerate(nodes, 1):
-            node_fqn = self.db_context.fqn(schema=node.db_schema, name=node.name)
-            logger.info('Processing node %d/%d: %s (id: %s)', i, len(nodes), node_fqn, node.id)
+        if self.async_client_factory:
+            result = asyncio.run(self._sync_descriptions_async(nodes))
+        else:
+            result = DescriptionSyncResult()
+            for batch in chunked(nodes, self.batch_size):
+                descriptions = self._fetch_batch_descriptions(batch)
+                if descriptions is None:
+                    result.failed += len(batch)
+                    continue
+                for node in batch:
+                    result.merge(self._sync_node(node, descriptions[node.id]))
 
-            table_description = node.description
-            if table_description:
-                try:
-                    self.omd_client.patch_table_description(node_fqn, table_description)
-                except Exception as e:
-                    logger.error('Failed to update table description for %s: %s', node_fqn, e)
+        logger.info(
+            'Description sync finished: %d patched, %d unchanged, %d failed.',
+            result.patched, result.skipped, result.failed,
+        )
+        return result
 
-            columns_descriptions = self.node_repo.fetch_columns_descriptions(node.id)
-            if not columns_descriptions:
-                continue
+    def _fetch_batch_descriptions(self, batch: List[Node]) -> Optional[dict[int, NodeDescriptions]]:
+        """Loads descriptions for a batch of nodes, or returns None if the query fails."""
+        try:
+            return self.node_repo.fetch_descriptions([node.id for node in batch])
+        except Exception as e:
+            logger.error('Failed to load descriptions for %d nodes: %s', len(batch), e)
+            return None
 
-            logger.info('Found %d column descriptions to sync for %s.', len(columns_descriptions), node_fqn)
-            for col_name, col_description in columns_descriptions.items():
-                if not col_description:
-                    continue
+    def _sync_node(self, node: Node, descriptions: NodeDescriptions) -> DescriptionSyncResult:
+        node_fqn = self.db_context.fqn(schema=node.db_schema, name=node.name)
+        table_description = descriptions.description or node.description
+        fields = self._required_fields(table_description, descriptions.columns)
+        if fields is None:
+            return DescriptionSyncResult()
+        try:
+            table_entity = self._fetch_table(node_fqn, fields)
+            operations, result = self._build_patch_operations(
+                node_fqn, table_description, descriptions.columns, table_entity
+            )
+            if operations:
+                self.omd_client.patch_entity(EntityType.TABLE, node_fqn, operations)
+            return result
+        except EntityNotFoundError:
+            logger.warning('Table "%s" not found in OMD.', node_fqn)
+        except Exception as e:
+            logger.error('Failed to update descriptions for %s: %s', node_fqn, e)
+        return DescriptionSyncResult(failed=1)
+
+    async def _sync_descriptions_async(self, nodes: List[Node]) -> DescriptionSyncResult:
+        """Streams description batches from the source DB into a bounded pool of patch workers."""
+        result = DescriptionSyncResult()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.parallelism * 2)
+
+        async def produce() -> None:
+            try:
+                for batch in chunked(nodes, self.batch_size):
+                    descriptions = await asyncio.to_thread(self._fetch_batch_descriptions, batch)
+                    if descriptions is None:
+                        result.failed += len(batch)
+                        continue
+                    for node in batch:
+                        await queue.put((node, descriptions[node.id]))
+            finally:
+                for _ in range(self.parallelism):
+                    await queue.put(None)
+
+        async def work(client: AsyncLineageAPIClient) -> None:
+            while (item := await queue.get()) is not None:
+                node, descriptions = item
+                result.merge(await self._sync_node_async(client, node, descriptions))
+
+        async with self.async_client_factory() as client:
+            await asyncio.gather(produce(), *(work(client) for _ in range(self.parallelism)))
+        return result
+
+    async def _sync_node_async(
+        self,
+        client: AsyncLineageAPIClient,
+        node: Node,
+        descriptions: NodeDescriptions,
+    ) -> DescriptionSyncResult:
+        node_fqn = self.db_context.fqn(schema=node.db_schema, name=node.name)
+        table_description = descriptions.description or node.description
+        fields = self._required_fields(table_description, descriptions.columns)
+        if fields is None:
+            return DescriptionSyncResult()
+        try:
+            table_entity = await self._fetch_table_async(client, node_fqn, fields)
+            operations, result = self._build_patch_operations(
+                node_fqn, table_description, descriptions.columns, table_entity
+            )
+            if operations:
+                await client.patch_entity(EntityType.TABLE, node_fqn, operations)
+            return result
+        except EntityNotFoundError:
+            logger.warning('Table "%s" not found in OMD.', node_fqn)
+        except Exception as e:
+            logger.error('Failed to update descriptions for %s: %s', node_fqn, e)
+        return DescriptionSyncResult(failed=1)
+
+    @staticmethod
+    def _required_fields(
+        table_description: Optional[str],
+        columns_descriptions: dict[str, str],
+    ) -> Optional[list[str]]:
+        """Returns entity fields needed to compare descriptions, or None if there is nothing to sync."""
+        if any(columns_descriptions.values()):
+            return ['columns']
+        if table_description:
+            return []
+        return None
+
+    @staticmethod
+    def _is_changed(current: Optional[str], desired: str) -> bool:
+        return (current or '').strip() != desired.strip()
+
+    def _build_patch_operations(
+        self,
+        table_fqn: str,
+        table_description: Optional[str],
+        columns_descriptions: Optional[dict[str, str]],
+        table_entity: OMDResponseEntity,
+    ) -> tuple[list[dict], DescriptionSyncResult]:
+        """Builds one JSON Patch with the table and column descriptions that differ from OMD."""
+        operations = []
+        result = DescriptionSyncResult()
+
+        if table_description:
+            if self._is_changed(table_entity.description, table_description):
+                operations.append({'op': 'add', 'path': '/description', 'value': table_description})
+            else:
+                result.skipped += 1
+
+        columns = {column.name: (i, column) for i, column in enumerate(table_entity.columns)}
+        for col_name, col_description in (columns_descriptions or {}).items():
+            if not col_description:
+                continue
+            if col_name not in columns:
+                logger.warning('Column "%s" not found in table "%s" in OMD.', col_name, table_fqn)
+                continue
+            index, column = columns[col_name]
+            if self._is_changed(column.description, col_description):
+                operations.append({'op': 'add', 'path': f'/columns/{index}/description', 'value': col_description})
+            else:
+                result.skipped += 1
 
-                col_index = self._get_column_index(node_fqn, col_name)
-
-                if col_index is not None:
-                    try:
-                        self.omd_client.patch_column_description_by_index(
-                            table_fqn=node_fqn,
-                            column_index=col_index,
-                            description=col_description
-                        )
-                    except Exception as e:
-                        logger.error(
-                            'Failed to update column "%s" (index %d) for table %s: %s',
-                            col_name, col_index, node_fqn, e
-                        )
\ No newline at end of file
+        result.patched = len(operations)
+        return operations, result
@@ -1,10 +1,27 @@
+import asyncio
+import logging
+import time
 from typing import (
+    Callable,
     Dict,
+    FrozenSet,
+    Iterable,
     List,
+    Optional,
+    Set,
     Tuple,
 )
 from airflow.exceptions import AirflowException
 
+from omd_airflow_utils.lineage_core.adapters.cache.entity_store import (
+    SqliteEntityStore,
+)
+from omd_airflow_utils.lineage_core.adapters.omd.async_omd_api_client import (
+    AsyncLineageAPIClient,
+)
+from omd_airflow_utils.lineage_core.adapters.omd.exceptions import (
+    EntityNotFoundError,
+)
 from omd_airflow_utils.lineage_core.adapters.omd.omd_api_client import (
     LineageAPIClient,
 )
@@ -19,29 +36,144 @@ from omd_airflow_utils.lineage_core.domain.registry import (
 )
 from omd_airflow_utils.lineage_core.domain.types import EntityType, TypedFQN
 
+logger = logging.getLogger(__name__)
 
-class EntityCache:
-    """Manages entity caching with FQN and ID mappings."""
 
-    def __init__(self):
+class EntityCache:
+    """Manages entity caching with FQN and ID mappings, known-missing FQNs and an optional persistent store."""
+
+    def __init__(
+        self,
+        store: Optional[SqliteEntityStore] = None,
+        negative_ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self._entity_cache: Dict[str, OMDResponseEntity] = {}
         self._id_to_fqn_cache: Dict[str, str] = {}
-
-    def get_entity(self, entity_type: EntityType, fqn: str) -> OMDResponseEntity:
+        self._store = store
+        self._entity_fields: Dict[str, Optional[FrozenSet[str]]] = {}
+        self._complete_schemas: Set[Tuple[EntityType, str]] = set()
+        self._listed_fqns: Set[Tuple[EntityType, str]] = set()
+        self._missing: Dict[str, float] = {}
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self.saved_lookups = 0
+
+    def get_entity(
+            self,
+            entity_type: EntityType,
+            fqn: str,
+            fields: Optional[Iterable[str]] = None,
+    ) -> Optional[OMDResponseEntity]:
+        """
+        Returns the cached entity. With `fields` (even empty) the entity must come from a direct fetch
+        with all of them: search hits, schema listings and stored entities only carry identity fields.
+        """
         cache_key = self._cache_key_fqn(entity_type, fqn)
-        return self._entity_cache.get(cache_key)
-
-    def cache_entity(self, entity_type: EntityType, fqn: str, entity: OMDResponseEntity) -> None:
+        entity = self._entity_cache.get(cache_key)
+        if entity is None and self._store:
+            entity = self._store.get(entity_type, fqn)
+            if entity is not None:
+                self._cache_in_memory(entity_type, fqn, entity, complete=False)
+        if entity is not None and fields is not None:
+            cached_fields = self._entity_fields.get(cache_key)
+            if cached_fields is None or not set(fields) <= cached_fields:
+                return None
+        return entity
+
+    def cache_entity(
+            self,
+            entity_type: EntityType,
+            fqn: str,
+            entity: OMDResponseEntity,
+            fields: Optional[Iterable[str]] = None,
+            complete: bool = True,
+    ) -> None:
+        """Caches an entity; `complete=False` marks stubs whose base fields (e.g. description) are unknown."""
+        self._cache_in_memory(entity_type, fqn, entity, fields, complete)
+        if self._store:
+            self._store.put(entity_type, fqn, entity)
+
+    def cache_schema_listing(
+            self,
+            entity_type: EntityType,
+            schema_fqn: str,
+            entities: List[OMDResponseEntity],
+            fields: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Caches a complete schema listing; FQNs absent from it are known to be missing."""
+        listed = [(entity.fully_qualified_name, entity) for entity in entities if entity.fully_qualified_name]
+        for fqn, entity in listed:
+            self._cache_in_memory(entity_type, fqn, entity, fields, complete=False)
+            self._listed_fqns.add((entity_type, fqn.lower()))
+        if self._store:
+            self._store.put_many(entity_type, listed)
+        self._complete_schemas.add((entity_type, schema_fqn.lower()))
+
+    def is_schema_complete(self, entity_type: EntityType, schema_fqn: str) -> bool:
+        return (entity_type, schema_fqn.lower()) in self._complete_schemas
+
+    def mark_missing(self, entity_type: EntityType, fqns: Iterable[str], persist: bool = True) -> None:
+        """
+        Remembers FQNs missing in OMD so they are not requested again. Only misses confirmed by a direct
+        request should be persisted: the search index may lag behind ingestion.
+        """
+        fqns = list(fqns)
+        now = self._clock()
+        for fqn in fqns:
+            self._missing[self._cache_key_fqn(entity_type, fqn)] = now
+        if persist and self._store and fqns:
+            self._store.put_missing(entity_type, fqns)
+
+    def is_known_missing(self, entity_type: EntityType, fqn: str) -> bool:
+        """Checks schema listings and the negative cache; each hit counts as a saved lookup."""
+        missing = self._is_absent_from_listing(entity_type, fqn) or self._is_negatively_cached(entity_type, fqn)
+        if missing:
+            self.saved_lookups += 1
+        return missing
+
+    def _is_absent_from_listing(self, entity_type: EntityType, fqn: str) -> bool:
+        schema_fqn = fqn.rsplit('.', 1)[0]
+        return (
+            self.is_schema_complete(entity_type, schema_fqn)
+            and (entity_type, fqn.lower()) not in self._listed_fqns
+        )
+
+    def _is_negatively_cached(self, entity_type: EntityType, fqn: str) -> bool:
+        cache_key = self._cache_key_fqn(entity_type, fqn)
+        marked_at = self._missing.get(cache_key)
+        if marked_at is not None:
+            if self._negative_ttl_seconds is None or self._clock() - marked_at <= self._negative_ttl_seconds:
+                return True
+            del self._missing[cache_key]
+        return bool(self._store and self._store.is_missing(entity_type, fqn))
+
+    def _cache_in_memory(
+            self,
+            entity_type: EntityType,
+            fqn: str,
+            entity: OMDResponseEntity,
+            fields: Optional[Iterable[str]] = None,
+            complete: bool = True,
+    ) -> None:
         cache_key = self._cache_key_fqn(entity_type, fqn)
+        if not complete and self._entity_fields.get(cache_key) is not None:
+            return
         self._entity_cache[cache_key] = entity
+        self._entity_fields[cache_key] = frozenset(fields or ()) if complete else None
+        self._missing.pop(cache_key, None)
 
         if entity.id and entity.fully_qualified_name:
             self._id_to_fqn_cache[entity.id] = entity.fully_qualified_name
             canonical_key = self._cache_key_fqn(entity_type, entity.fully_qualified_name)
             self._entity_cache[canonical_key] = entity
+            self._entity_fields[canonical_key] = self._entity_fields[cache_key]
 
     def get_fqn_by_id(self, entity_id: str) -> str:
-        return self._id_to_fqn_cache.get(entity_id)
+        fqn = self._id_to_fqn_cache.get(entity_id)
+        if fqn is None and self._store:
+            fqn = self._store.get_fqn_by_id(entity_id)
+        return fqn
 
     def cache_fqn_mapping(self, entity_id: str, fqn: str) -> None:
         self._id_to_fqn_cache[entity_id] = fqn
@@ -78,12 +210,44 @@ class EntityFetcher:
     def __init__(self, cache: EntityCache):
         self._cache = cache
 
-    def fetch_entity(self, client: LineageAPIClient, entity: TypedFQN) -> OMDResponseEntity:
-        """Fetches single entity and caches result."""
-        result = client.get_entity(entity_type=entity.type, fqn=entity.fqn)
-        self._cache.cache_entity(entity.type, entity.fqn, result)
+    def fetch_entity(
+            self,
+            client: LineageAPIClient,
+            entity: TypedFQN,
+            fields: Optional[List[str]] = None,
+    ) -> OMDResponseEntity:
+        """Fetches single entity with the given extra fields and caches result (or its absence)."""
+        self._raise_if_known_missing(entity)
+        try:
+            result = client.get_entity(entity_type=entity.type, fqn=entity.fqn, fields=fields)
+        except EntityNotFoundError:
+            self._cache.mark_missing(entity.type, [entity.fqn])
+            raise
+        self._cache.cache_entity(entity.type, entity.fqn, result, fields)
+        return result
+
+    async def fetch_entity_async(
+            self,
+            client: AsyncLineageAPIClient,
+            entity: TypedFQN,
+            fields: Optional[List[str]] = None,
+    ) -> OMDResponseEntity:
+        """Fetches single entity through the async client and caches result (or its absence)."""
+        self._raise_if_known_missing(entity)
+        try:
+            result = await client.get_entity(entity_type=entity.type, fqn=entity.fqn, fields=fields)
+        except EntityNotFoundError:
+            self._cache.mark_missing(entity.type, [entity.fqn])
+            raise
+        self._cache.cache_entity(entity.type, entity.fqn, result, fields)
         return result
 
+    def _raise_if_known_missing(self, entity: TypedFQN) -> None:
+        if self._cache.is_known_missing(entity.type, entity.fqn):
+            raise EntityNotFoundError(
+                f'{entity.type.value.capitalize()} with FQN {entity.fqn} not found (cached)'
+            )
+
     def fetch_entity_by_id(self, client: LineageAPIClient, entity_type: EntityType,
                            entity_id: str) -> OMDResponseEntity:
         """Fetches entity by ID and caches FQN mapping."""
@@ -105,8 +269,14 @@ class EntityFetcher:
 class LineageMetadataService:
     """Main service for entity metadata operations with caching and validation."""
 
-    def __init__(self, entity_path_resolver: IEntityPathResolver = None):
-        self._cache = EntityCache()
+    def __init__(
+        self,
+        entity_path_resolver: IEntityPathResolver = None,
+        entity_store: Optional[SqliteEntityStore] = None,
+        negative_ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._cache = EntityCache(entity_store, negative_ttl_seconds, clock)
         self._validator = EntityValidator(entity_path_resolver or EntityRegistryPathResolver())
         self._fetcher = EntityFetcher(self._cache)
 
@@ -114,32 +284,171 @@ class LineageMetadataService:
         """Validates entity structure and types."""
         self._validator.validate_entities(entities, label)
 
+    def fetch_entity(
+            self,
+            client: LineageAPIClient,
+            entity: TypedFQN,
+            fields: Optional[List[str]] = None,
+    ) -> OMDResponseEntity:
+        """Returns a cached entity with the requested fields or fetches it; raises for known-missing ones."""
+        cached_entity = self._cache.get_entity(entity.type, entity.fqn, fields)
+        if cached_entity:
+            return cached_entity
+        return self._fetcher.fetch_entity(client, entity, fields)
+
+    async def fetch_entity_async(
+            self,
+            client: AsyncLineageAPIClient,
+            entity: TypedFQN,
+            fields: Optional[List[str]] = None,
+    ) -> OMDResponseEntity:
+        """Async variant of fetch_entity."""
+        cached_entity = self._cache.get_entity(entity.type, entity.fqn, fields)
+        if cached_entity:
+            return cached_entity
+        return await self._fetcher.fetch_entity_async(client, entity, fields)
+
+    @property
+    def saved_lookups(self) -> int:
+        return self._cache.saved_lookups
+
+    def log_stats(self) -> None:
+        logger.info('Negative entity cache saved %d lookups', self.saved_lookups)
+
     def preload_entities(
             self,
             client: LineageAPIClient,
             entities: List[TypedFQN],
+            fields: Optional[List[str]] = None,
     ) -> Dict[Tuple[str, str], OMDResponseEntity]:
-        """Preloads entities with caching support."""
+        """Preloads entities with caching support; by default only base fields (ID, FQN) are fetched."""
+        cache, entities_to_fetch = self._split_cached(entities, fields)
+        client.resolver.remember_entities(cache.values())
+
+        for entity in entities_to_fetch:
+            key = (entity.type.value, entity.fqn)
+            try:
+                result = self._fetcher.fetch_entity(client, entity, fields)
+                cache[key] = result
+            except AirflowException:
+                raise
+
+        return cache
+
+    def fetch_existing_entities(
+            self,
+            client: LineageAPIClient,
+            entities: List[TypedFQN],
+    ) -> Dict[Tuple[str, str], OMDResponseEntity]:
+        """Returns entities present in OMD, looking up uncached ones in bulk; missing entities are skipped."""
+        cache, entities_to_fetch = self._split_cached(entities)
+        client.resolver.remember_entities(cache.values())
+
+        fqns_by_type: Dict[EntityType, List[str]] = {}
+        known_missing = 0
+        for entity in entities_to_fetch:
+            if self._cache.is_known_missing(entity.type, entity.fqn):
+                known_missing += 1
+                continue
+            fqns_by_type.setdefault(entity.type, []).append(entity.fqn)
+        if known_missing:
+            logger.info('Skipped %d entities absent from prefetched schemas', known_missing)
+
+        for entity_type, fqns in fqns_by_type.items():
+            try:
+                lookup = client.find_entities_by_fqns(entity_type, fqns)
+            except Exception as e:
+                logger.warning('Bulk lookup of %d %s entities failed, checking one by one: %s',
+                               len(fqns), entity_type.value, e)
+                self._fetch_one_by_one(client, entity_type, fqns, cache)
+                continue
+
+            for fqn, result in lookup.found.items():
+                self._cache.cache_entity(entity_type, fqn, result, complete=False)
+                cache[(entity_type.value, fqn)] = result
+
+            if not lookup.missing:
+                continue
+            if client.config.search.verify_missing:
+                self._fetch_one_by_one(client, entity_type, lookup.missing, cache)
+            else:
+                self._cache.mark_missing(entity_type, lookup.missing, persist=False)
+
+        return cache
+
+    def _fetch_one_by_one(
+            self,
+            client: LineageAPIClient,
+            entity_type: EntityType,
+            fqns: Iterable[str],
+            cache: Dict[Tuple[str, str], OMDResponseEntity],
+    ) -> None:
+        """Confirms entities absent from a bulk lookup with direct requests, skipping missing ones."""
+        for fqn in fqns:
+            try:
+                cache[(entity_type.value, fqn)] = self._fetcher.fetch_entity(client, TypedFQN(entity_type, fqn))
+            except EntityNotFoundError:
+                logger.debug('Entity %s not found in OMD', fqn)
+
+    def prefetch_schemas(
+            self,
+            client: LineageAPIClient,
+            schema_fqns: List[str],
+            entity_type: EntityType = EntityType.TABLE,
+    ) -> int:
+        """Lists whole schemas into the cache so lookups within them need no further requests."""
+        fields = client.config.prefetch.fields
+        prefetched = 0
+        for schema_fqn in schema_fqns:
+            if self._cache.is_schema_complete(entity_type, schema_fqn):
+                continue
+            try:
+                entities = client.list_schema_entities(entity_type, schema_fqn, fields=fields)
+            except Exception as e:
+                logger.warning('Failed to prefetch schema %s, falling back to per-entity lookups: %s', schema_fqn, e)
+                continue
+            self._cache.cache_schema_listing(entity_type, schema_fqn, entities, fields)
+            prefetched += len(entities)
+
+        logger.info('Prefetched %d %s entities from %d schemas', prefetched, entity_type.value, len(schema_fqns))
+        return prefetched
+
+    async def preload_entities_async(
+            self,
+            client: AsyncLineageAPIClient,
+            entities: List[TypedFQN],
+            fields: Optional[List[str]] = None,
+    ) -> Dict[Tuple[str, str], OMDResponseEntity]:
+        """Preloads entities concurrently; concurrency is bounded by the client."""
+        cache, entities_to_fetch = self._split_cached(entities, fields)
+        client.resolver.remember_entities(cache.values())
+
+        results = await asyncio.gather(
+            *(self._fetcher.fetch_entity_async(client, entity, fields) for entity in entities_to_fetch)
+        )
+        for entity, result in zip(entities_to_fetch, results):
+            cache[(entity.type.value, entity.fqn)] = result
+
+        return cache
+
+    def _split_cached(
+            self,
+            entities: List[TypedFQN],
+            fields: Optional[List[str]] = None,
+    ) -> Tuple[Dict[Tuple[str, str], OMDResponseEntity], List[TypedFQN]]:
+        """Splits entities into already cached ones (with the requested fields) and those still to fetch."""
         cache: Dict[Tuple[str, str], OMDResponseEntity] = {}
         entities_to_fetch = []
 
         for entity in entities:
-            cached_entity = self._cache.get_entity(entity.type, entity.fqn)
+            cached_entity = self._cache.get_entity(entity.type, entity.fqn, fields)
             if cached_entity:
                 key = (entity.type.value, entity.fqn)
                 cache[key] = cached_entity
             else:
                 entities_to_fetch.append(entity)
 
-        for entity in entities_to_fetch:
-            key = (entity.type.value, entity.fqn)
-            try:
-                result = self._fetcher.fetch_entity(client, entity)
-                cache[key] = result
-            except AirflowException:
-                raise
-
-        return cache
+        return cache, entities_to_fetch
 
     def get_fqn_from_entity_id(
             self,
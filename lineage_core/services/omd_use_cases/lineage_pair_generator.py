@@ -1,6 +1,6 @@
 import logging
 from itertools import product
-from typing import List, Optional
+from typing import Iterable, List, Optional, Union
 
 from airflow.exceptions import AirflowException
 
@@ -9,8 +9,12 @@ from omd_airflow_utils.lineage_core.adapters.omd.omd_api_client import (
 )
 from omd_airflow_utils.lineage_core.domain.models import (
     DatabaseContext,
+    EdgeArray,
+    EdgePair,
     LineageEdge,
     Node,
+    NodeRecord,
+    edge_endpoints,
 )
 from omd_airflow_utils.lineage_core.domain.types import (
     EntityPair,
@@ -21,14 +25,22 @@ from omd_airflow_utils.lineage_core.domain.types import (
 from omd_airflow_utils.lineage_core.services.lineage_graph_builder import (
     LineageGraphService,
 )
+from omd_airflow_utils.lineage_core.services.omd_use_cases.lineage_metadata_cache import (
+    LineageMetadataService,
+)
 
 logger = logging.getLogger(__name__)
 
 class LineagePairGenerationService:
     """Generates lineage pairs from explicit mappings or inferred graph paths."""
 
-    def __init__(self, graph_service: Optional[LineageGraphService] = None):
+    def __init__(
+        self,
+        graph_service: Optional[LineageGraphService] = None,
+        metadata_service: Optional[LineageMetadataService] = None,
+    ):
         self._graph_service = graph_service or LineageGraphService()
+        self._metadata_service = metadata_service or LineageMetadataService()
 
     def generate_pairs(
         self,
@@ -51,18 +63,28 @@ class LineagePairGenerationService:
 
     def extract_pairs_from_graph_paths(
             self,
-            nodes: List[Node],
-            edges: List[LineageEdge],
+            nodes: List[Union[Node, NodeRecord]],
+            edges: Iterable[Union[LineageEdge, EdgePair]],
             db_context: DatabaseContext,
             client: Optional[LineageAPIClient] = None,
             validate_existence: bool = True,
             collapse_triggers: bool = False,
             trigger_operator_id: Optional[int] = None,
+            skip_schemas: Optional[Iterable[str]] = None,
+            path_cutoff: int = 20,
     ) -> List[EntityPair]:
-        """Extracts only direct lineage pairs from graph edges (no transitive links)."""
+        """
+        Extracts lineage pairs from graph edges. Without `skip_schemas` only direct edges are used;
+        with it, nodes of those schemas become intermediate layers that are bridged by pairs
+        between the remaining nodes connected within `path_cutoff` hops.
+        """
+        skip_schemas = set(skip_schemas or ())
+        skipped_ids = {node.id for node in nodes if node.db_schema in skip_schemas}
 
         if validate_existence and client:
-            nodes, edges = self.filter_existing_nodes_only(nodes, edges, client, db_context)
+            nodes, edges = self.filter_existing_nodes_only(
+                nodes, edges, client, db_context, keep_node_ids=skipped_ids
+            )
             if not nodes:
                 return []
 
@@ -76,10 +98,16 @@ class LineagePairGenerationService:
         except Exception as e:
             raise AirflowException(f'Failed to build lineage graph: {e}')
 
+        condensation = self._graph_service.condense(graph)
+        if skipped_ids:
+            graph_edges = self._graph_service.transitive_edges(graph, skipped_ids, path_cutoff, condensation)
+        else:
+            graph_edges = graph.edges()
+
         id_to_node = {node.id: node for node in nodes}
         pairs: set[EntityPair] = set()
 
-        for from_id, to_id in graph.edges():
+        for from_id, to_id in graph_edges:
             from_node = id_to_node.get(from_id)
             to_node = id_to_node.get(to_id)
             if not from_node or not to_node:
@@ -93,28 +121,34 @@ class LineagePairGenerationService:
 
     def filter_existing_nodes_only(
         self,
-        nodes: List[Node],
-        edges: List[LineageEdge],
+        nodes: List[Union[Node, NodeRecord]],
+        edges: Iterable[Union[LineageEdge, EdgePair]],
         client: LineageAPIClient,
-        db_context: DatabaseContext
-    ) -> tuple[List[Node], List[LineageEdge]]:
-        """Removes nodes and edges for entities not present in OMD."""
-        existing_nodes = []
-        valid_node_ids = set()
-
-        for node in nodes:
-            fqn = db_context.fqn(schema=node.db_schema, name=node.name)
-            try:
-                client.get_entity(entity_type=EntityType.TABLE, fqn=fqn)
-                existing_nodes.append(node)
-                valid_node_ids.add(node.id)
-            except AirflowException as e:
-                if '404' not in str(e):
-                    raise
-
-        valid_edges = [
-            edge for edge in edges
-            if int(edge.from_entity.id) in valid_node_ids and int(edge.to_entity.id) in valid_node_ids
-        ]
+        db_context: DatabaseContext,
+        keep_node_ids: Optional[set[int]] = None,
+    ) -> tuple[List[Union[Node, NodeRecord]], EdgeArray]:
+        """
+        Removes nodes and edges for entities not present in OMD; fetched entities stay cached for preloading.
+        Nodes in `keep_node_ids` are kept without an existence check.
+        """
+        keep_node_ids = keep_node_ids or set()
+        node_entities = {
+            node.id: TypedFQN(EntityType.TABLE, db_context.fqn(schema=node.db_schema, name=node.name))
+            for node in nodes
+            if node.id not in keep_node_ids
+        }
+        existing = self._metadata_service.fetch_existing_entities(client, list(node_entities.values()))
+
+        valid_node_ids = {
+            node_id for node_id, entity in node_entities.items()
+            if (entity.type.value, entity.fqn) in existing
+        }
+        valid_node_ids.update(node.id for node in nodes if node.id in keep_node_ids)
+        existing_nodes = [node for node in nodes if node.id in valid_node_ids]
+
+        valid_edges = EdgeArray(
+            endpoints for endpoints in map(edge_endpoints, edges)
+            if valid_node_ids.issuperset(endpoints)
+        )
 
         return existing_nodes, valid_edges
@@ -0,0 +1,214 @@
+import logging
+from typing import (
+    Any,
+    Iterable,
+    Optional,
+    Sequence,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from omd_airflow_utils.lineage_core.utils.graph_algorithms import (
+    Condensation,
+    strongly_connected_components,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+class CSRGraph:
+    """Immutable directed graph in compressed sparse row form, built in bulk from edge arrays."""
+
+    def __init__(
+        self,
+        node_ids: 'np.ndarray',
+        indptr: 'np.ndarray',
+        indices: 'np.ndarray',
+        rev_indptr: 'np.ndarray',
+        rev_indices: 'np.ndarray',
+        node_data: Optional[list[Any]] = None,
+    ):
+        self.node_ids = node_ids
+        self.indptr = indptr
+        self.indices = indices
+        self.rev_indptr = rev_indptr
+        self.rev_indices = rev_indices
+        self._node_data = node_data
+
+    @classmethod
+    def from_edges(
+        cls,
+        node_ids: Sequence[int],
+        sources: Sequence[int],
+        targets: Sequence[int],
+        node_data: Optional[Sequence[Any]] = None,
+    ) -> 'CSRGraph':
+        """Builds the graph; duplicate edges and edges with endpoints outside `node_ids` are dropped."""
+        if np is None:
+            raise ImportError('numpy is required for the CSR graph engine')
+
+        ids, first_positions = np.unique(np.asarray(node_ids, dtype=np.int64), return_index=True)
+        data = [node_data[i] for i in first_positions.tolist()] if node_data is not None else None
+        count = len(ids)
+        index_dtype = np.int32 if count < 2 ** 31 else np.int64
+
+        src = cls._positions(ids, np.asarray(sources, dtype=np.int64))
+        dst = cls._positions(ids, np.asarray(targets, dtype=np.int64))
+        known = (src >= 0) & (dst >= 0)
+        keys = np.sort(src[known] * count + dst[known])
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))] if len(keys) else keys
+        src, dst = keys // max(count, 1), keys % max(count, 1)
+
+        indptr = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=count), out=indptr[1:])
+        rev_order = np.lexsort((src, dst))
+        rev_indptr = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(dst, minlength=count), out=rev_indptr[1:])
+
+        return cls(
+            node_ids=ids,
+            indptr=indptr,
+            indices=dst.astype(index_dtype),
+            rev_indptr=rev_indptr,
+            rev_indices=src[rev_order].astype(index_dtype),
+            node_data=data,
+        )
+
+    @staticmethod
+    def _positions(ids: 'np.ndarray', values: 'np.ndarray') -> 'np.ndarray':
+        """Maps node IDs to row indices, -1 for IDs that are not in the graph."""
+        positions = np.searchsorted(ids, values)
+        positions[positions == len(ids)] = 0
+        found = ids[positions] == values if len(ids) else np.zeros(len(values), dtype=bool)
+        return np.where(found, positions, -1)
+
+    def _index(self, node_id: int) -> int:
+        position = int(np.searchsorted(self.node_ids, node_id))
+        if position == len(self.node_ids) or self.node_ids[position] != node_id:
+            raise KeyError(f'Node with ID {node_id} not found.')
+        return position
+
+    def index_of(self, node_ids: Iterable[int]) -> 'np.ndarray':
+        """Returns row indices of the given node IDs, skipping IDs that are not in the graph."""
+        positions = self._positions(self.node_ids, np.fromiter(node_ids, dtype=np.int64))
+        return positions[positions >= 0]
+
+    @staticmethod
+    def _gather(indptr: 'np.ndarray', indices: 'np.ndarray', rows: 'np.ndarray') -> 'np.ndarray':
+        """Concatenates the neighbour rows of `rows` without a Python-level loop."""
+        starts = indptr[rows]
+        counts = indptr[rows + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return np.empty(0, dtype=indices.dtype)
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        return indices[offsets]
+
+    def has_node(self, node_id: int) -> bool:
+        try:
+            self._index(node_id)
+        except KeyError:
+            return False
+        return True
+
+    def has_edge(self, src: int, dst: int) -> bool:
+        if not self.has_node(src) or not self.has_node(dst):
+            return False
+        row, column = self._index(src), self._index(dst)
+        neighbors = self.indices[self.indptr[row]:self.indptr[row + 1]]
+        position = np.searchsorted(neighbors, column)
+        return bool(position < len(neighbors) and neighbors[position] == column)
+
+    def nodes(self) -> list[int]:
+        return self.node_ids.tolist()
+
+    def get_node(self, node_id: int) -> Any:
+        index = self._index(node_id)
+        return self._node_data[index] if self._node_data is not None else None
+
+    def successors(self, node_id: int) -> list[int]:
+        row = self._index(node_id)
+        return self.node_ids[self.indices[self.indptr[row]:self.indptr[row + 1]]].tolist()
+
+    def predecessors(self, node_id: int) -> list[int]:
+        row = self._index(node_id)
+        return self.node_ids[self.rev_indices[self.rev_indptr[row]:self.rev_indptr[row + 1]]].tolist()
+
+    def out_degrees(self) -> 'np.ndarray':
+        return np.diff(self.indptr)
+
+    def in_degrees(self) -> 'np.ndarray':
+        return np.diff(self.rev_indptr)
+
+    def in_degree(self) -> dict[int, int]:
+        return dict(zip(self.node_ids.tolist(), self.in_degrees().tolist()))
+
+    def out_degree(self) -> dict[int, int]:
+        return dict(zip(self.node_ids.tolist(), self.out_degrees().tolist()))
+
+    def number_of_nodes(self) -> int:
+        return len(self.node_ids)
+
+    def number_of_edges(self) -> int:
+        return len(self.indices)
+
+    def edge_index_arrays(self) -> tuple['np.ndarray', 'np.ndarray']:
+        """Returns (source, target) row indices of all edges."""
+        return np.repeat(np.arange(len(self.node_ids)), self.out_degrees()), self.indices
+
+    def edges(self) -> list[tuple[int, int]]:
+        src, dst = self.edge_index_arrays()
+        return list(zip(self.node_ids[src].tolist(), self.node_ids[dst].tolist()))
+
+    def sources(self) -> set[int]:
+        return set(self.node_ids[self.in_degrees() == 0].tolist())
+
+    def sinks(self) -> set[int]:
+        return set(self.node_ids[self.out_degrees() == 0].tolist())
+
+    def strongly_connected_components(self, within: Optional[set[int]] = None) -> list[list[int]]:
+        """Returns SCCs in reverse topological order, optionally of the subgraph `within`."""
+        return strongly_connected_components(self.nodes(), self.successors, within)
+
+    def condensation(self) -> Condensation:
+        """Returns the DAG of strongly connected components."""
+        return Condensation.from_graph(self.nodes(), self.successors)
+
+    def bfs(
+        self,
+        start_ids: Iterable[int],
+        reverse: bool = False,
+        max_depth: Optional[int] = None,
+    ) -> 'np.ndarray':
+        """Returns IDs of nodes reachable from `start_ids` (included), downstream or upstream."""
+        indptr, indices = (self.rev_indptr, self.rev_indices) if reverse else (self.indptr, self.indices)
+        visited = np.zeros(len(self.node_ids), dtype=bool)
+        frontier = self.index_of(start_ids)
+        visited[frontier] = True
+        depth = 0
+        while frontier.size and (max_depth is None or depth < max_depth):
+            neighbors = self._gather(indptr, indices, frontier)
+            frontier = np.unique(neighbors[~visited[neighbors]])
+            visited[frontier] = True
+            depth += 1
+        return self.node_ids[visited]
+
+    def weakly_connected_components(self) -> 'np.ndarray':
+        """Labels each row with the smallest row index of its weakly connected component."""
+        labels = np.arange(len(self.node_ids))
+        src, dst = self.edge_index_arrays()
+        while True:
+            updated = labels.copy()
+            np.minimum.at(updated, src, labels[dst])
+            np.minimum.at(updated, dst, labels[src])
+            updated = updated[updated]
+            if np.array_equal(updated, labels):
+                return labels
+            labels = updated
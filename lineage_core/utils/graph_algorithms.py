@@ -0,0 +1,113 @@
+from typing import (
+    Callable,
+    Iterable,
+    Optional,
+)
+
+
+def strongly_connected_components(
+    nodes: Iterable[int],
+    successors: Callable[[int], Iterable[int]],
+    within: Optional[set[int]] = None,
+) -> list[list[int]]:
+    """Returns SCCs in reverse topological order (iterative Tarjan), optionally of the subgraph `within`."""
+    index: dict[int, int] = {}
+    lowlink: dict[int, int] = {}
+    stack: list[int] = []
+    on_stack: set[int] = set()
+    components: list[list[int]] = []
+
+    for root in nodes if within is None else within:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors(root)))]
+        while work:
+            node, node_successors = work[-1]
+            for succ in node_successors:
+                if within is not None and succ not in within:
+                    continue
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(successors(succ))))
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+class Condensation:
+    """
+    DAG of strongly connected components. Components are numbered in reverse topological
+    order, so every successor of a component has a smaller number than the component itself.
+    """
+
+    def __init__(self, components: list[list[int]], successors: list[set[int]], cyclic: set[int]):
+        self.components = components
+        self.successors = successors
+        self.cyclic = cyclic
+        self.component_of = {
+            node_id: index for index, members in enumerate(components) for node_id in members
+        }
+        self.predecessors: list[set[int]] = [set() for _ in components]
+        for index, succs in enumerate(successors):
+            for succ_index in succs:
+                self.predecessors[succ_index].add(index)
+
+    @classmethod
+    def from_graph(cls, nodes: Iterable[int], successors: Callable[[int], Iterable[int]]) -> 'Condensation':
+        components = strongly_connected_components(nodes, successors)
+        component_of = {node_id: index for index, members in enumerate(components) for node_id in members}
+        dag_successors: list[set[int]] = [set() for _ in components]
+        cyclic = set()
+        for index, members in enumerate(components):
+            if len(members) > 1:
+                cyclic.add(index)
+            for node_id in members:
+                for succ in successors(node_id):
+                    succ_index = component_of[succ]
+                    if succ_index != index:
+                        dag_successors[index].add(succ_index)
+                    elif succ == node_id:
+                        cyclic.add(index)
+        return cls(components, dag_successors, cyclic)
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def cycles(self) -> list[list[int]]:
+        """Returns node IDs of every cycle, self-loops included."""
+        return [self.components[index] for index in sorted(self.cyclic)]
+
+    def topological_order(self) -> Iterable[int]:
+        """Component numbers ordered so that each component precedes its successors."""
+        return reversed(range(len(self.components)))
+
+    def generations(self) -> list[list[int]]:
+        """Partitions components into layers by longest path from a source component."""
+        depth = [0] * len(self.components)
+        for index in self.topological_order():
+            for succ_index in self.successors[index]:
+                depth[succ_index] = max(depth[succ_index], depth[index] + 1)
+        layers: list[list[int]] = [[] for _ in range(max(depth, default=-1) + 1)]
+        for index, layer in enumerate(depth):
+            layers[layer].append(index)
+        return layers
@@ -0,0 +1,17 @@
+from itertools import islice
+from typing import (
+    Iterable,
+    Iterator,
+    TypeVar,
+)
+
+T = TypeVar('T')
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yields consecutive lists of at most `size` items."""
+    if size < 1:
+        raise ValueError('size must be at least 1')
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUS_CODES = {HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.warning('Unparseable Retry-After header: %s', value)
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveTokenBucket:
+    """Thread-safe token bucket whose refill rate adapts to server throttling (AIMD)."""
+
+    def __init__(
+        self,
+        calls_per_second: float,
+        burst: int,
+        adaptive: bool = True,
+        min_calls_per_second: float = 1.0,
+        max_calls_per_second: float = 50.0,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._burst = burst
+        self._adaptive = adaptive
+        self._min_rate = min_calls_per_second
+        self._max_rate = max_calls_per_second
+        self._increase_step = increase_step
+        self._decrease_factor = decrease_factor
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rate = calls_per_second
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def reserve(self) -> float:
+        """Takes one token and returns how long the caller must wait before sending."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_response(self, status_code: int, retry_after: Optional[float] = None) -> None:
+        """Shrinks the rate on 429/503 responses and grows it back on successful ones."""
+        if not self._adaptive:
+            return
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if status_code in THROTTLE_STATUS_CODES:
+                self._rate = max(self._min_rate, self._rate * self._decrease_factor)
+                self._tokens = min(self._tokens, 0.0)
+                if retry_after:
+                    self._blocked_until = max(self._blocked_until, now + retry_after)
+                logger.warning(
+                    'OMD throttled request (status %s), rate lowered to %.2f rps', status_code, self._rate
+                )
+            elif status_code < HTTPStatus.INTERNAL_SERVER_ERROR:
+                self._rate = min(self._max_rate, self._rate + self._increase_step)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if elapsed > 0:
+            self._tokens = min(float(self._burst), self._tokens + elapsed * self._rate)
+
+
+class RateLimiterRegistry:
+    """Keeps one rate limiter per OMD host, shared by every client in the process."""
+
+    _limiters: dict[str, tuple[AdaptiveTokenBucket, dict[str, Any]]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, key: str, **limits: Any) -> AdaptiveTokenBucket:
+        """Returns the host limiter; `limits` are AdaptiveTokenBucket arguments used on first request."""
+        with cls._lock:
+            registered = cls._limiters.get(key)
+            if registered is None:
+                limiter = AdaptiveTokenBucket(**limits)
+                cls._limiters[key] = (limiter, limits)
+                return limiter
+            limiter, registered_limits = registered
+            if registered_limits != limits:
+                logger.warning(
+                    'Rate limiter for "%s" is already registered with %s, ignoring %s',
+                    key, registered_limits, limits,
+                )
+            return limiter
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._limiters.clear()
@@ -0,0 +1,236 @@
+import base64
+import json
+import random
+import sys
+from array import array
+from typing import (
+    Any,
+    Iterable,
+    Union,
+)
+
+from omd_airflow_utils.lineage_core.utils.csr_graph import CSRGraph
+from omd_airflow_utils.lineage_core.utils.graph_algorithms import Condensation
+from omd_airflow_utils.lineage_core.utils.simple_graph import SimpleDiGraph
+
+INDEX_FORMAT_VERSION = 2
+
+_INT32 = 'i' if array('i').itemsize == 4 else 'l'
+
+
+def _int32_array(values: Iterable[int] = ()) -> array:
+    return array(_INT32, values)
+
+
+def _encode(values: Iterable[int]) -> str:
+    """Encodes integers as little-endian int32, independent of the host platform."""
+    data = _int32_array(values)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return base64.b64encode(data.tobytes()).decode('ascii')
+
+
+def _decode(text: str) -> array:
+    data = _int32_array()
+    data.frombytes(base64.b64decode(text))
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return data
+
+
+def _csr(neighbors: list[Iterable[int]]) -> tuple[array, array]:
+    indptr = _int32_array([0])
+    indices = _int32_array()
+    for row in neighbors:
+        indices.extend(row)
+        indptr.append(len(indices))
+    return indptr, indices
+
+
+class ReachabilityIndex:
+    """
+    Reachability over the DAG of strongly connected components with GRAIL-style interval labels.
+
+    Each of `label_count` randomized depth-first post-orders gives every component an interval
+    that contains the intervals of all its descendants. A failed containment check answers
+    "unreachable" in O(label_count); otherwise a depth-first search prunes every branch whose
+    intervals cannot contain the target. Building takes O(label_count * (V + E)) time and memory.
+    """
+
+    def __init__(
+        self,
+        components: list[list[int]],
+        indptr: array,
+        indices: array,
+        lows: list[array],
+        ranks: list[array],
+        cyclic: set[int],
+    ):
+        self.components = components
+        self.indptr = indptr
+        self.indices = indices
+        self.lows = lows
+        self.ranks = ranks
+        self.cyclic = cyclic
+        self._component_of = {
+            node_id: index for index, members in enumerate(components) for node_id in members
+        }
+        predecessors: list[list[int]] = [[] for _ in components]
+        for index in range(len(components)):
+            for succ_index in self._successors(index):
+                predecessors[succ_index].append(index)
+        self.rev_indptr, self.rev_indices = _csr(predecessors)
+
+    @classmethod
+    def from_graph(
+        cls,
+        graph: Union[SimpleDiGraph, CSRGraph],
+        label_count: int = 3,
+        seed: int = 0,
+    ) -> 'ReachabilityIndex':
+        return cls.from_condensation(graph.condensation(), label_count, seed)
+
+    @classmethod
+    def from_condensation(
+        cls,
+        condensation: Condensation,
+        label_count: int = 3,
+        seed: int = 0,
+    ) -> 'ReachabilityIndex':
+        indptr, indices = _csr(condensation.successors)
+        rng = random.Random(seed)
+        lows, ranks = [], []
+        for label in range(label_count):
+            low, rank = cls._label(indptr, indices, rng, reverse_children=bool(label % 2))
+            lows.append(low)
+            ranks.append(rank)
+        return cls(condensation.components, indptr, indices, lows, ranks, condensation.cyclic)
+
+    @staticmethod
+    def _label(indptr: array, indices: array, rng: random.Random, reverse_children: bool) -> tuple[array, array]:
+        """Numbers components in a depth-first post-order from shuffled roots; low is the subtree minimum."""
+        count = len(indptr) - 1
+        rank = _int32_array([-1]) * count
+        low = _int32_array([0]) * count
+        roots = list(range(count))
+        rng.shuffle(roots)
+        next_rank = 0
+        for root in roots:
+            if rank[root] != -1:
+                continue
+            rank[root] = -2
+            stack = [(root, iter(ReachabilityIndex._children(indptr, indices, root, reverse_children)))]
+            while stack:
+                node, children = stack[-1]
+                for child in children:
+                    if rank[child] == -1:
+                        rank[child] = -2
+                        stack.append((child, iter(ReachabilityIndex._children(indptr, indices, child, reverse_children))))
+                        break
+                else:
+                    stack.pop()
+                    rank[node] = next_rank
+                    node_low = next_rank
+                    for child in indices[indptr[node]:indptr[node + 1]]:
+                        if low[child] < node_low:
+                            node_low = low[child]
+                    low[node] = node_low
+                    next_rank += 1
+        return low, rank
+
+    @staticmethod
+    def _children(indptr: array, indices: array, node: int, reverse: bool) -> array:
+        children = indices[indptr[node]:indptr[node + 1]]
+        if reverse:
+            children.reverse()
+        return children
+
+    def _successors(self, index: int) -> array:
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def _predecessors(self, index: int) -> array:
+        return self.rev_indices[self.rev_indptr[index]:self.rev_indptr[index + 1]]
+
+    def _may_reach(self, src: int, dst: int) -> bool:
+        """False if some label proves `dst` is not a descendant of `src`."""
+        for low, rank in zip(self.lows, self.ranks):
+            if low[dst] < low[src] or rank[dst] > rank[src]:
+                return False
+        return True
+
+    def __contains__(self, node_id: int) -> bool:
+        return node_id in self._component_of
+
+    def is_reachable(self, src: int, dst: int) -> bool:
+        """True if `dst` is downstream of `src`; a node reaches itself only through a cycle."""
+        src_index = self._component_of[src]
+        dst_index = self._component_of[dst]
+        if src_index == dst_index:
+            return src_index in self.cyclic
+        if not self._may_reach(src_index, dst_index):
+            return False
+
+        visited = {src_index}
+        stack = [src_index]
+        while stack:
+            for succ_index in self._successors(stack.pop()):
+                if succ_index == dst_index:
+                    return True
+                if succ_index not in visited and self._may_reach(succ_index, dst_index):
+                    visited.add(succ_index)
+                    stack.append(succ_index)
+        return False
+
+    def downstream(self, node_id: int) -> set[int]:
+        """Returns all nodes reachable from `node_id`."""
+        return self._expand(node_id, self._successors)
+
+    def upstream(self, node_id: int) -> set[int]:
+        """Returns all nodes from which `node_id` is reachable."""
+        return self._expand(node_id, self._predecessors)
+
+    def _expand(self, node_id: int, neighbors) -> set[int]:
+        index = self._component_of[node_id]
+        visited = {index}
+        stack = [index]
+        nodes: set[int] = set(self.components[index]) if index in self.cyclic else set()
+        while stack:
+            for neighbor in neighbors(stack.pop()):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+                    nodes.update(self.components[neighbor])
+        return nodes
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'version': INDEX_FORMAT_VERSION,
+            'components': self.components,
+            'cyclic': sorted(self.cyclic),
+            'indptr': _encode(self.indptr),
+            'indices': _encode(self.indices),
+            'lows': [_encode(low) for low in self.lows],
+            'ranks': [_encode(rank) for rank in self.ranks],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'ReachabilityIndex':
+        if data.get('version') != INDEX_FORMAT_VERSION:
+            raise ValueError(f'Unsupported reachability index version: {data.get("version")}')
+        return cls(
+            components=[list(members) for members in data['components']],
+            indptr=_decode(data['indptr']),
+            indices=_decode(data['indices']),
+            lows=[_decode(low) for low in data['lows']],
+            ranks=[_decode(rank) for rank in data['ranks']],
+            cyclic=set(data['cyclic']),
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str) -> 'ReachabilityIndex':
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
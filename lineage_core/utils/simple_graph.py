@@ -1,67 +1,117 @@
 import logging
-from collections import defaultdict
+from collections.abc import (
+    KeysView,
+    Mapping,
+)
 from typing import (
     Any,
     Generator,
+    Iterator,
+    Optional,
+)
+
+from omd_airflow_utils.lineage_core.utils.graph_algorithms import (
+    Condensation,
+    strongly_connected_components,
 )
 
 logger = logging.getLogger(__name__)
 
 
+class AdjacencyView(Mapping):
+    """Read-only mapping of node ID to the list of its successors."""
+
+    def __init__(self, succ: dict[int, dict[int, None]]):
+        self._succ = succ
+
+    def __getitem__(self, node_id: int) -> list[int]:
+        return list(self._succ[node_id])
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._succ)
+
+    def __len__(self) -> int:
+        return len(self._succ)
+
+
 class SimpleDiGraph:
-    """Simple directed graph with node/edge management and traversal support."""
+    """Simple directed graph with set-based successor and predecessor indexes."""
 
     def __init__(self):
-        self.adj: dict[int, list[int]] = defaultdict(list)
-        self._nodes: dict[int, dict[str, Any]] = {}
-
-    def add_node(self, node_id: int, **attrs: Any) -> None:
-        self._nodes[node_id] = attrs
+        self._nodes: dict[int, Any] = {}
+        self._succ: dict[int, dict[int, None]] = {}
+        self._pred: dict[int, dict[int, None]] = {}
+        self._edge_count = 0
+        self.adj = AdjacencyView(self._succ)
+
+    def add_node(self, node_id: int, data: Any = None, **attrs: Any) -> None:
+        """Stores `data` as the node payload, or a dict of keyword attributes as before."""
+        if data is not None and attrs:
+            raise ValueError('Pass either a node payload or keyword attributes, not both.')
+        self._nodes[node_id] = data if data is not None else attrs
+        self._succ.setdefault(node_id, {})
+        self._pred.setdefault(node_id, {})
 
     def add_edge(self, src: int, dst: int) -> None:
         if src not in self._nodes:
             raise ValueError(f'Source node {src} does not exist in the graph.')
         if dst not in self._nodes:
             raise ValueError(f'Destination node {dst} does not exist in the graph.')
-        self.adj[src].append(dst)
+        successors = self._succ[src]
+        if dst in successors:
+            return
+        successors[dst] = None
+        self._pred[dst][src] = None
+        self._edge_count += 1
+
+    def has_edge(self, src: int, dst: int) -> bool:
+        return dst in self._succ.get(src, ())
+
+    def has_node(self, node_id: int) -> bool:
+        return node_id in self._nodes
 
     def nodes(self) -> list[int]:
         return list(self._nodes.keys())
 
-    def get_node(self, node_id: int) -> dict[str, Any]:
+    def get_node(self, node_id: int) -> Any:
         if node_id not in self._nodes:
             raise KeyError(f'Node with ID {node_id} not found.')
         return self._nodes[node_id]
 
+    def successors(self, node_id: int) -> KeysView[int]:
+        return self._succ[node_id].keys()
+
+    def predecessors(self, node_id: int) -> KeysView[int]:
+        return self._pred[node_id].keys()
+
     def in_degree(self) -> dict[int, int]:
-        in_deg = defaultdict(int)
-        for dsts in self.adj.values():
-            for dst in dsts:
-                in_deg[dst] += 1
-        for node_id in self._nodes.keys():
-            in_deg.setdefault(node_id, 0)
-        return in_deg
+        return {node_id: len(preds) for node_id, preds in self._pred.items()}
 
     def out_degree(self) -> dict[int, int]:
-        return {node_id: len(self.adj.get(node_id, [])) for node_id in self._nodes.keys()}
+        return {node_id: len(succs) for node_id, succs in self._succ.items()}
 
     def number_of_nodes(self) -> int:
         return len(self._nodes)
 
     def number_of_edges(self) -> int:
-        return sum(len(destinations) for destinations in self.adj.values())
+        return self._edge_count
 
     def edges(self) -> list[tuple[int, int]]:
-        return [(src, dst) for src, dsts in self.adj.items() for dst in dsts]
+        return [(src, dst) for src, dsts in self._succ.items() for dst in dsts]
 
     def sources(self) -> set[int]:
-        all_nodes = set(self.adj.keys())
-
-        all_targets = {target for targets in self.adj.values() for target in targets}
-        return all_nodes - all_targets
+        return {node_id for node_id, preds in self._pred.items() if not preds}
 
     def sinks(self) -> set[int]:
-        return {node for node, targets in self.adj.items() if not targets}
+        return {node_id for node_id, succs in self._succ.items() if not succs}
+
+    def strongly_connected_components(self, within: Optional[set[int]] = None) -> list[list[int]]:
+        """Returns SCCs in reverse topological order, optionally of the subgraph `within`."""
+        return strongly_connected_components(self._nodes, self.successors, within)
+
+    def condensation(self) -> Condensation:
+        """Returns the DAG of strongly connected components."""
+        return Condensation.from_graph(self._nodes, self.successors)
 
     def all_simple_paths(
         self, start: int, end: int, cutoff: int = 20
@@ -69,16 +119,26 @@ class SimpleDiGraph:
         """Yields all simple paths between start and end nodes up to a cutoff length."""
         if start not in self._nodes or end not in self._nodes:
             return
+        if start == end:
+            yield [start]
+            return
 
-        def dfs(current: int, path: list[int]) -> Generator[list[int], None, None]:
-            if current == end:
-                yield path
-                return
-            if len(path) > cutoff:
-                return
-            for neighbor in self.adj.get(current, []):
-                if neighbor in self._nodes and neighbor not in path:
-                    yield from dfs(neighbor, path + [neighbor])
-
-        yield from dfs(start, [start])
-
+        path = [start]
+        on_path = {start}
+        stack = [iter(self._succ[start])]
+        while stack:
+            neighbor = next(stack[-1], None)
+            if neighbor is None:
+                stack.pop()
+                on_path.discard(path.pop())
+                continue
+            if neighbor in on_path:
+                continue
+            if neighbor == end:
+                yield [*path, neighbor]
+                continue
+            if len(path) >= cutoff:
+                continue
+            path.append(neighbor)
+            on_path.add(neighbor)
+            stack.append(iter(self._succ[neighbor]))
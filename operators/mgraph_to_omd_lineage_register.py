@@ -1,21 +1,30 @@
+from contextlib import nullcontext
 from datetime import (
     datetime,
     timezone,
 )
+from functools import partial
 from typing import (
     Any,
+    Callable,
     Optional,
 )
 
 from airflow.exceptions import AirflowException
 from airflow.models import BaseOperator
 
+from omd_airflow_utils.lineage_core.adapters.cache.entity_store import (
+    SqliteEntityStore,
+)
 from omd_airflow_utils.lineage_core.adapters.config.config import LineageConfig
 from omd_airflow_utils.lineage_core.adapters.config.config_manager import (
     ConfigManager,
 )
 from omd_airflow_utils.lineage_core.adapters.db.psql_client import PostgresClient
 from omd_airflow_utils.lineage_core.adapters.node_repository import NodeRepository
+from omd_airflow_utils.lineage_core.adapters.omd.async_omd_api_client import (
+    AsyncLineageAPIClient,
+)
 from omd_airflow_utils.lineage_core.adapters.omd.omd_client_factory import (
     LineageAPIClientFactory,
 )
@@ -53,9 +62,11 @@ class MGraphToOMDLineageOperator(BaseOperator):
         schema_filter: Optional[list[str]] = None,
         settings: Optional[Settings] = None,
         path_cutoff: int = 20,
+        skip_schemas: Optional[list[str]] = None,
         config_variable_name: Optional[str] = None,
         config: Optional[LineageConfig] = None,
         sync_descriptions: bool = False,
+        use_async_client: bool = False,
         **kwargs: Any,
     ):
         super().__init__(**kwargs)
@@ -66,10 +77,12 @@ class MGraphToOMDLineageOperator(BaseOperator):
         self.schema_filter = schema_filter
         self.settings = settings
         self.path_cutoff = path_cutoff
+        self.skip_schemas = skip_schemas
         self.config_variable_name = config_variable_name
         self.config = config or LineageConfig()
         self.service = LineageService.create_default()
         self.sync_descriptions = sync_descriptions
+        self.use_async_client = use_async_client
 
 
     def execute(self, context: dict[str, Any]) -> None:
@@ -78,7 +91,13 @@ class MGraphToOMDLineageOperator(BaseOperator):
             self.settings = config_mgr.load_settings()
             self._apply_overrides()
 
-            graph_fetcher = LineageGraphFetcher(self.settings, self.database_conn_id, self.schema_filter)
+            graph_fetcher = LineageGraphFetcher(
+                self.settings,
+                self.database_conn_id,
+                self.schema_filter,
+                skip_schemas=self.skip_schemas,
+                path_cutoff=self.path_cutoff,
+            )
             result = graph_fetcher.fetch()
             nodes = result.nodes
             edges = result.edges
@@ -89,7 +108,23 @@ class MGraphToOMDLineageOperator(BaseOperator):
             if not nodes and not affected_fqns:
                 return
 
-            with LineageAPIClientFactory.create_from_connection(self.metadata_conn_id, self.config) as client:
+            with (
+                SqliteEntityStore.from_config(self.config.cache) or nullcontext()
+            ) as entity_store, LineageAPIClientFactory.create_from_connection(
+                self.metadata_conn_id, self.config, entity_store=entity_store,
+            ) as client:
+                self.service = LineageService.create_default(
+                    entity_store=entity_store,
+                    graph_config=self.config.graph,
+                    cache_config=self.config.cache,
+                )
+                async_client_factory = self._get_async_client_factory(entity_store)
+
+                if self.config.prefetch.enabled:
+                    self.service.prefetch_schemas(client, self.settings.context, self.settings.schema_filter)
+
+                # The fetch queries already exclude nodes of the trigger operator (settings.operator_id),
+                # so collapse_triggers has no effect here; it matters for callers passing raw graphs.
                 pairs = self.service.extract_graph_lineage(
                     nodes=nodes,
                     edges=edges,
@@ -98,9 +133,15 @@ class MGraphToOMDLineageOperator(BaseOperator):
                     collapse_triggers=True,
                     trigger_operator_id=self.settings.operator_id,
                     client=client,
+                    skip_schemas=self.skip_schemas,
                 )
 
-                runner = LineageSyncRunner(client, self.service, LineageOperationExecutor())
+                runner = LineageSyncRunner(
+                    client,
+                    self.service,
+                    LineageOperationExecutor(max_workers=self.config.operator.defaults.max_workers),
+                    async_client_factory=async_client_factory,
+                )
                 runner.run_sync(
                     lineage_pairs=pairs,
                     load_type=self.settings.load_type,
@@ -123,11 +164,17 @@ class MGraphToOMDLineageOperator(BaseOperator):
                                 node_repo=node_repo,
                                 omd_client=client,
                                 db_context=self.settings.context,
+                                async_client_factory=async_client_factory,
+                                metadata_service=self.service.metadata_service,
+                                batch_size=self.config.description_sync.batch_size,
+                                parallelism=self.config.description_sync.parallelism,
                             )
                             description_sync_service.sync_descriptions_for_nodes(nodes)
 
                         self.log.info('Descriptions synchronization completed.')
 
+                self.service.metadata_service.log_stats()
+
             self._update_config(config_mgr)
 
         except Exception as e:
@@ -140,6 +187,20 @@ class MGraphToOMDLineageOperator(BaseOperator):
         if self.schema_filter:
             self.settings.schema_filter = self.schema_filter
 
+    def _get_async_client_factory(
+        self,
+        entity_store: Optional[SqliteEntityStore] = None,
+    ) -> Optional[Callable[[], AsyncLineageAPIClient]]:
+        """Returns factory for async OMD clients used to fan out requests, if enabled."""
+        if not self.use_async_client:
+            return None
+        return partial(
+            LineageAPIClientFactory.create_async_from_connection,
+            self.metadata_conn_id,
+            self.config,
+            entity_store=entity_store,
+        )
+
     def _update_config(self, config_mgr: ConfigManager) -> None:
         """Updates Airflow variable state after sync completes."""
         config_mgr.update_last_executed(datetime.now(timezone.utc))
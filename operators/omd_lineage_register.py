@@ -22,14 +22,16 @@ class RegisterLineageOperator(BaseLineageOperator):
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.executor: LineageOperationExecutor = executor or LineageOperationExecutor()
+        self.executor: LineageOperationExecutor = executor or LineageOperationExecutor(
+            max_workers=self.config.operator.defaults.max_workers
+        )
 
     def _execute_sequential_operations(
         self,
         client: LineageAPIClient,
         processing_result: LineageProcessingResult
     ) -> None:
-        result = self.executor.execute_add_operations_sequentially(
+        result = self.executor.execute_add_operations_concurrently(
             processing_result.pairs,
             processing_result.entity_cache,
             client,
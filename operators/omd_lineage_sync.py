@@ -41,7 +41,9 @@ class SyncLineageOperator(BaseLineageOperator):
             **kwargs
         )
         self.existing_edges_fetcher = existing_edges_fetcher
-        self.executor: LineageOperationExecutor = executor or LineageOperationExecutor()
+        self.executor: LineageOperationExecutor = executor or LineageOperationExecutor(
+            max_workers=self.config.operator.defaults.max_workers
+        )
 
     def _execute_sequential_operations(
         self,
@@ -61,10 +63,10 @@ class SyncLineageOperator(BaseLineageOperator):
 
         if pairs_to_delete:
             delete_pairs = self._resolve_delete_pairs(pairs_to_delete, processing_result.pairs)
-            self.executor.execute_delete_operations_sequentially(delete_pairs, client)
+            self.executor.execute_delete_operations_concurrently(delete_pairs, client)
 
         if pairs_to_add:
-            self.executor.execute_add_operations_sequentially(
+            self.executor.execute_add_operations_concurrently(
                 pairs_to_add, processing_result.entity_cache, client
             )
 
@@ -0,0 +1,226 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from omd_airflow_utils.lineage_core.adapters.cache.entity_store import (
+    SqliteEntityStore,
+)
+from omd_airflow_utils.lineage_core.adapters.config.config import (
+    HttpxClientConfig,
+    LineageConfig,
+    PrefetchConfig,
+    SearchConfig,
+)
+from omd_airflow_utils.lineage_core.adapters.omd.async_omd_api_client import (
+    AsyncLineageAPIClient,
+)
+from omd_airflow_utils.lineage_core.adapters.omd.omd_response_models import (
+    OMDResponseEntity,
+)
+from omd_airflow_utils.lineage_core.domain.models import EntityRef
+from omd_airflow_utils.lineage_core.domain.types import EntityType
+
+
+def make_client(
+    handler,
+    max_in_flight: int = 2,
+    search_batch_size: int = 100,
+    entity_store: SqliteEntityStore = None,
+) -> AsyncLineageAPIClient:
+    config = LineageConfig(
+        http_client=HttpxClientConfig(max_in_flight=max_in_flight),
+        search=SearchConfig(batch_size=search_batch_size),
+    )
+    client = AsyncLineageAPIClient('http://omd', 'token', config=config, entity_store=entity_store)
+    client._httpx.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url='http://omd'
+    )
+    return client
+
+
+class TestAsyncLineageAPIClient:
+
+    def test_get_entity_respects_max_in_flight(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            assert 'fields' not in request.url.params
+            fqn = request.url.path.rsplit('/', 1)[-1]
+            return httpx.Response(200, json={'id': fqn, 'fullyQualifiedName': fqn})
+
+        async def run():
+            async with make_client(handler, max_in_flight=2) as client:
+                return await asyncio.gather(
+                    *(client.get_entity(EntityType.TABLE, f's.d.sch.t{i}') for i in range(10))
+                )
+
+        entities = asyncio.run(run())
+
+        assert [e.fully_qualified_name for e in entities] == [f's.d.sch.t{i}' for i in range(10)]
+        assert peak == 2
+
+    def test_get_entity_not_found_raises(self):
+        async def handler(request):
+            return httpx.Response(404)
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.get_entity(EntityType.TABLE, 's.d.sch.missing')
+
+        with pytest.raises(Exception, match='not found'):
+            asyncio.run(run())
+
+    def test_add_lineage_failure_logs_pair(self, caplog):
+        async def handler(request):
+            return httpx.Response(400, json={'message': 'bad edge'})
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.add_lineage(
+                    EntityRef(id='a', type=EntityType.TABLE),
+                    EntityRef(id='b', type=EntityType.TABLE),
+                    's.d.raw.a',
+                    's.d.marts.b',
+                )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+        assert 'Failed to add lineage s.d.raw.a -> s.d.marts.b' in caplog.text
+
+    def test_add_lineage_not_found_evicts_stale_entities(self, tmp_path):
+        async def handler(request):
+            return httpx.Response(404, json={'message': 'entity not found'})
+
+        with SqliteEntityStore(str(tmp_path / 'entities.sqlite')) as store:
+            for entity_id, fqn in (('old-a', 's.d.raw.a'), ('b', 's.d.marts.b')):
+                store.put(EntityType.TABLE, fqn, OMDResponseEntity(id=entity_id, fully_qualified_name=fqn))
+            client = make_client(handler, entity_store=store)
+            client.resolver.remember('old-a', 's.d.raw.a')
+
+            async def run():
+                async with client:
+                    await client.add_lineage(
+                        EntityRef(id='old-a', type=EntityType.TABLE),
+                        EntityRef(id='b', type=EntityType.TABLE),
+                        's.d.raw.a',
+                        's.d.marts.b',
+                    )
+
+            with pytest.raises(httpx.HTTPStatusError):
+                asyncio.run(run())
+
+            assert 'old-a' not in client.resolver.cache
+            assert store.get(EntityType.TABLE, 's.d.raw.a') is None
+            assert store.get_fqn_by_id('old-a') is None
+            assert store.get(EntityType.TABLE, 's.d.marts.b') is None
+
+    def test_get_edges_for_scope_uses_payload_nodes(self):
+        requested_paths = []
+
+        async def handler(request):
+            requested_paths.append(request.url.path)
+            if '/lineage/' in request.url.path:
+                assert request.url.params['upstreamDepth'] == '1'
+                assert request.url.params['downstreamDepth'] == '1'
+                return httpx.Response(200, json={
+                    'entity': {'id': '1', 'fullyQualifiedName': 's.d.raw.a'},
+                    'nodes': [
+                        {'id': '2', 'fullyQualifiedName': 's.d.stage.b'},
+                        {'id': '3', 'fullyQualifiedName': 's.d.other.c'},
+                    ],
+                    'upstreamEdges': [{'fromEntity': '4', 'toEntity': '1'}],
+                    'downstreamEdges': [
+                        {'fromEntity': '1', 'toEntity': '2'},
+                        {'fromEntity': '1', 'toEntity': '3'},
+                    ],
+                })
+            return httpx.Response(200, json={'id': '4', 'fullyQualifiedName': 's.d.raw.d'})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.get_edges_for_scope({'s.d.raw.a'}, schema_filter={'raw', 'stage'})
+
+        assert asyncio.run(run()) == {('s.d.raw.a', 's.d.stage.b'), ('s.d.raw.d', 's.d.raw.a')}
+        assert len(requested_paths) == 2
+
+    def test_resolver_cache_avoids_repeated_lookups(self):
+        requested_ids = []
+
+        async def handler(request):
+            entity_id = request.url.path.rsplit('/', 1)[-1]
+            requested_ids.append(entity_id)
+            return httpx.Response(200, json={'id': entity_id, 'fullyQualifiedName': f's.d.sch.{entity_id}'})
+
+        async def run():
+            async with make_client(handler) as client:
+                client.resolver.remember('seeded', 's.d.sch.seeded')
+                first = await client.resolver.resolve_fqn_by_id('1')
+                second = await client.resolver.resolve_fqn_by_id('1')
+                seeded = await client.resolver.resolve_fqn_by_id('seeded')
+                return first, second, seeded, client.resolver.cache
+
+        first, second, seeded, cache = asyncio.run(run())
+
+        assert first == second == 's.d.sch.1'
+        assert seeded == 's.d.sch.seeded'
+        assert requested_ids == ['1']
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_find_entities_by_fqns_batches_search_requests(self):
+        batches = []
+
+        async def handler(request):
+            assert request.url.path == '/api/v1/search/query'
+            assert request.url.params['index'] == 'table_search_index'
+            query_filter = json.loads(request.url.params['query_filter'])
+            fqns = query_filter['query']['bool']['filter'][0]['terms']['fullyQualifiedName']
+            batches.append(fqns)
+            hits = [
+                {'_source': {'id': f'id-{fqn}', 'fullyQualifiedName': fqn}}
+                for fqn in fqns if not fqn.endswith('missing')
+            ]
+            return httpx.Response(200, json={'hits': {'hits': hits}})
+
+        fqns = [f's.d.sch.t{i}' for i in range(5)] + ['s.d.sch.missing', 's.d.sch.t0']
+
+        async def run():
+            async with make_client(handler, search_batch_size=2) as client:
+                result = await client.find_entities_by_fqns(EntityType.TABLE, fqns)
+                return result, await client.resolver.resolve_fqn_by_id('id-s.d.sch.t3')
+
+        result, resolved = asyncio.run(run())
+
+        assert sorted(result.found) == [f's.d.sch.t{i}' for i in range(5)]
+        assert result.missing == {'s.d.sch.missing'}
+        assert [len(batch) for batch in batches] == [2, 2, 2]
+        assert resolved == 's.d.sch.t3'
+
+    def test_list_schema_entities_follows_cursor(self):
+        pages = {
+            None: {'data': [{'id': '1', 'fullyQualifiedName': 's.d.raw.a'}], 'paging': {'after': 'p2'}},
+            'p2': {'data': [{'id': '2', 'fullyQualifiedName': 's.d.raw.b'}], 'paging': {}},
+        }
+        requests = []
+
+        async def handler(request):
+            requests.append(dict(request.url.params))
+            return httpx.Response(200, json=pages[request.url.params.get('after')])
+
+        async def run():
+            async with make_client(handler) as client:
+                client.config.prefetch = PrefetchConfig(page_size=1)
+                return await client.list_schema_entities(EntityType.TABLE, 's.d.raw', fields=['owners'])
+
+        entities = asyncio.run(run())
+
+        assert [entity.id for entity in entities] == ['1', '2']
+        assert requests[0] == {'databaseSchema': 's.d.raw', 'limit': '1', 'fields': 'owners'}
+        assert requests[1]['after'] == 'p2'
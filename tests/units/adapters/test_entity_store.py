@@ -0,0 +1,114 @@
+import pytest
+
+from omd_airflow_utils.lineage_core.adapters.cache.entity_store import (
+    SqliteEntityStore,
+)
+from omd_airflow_utils.lineage_core.adapters.config.config import CacheConfig
+from omd_airflow_utils.lineage_core.adapters.omd.omd_response_models import (
+    OMDResponseEntity,
+)
+from omd_airflow_utils.lineage_core.domain.types import EntityType
+from omd_airflow_utils.lineage_core.services.omd_use_cases.lineage_metadata_cache import (
+    EntityCache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    with SqliteEntityStore(str(tmp_path / 'entities.sqlite'), ttl_seconds=60, clock=clock) as store:
+        yield store
+
+
+def make_entity(entity_id: str, fqn: str) -> OMDResponseEntity:
+    return OMDResponseEntity(id=entity_id, type='table', fully_qualified_name=fqn, name=fqn.split('.')[-1])
+
+
+class TestSqliteEntityStore:
+    def test_put_and_get(self, store):
+        store.put(EntityType.TABLE, 'svc.db.s.t', make_entity('id-1', 'svc.db.s.t'))
+
+        entity = store.get(EntityType.TABLE, 'svc.db.s.t')
+
+        assert entity.id == 'id-1'
+        assert entity.fully_qualified_name == 'svc.db.s.t'
+        assert store.get(EntityType.TOPIC, 'svc.db.s.t') is None
+
+    def test_alias_fqn_points_to_canonical_entity(self, store):
+        store.put(EntityType.TABLE, 'svc.db.S.T', make_entity('id-1', 'svc.db.s.t'))
+
+        assert store.get(EntityType.TABLE, 'svc.db.S.T').fully_qualified_name == 'svc.db.s.t'
+        assert store.get(EntityType.TABLE, 'svc.db.s.t').id == 'id-1'
+        assert store.get_fqn_by_id('id-1') == 'svc.db.s.t'
+
+    def test_expired_entries_are_ignored(self, store, clock):
+        store.put(EntityType.TABLE, 'svc.db.s.t', make_entity('id-1', 'svc.db.s.t'))
+        clock.now += 61
+
+        assert store.get(EntityType.TABLE, 'svc.db.s.t') is None
+        assert store.get_fqn_by_id('id-1') is None
+
+    def test_persists_across_instances(self, tmp_path, clock):
+        path = str(tmp_path / 'entities.sqlite')
+        with SqliteEntityStore(path, clock=clock) as first:
+            first.put(EntityType.TABLE, 'svc.db.s.t', make_entity('id-1', 'svc.db.s.t'))
+
+        with SqliteEntityStore(path, clock=clock) as second:
+            assert second.get(EntityType.TABLE, 'svc.db.s.t').id == 'id-1'
+
+    def test_invalidate(self, store):
+        store.put(EntityType.TABLE, 'svc.db.s.t', make_entity('id-1', 'svc.db.s.t'))
+        store.invalidate(EntityType.TABLE, 'svc.db.s.t')
+
+        assert store.get(EntityType.TABLE, 'svc.db.s.t') is None
+
+    def test_invalidate_drops_aliases_of_the_entity(self, store):
+        store.put(EntityType.TABLE, 'svc.db.S.T', make_entity('id-1', 'svc.db.s.t'))
+        store.invalidate(EntityType.TABLE, 'svc.db.S.T')
+
+        assert store.get(EntityType.TABLE, 'svc.db.s.t') is None
+        assert store.get_fqn_by_id('id-1') is None
+
+    def test_missing_entries_expire_and_clear_on_put(self, tmp_path, clock):
+        with SqliteEntityStore(str(tmp_path / 'e.sqlite'), negative_ttl_seconds=30, clock=clock) as store:
+            store.put_missing(EntityType.TABLE, ['svc.db.s.gone', 'svc.db.s.later'])
+            store.put(EntityType.TABLE, 'svc.db.s.later', make_entity('id-2', 'svc.db.s.later'))
+
+            assert store.is_missing(EntityType.TABLE, 'svc.db.s.gone')
+            assert not store.is_missing(EntityType.TABLE, 'svc.db.s.later')
+
+            clock.now += 31
+            assert not store.is_missing(EntityType.TABLE, 'svc.db.s.gone')
+
+    def test_from_config_disabled_without_path(self):
+        assert SqliteEntityStore.from_config(CacheConfig()) is None
+
+
+class TestEntityCacheWithStore:
+    def test_falls_back_to_store_and_writes_through(self, store):
+        EntityCache(store).cache_entity(EntityType.TABLE, 'svc.db.s.t', make_entity('id-1', 'svc.db.s.t'))
+
+        fresh_cache = EntityCache(store)
+
+        assert fresh_cache.get_entity(EntityType.TABLE, 'svc.db.s.t').id == 'id-1'
+        assert fresh_cache.get_fqn_by_id('id-1') == 'svc.db.s.t'
+
+    def test_missing_entities_persist_across_runs(self, store):
+        EntityCache(store).mark_missing(EntityType.TABLE, ['svc.db.s.gone'])
+
+        fresh_cache = EntityCache(store)
+
+        assert fresh_cache.is_known_missing(EntityType.TABLE, 'svc.db.s.gone')
+        assert fresh_cache.saved_lookups == 1
@@ -0,0 +1,145 @@
+from datetime import datetime
+
+from omd_airflow_utils.lineage_core.adapters.node_repository import (
+    NodeRepository,
+)
+from omd_airflow_utils.lineage_core.domain.models import NodeRecord
+
+
+class FakeCursor:
+    def __init__(self, rows, executed, name=None):
+        self.rows = list(rows)
+        self.executed = executed
+        self.name = name
+        self.fetch_sizes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return None
+
+    def execute(self, query, params):
+        self.executed.append(params)
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+        self.cursors = []
+
+    def cursor(self, name=None, **kwargs):
+        cursor = FakeCursor(self.rows, self.executed, name)
+        self.cursors.append(cursor)
+        return cursor
+
+
+class TestFetchDescriptions:
+
+    def test_groups_table_and_column_descriptions_by_node(self):
+        conn = FakeConnection([
+            (1, None, 'Users table'),
+            (1, 'id', 'Key'),
+            (1, 'email', 'User email'),
+            (2, 'amount', 'Order amount'),
+        ])
+
+        descriptions = NodeRepository(conn).fetch_descriptions([1, 2, 3])
+
+        assert conn.executed == [{'node_ids': [1, 2, 3]}]
+        assert descriptions[1].description == 'Users table'
+        assert descriptions[1].columns == {'id': 'Key', 'email': 'User email'}
+        assert descriptions[2].description is None
+        assert descriptions[2].columns == {'amount': 'Order amount'}
+        assert descriptions[3].columns == {}
+
+    def test_empty_node_list_skips_query(self):
+        conn = FakeConnection([])
+
+        assert NodeRepository(conn).fetch_descriptions([]) == {}
+        assert conn.executed == []
+
+
+class TestStreamingCursors:
+
+    def test_iter_nodes_uses_named_cursor_in_chunks(self):
+        rows = [(i, f'node_{i}', 1, 'raw', None) for i in range(5)] + [('bad', None, 1, 'raw', None)]
+        conn = FakeConnection(rows)
+        repo = NodeRepository(conn, itersize=2)
+
+        nodes = repo.iter_nodes(tag_id=1, schemas=['raw'], state='accepted', operator_id=1)
+
+        assert conn.cursors == []
+        assert [node.id for node in nodes] == [0, 1, 2, 3, 4]
+        cursor = conn.cursors[0]
+        assert cursor.name.startswith('omd_nodes_')
+        assert cursor.itersize == 2
+        assert cursor.fetch_sizes == [2, 2, 2, 2]
+
+    def test_iter_edges_streams_edges(self):
+        conn = FakeConnection([(1, 2), (2, 3)])
+
+        edges = list(NodeRepository(conn).iter_edges([1, 2, 3]))
+
+        assert [(edge.from_entity.id, edge.to_entity.id) for edge in edges] == [('1', '2'), ('2', '3')]
+        assert conn.executed == [{'node_ids': [1, 2, 3]}]
+
+
+class TestFetchGraph:
+
+    def test_splits_single_result_set_into_nodes_and_edges(self):
+        conn = FakeConnection([
+            ('node', 1, 'orders', 1, 'raw', None, None, None),
+            ('node', 2, 'customers', 1, 'raw', None, None, None),
+            ('boundary', 3, 'orders_mart', 2, 'mart', None, None, None),
+            ('edge', None, None, None, None, None, 1, 3),
+            ('edge', None, None, None, None, None, 2, 3),
+        ])
+
+        nodes, edges, boundary_ids = NodeRepository(conn).fetch_graph(
+            tag_id=1, schemas=['raw'], state='accepted', operator_id=1
+        )
+
+        assert [node.id for node in nodes] == [1, 2, 3]
+        assert boundary_ids == {3}
+        assert list(edges) == [(1, 3), (2, 3)]
+        assert len(conn.cursors) == 1
+        assert conn.cursors[0].name.startswith('omd_graph_')
+        assert conn.executed[0]['schemas'] == ['raw']
+
+
+class TestRowConversion:
+
+    def test_rows_with_unexpected_types_are_validated_or_skipped(self):
+        updated = datetime(2024, 1, 1)
+        rows = [(1, 'orders', 2, 'raw', updated), ('bad', None, 2, 'raw', None), ('7', 'items', '2', 'raw', None)]
+        repo = NodeRepository(FakeConnection([]))
+
+        nodes = list(repo._iter_rows_to_nodes(rows))
+
+        assert nodes == [
+            NodeRecord(id=1, name='orders', namespace_id=2, db_schema='raw', updated=updated),
+            NodeRecord(id=7, name='items', namespace_id=2, db_schema='raw', updated=None),
+        ]
+
+    def test_records_share_interned_schema_names(self):
+        repo = NodeRepository(FakeConnection([]))
+        rows = [(1, 'orders', 1, ''.join(['r', 'aw']), None), (2, 'items', 1, ''.join(['ra', 'w']), None)]
+
+        first, second = repo._iter_rows_to_nodes(rows)
+
+        assert first.db_schema is second.db_schema
+
+    def test_edge_pairs_skip_non_integer_endpoints(self):
+        pairs = list(NodeRepository._iter_rows_to_edge_pairs([(1, 2), ('3', 4), ('x', 3), (None, 4)]))
+
+        assert pairs == [(1, 2), (3, 4)]
@@ -0,0 +1,49 @@
+from omd_airflow_utils.lineage_core.adapters.omd.omd_response_parser import (
+    LineageResponseParser,
+)
+
+
+def test_parse_lineage_graph_maps_ids_from_entity_and_nodes():
+    data = {
+        'entity': {'id': 'a', 'fullyQualifiedName': 's.d.sch.a'},
+        'nodes': [{'id': 'b', 'fullyQualifiedName': 's.d.sch.b'}, {'id': 'c'}],
+        'upstreamEdges': [{'fromEntity': 'b', 'toEntity': 'a'}],
+        'downstreamEdges': [{'fromEntity': 'a', 'toEntity': 'c'}, {'fromEntity': 'a'}],
+    }
+
+    edges, id_to_fqn = LineageResponseParser().parse_lineage_graph(data, 's.d.sch.a')
+
+    assert edges == [('s.d.sch.a', 'b', 'a'), ('s.d.sch.a', 'a', 'c')]
+    assert id_to_fqn == {'a': 's.d.sch.a', 'b': 's.d.sch.b'}
+
+
+def test_parse_lineage_graph_tolerates_malformed_nodes():
+    edges, id_to_fqn = LineageResponseParser().parse_lineage_graph({'nodes': 'oops'}, 'x')
+
+    assert edges == []
+    assert id_to_fqn == {}
+
+
+def test_parse_fqn_lookup_matches_case_insensitively():
+    data = {'hits': {'hits': [
+        {'_source': {'id': '1', 'fullyQualifiedName': 's.d.raw.users'}},
+        {'_source': {'id': '2', 'fullyQualifiedName': 's.d.raw.unrequested'}},
+        {'_source': {'fullyQualifiedName': 's.d.raw.no_id'}},
+    ]}}
+
+    result = LineageResponseParser().parse_fqn_lookup(data, ['s.d.raw.Users', 's.d.raw.orders'])
+
+    assert {fqn: entity.id for fqn, entity in result.found.items()} == {'s.d.raw.Users': '1'}
+    assert result.missing == {'s.d.raw.orders'}
+
+
+def test_parse_entity_page_returns_next_cursor():
+    data = {
+        'data': [{'id': '1', 'fullyQualifiedName': 's.d.raw.users'}],
+        'paging': {'after': 'cursor', 'total': 2},
+    }
+
+    entities, after = LineageResponseParser().parse_entity_page(data)
+
+    assert [entity.fully_qualified_name for entity in entities] == ['s.d.raw.users']
+    assert after == 'cursor'
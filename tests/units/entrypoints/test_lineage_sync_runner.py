@@ -0,0 +1,74 @@
+from omd_airflow_utils.lineage_core.domain.types import (
+    EntityPair,
+    EntityType,
+    LineageLoadType,
+    TypedFQN,
+)
+from omd_airflow_utils.lineage_core.domain.use_cases import LineageProcessingResult
+from omd_airflow_utils.lineage_core.entrypoints.lineage_sync_runner import (
+    LineageSyncRunner,
+)
+
+
+def table(fqn):
+    return TypedFQN(EntityType.TABLE, fqn)
+
+
+class FakeAsyncClient:
+    def __init__(self, existing_edges):
+        self.existing_edges = existing_edges
+        self.resolved_ids = set()
+        self.edge_lookups_with_resolved_ids = []
+
+    async def get_edges_for_scope(self, fqns, schema_filter=None):
+        self.edge_lookups_with_resolved_ids.append(set(self.resolved_ids))
+        return self.existing_edges
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+
+class FakeService:
+    async def prepare_lineage_processing_async(self, request, client):
+        client.resolved_ids.update(entity.fqn for entity in request.source_entities + request.target_entities)
+        return LineageProcessingResult(pairs=[], entity_cache={}, validated_sources=[], validated_targets=[])
+
+
+class FakeExecutor:
+    def __init__(self):
+        self.added = []
+        self.deleted = []
+
+    def execute_add_operations_concurrently(self, pairs, entity_cache, client):
+        self.added.extend((p.source.fqn, p.target.fqn) for p in pairs)
+
+    def execute_delete_operations_concurrently(self, pairs, client):
+        self.deleted.extend((p.source.fqn, p.target.fqn) for p in pairs)
+
+
+def test_async_preload_and_edge_lookup_share_one_client():
+    async_client = FakeAsyncClient(existing_edges={('s.d.raw.a', 's.d.marts.old')})
+    created = []
+
+    def factory():
+        created.append(async_client)
+        return async_client
+
+    executor = FakeExecutor()
+    runner = LineageSyncRunner(None, FakeService(), executor, async_client_factory=factory)
+
+    runner.run_sync(
+        lineage_pairs=[EntityPair(table('s.d.raw.a'), table('s.d.marts.b'))],
+        load_type=LineageLoadType.INCREMENTAL,
+        clean_before_update=False,
+        schema_filter={'raw', 'marts'},
+        affected_fqns={'s.d.raw.a'},
+    )
+
+    assert len(created) == 1
+    assert async_client.edge_lookups_with_resolved_ids == [{'s.d.raw.a', 's.d.marts.b'}]
+    assert executor.added == [('s.d.raw.a', 's.d.marts.b')]
+    assert executor.deleted == [('s.d.raw.a', 's.d.marts.old')]
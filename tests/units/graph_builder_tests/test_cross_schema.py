@@ -32,4 +32,16 @@ def test_cross_schema_cycle(cyclic_nodes):
     assert set(graph.adj[1]) == {2}
     assert set(graph.adj[2]) == {1}
     assert set(get_parents(graph, 1)) == {2}
-    assert set(get_parents(graph, 2)) == {1}
\ No newline at end of file
+    assert set(get_parents(graph, 2)) == {1}
+
+
+def test_cross_schema_cycle_is_condensed(cyclic_nodes, caplog):
+    service = LineageGraphService()
+    graph = service.build_graph(cyclic_nodes, [make_edge(1, 2), make_edge(2, 1)])
+
+    condensation = service.condense(graph)
+
+    assert len(condensation) == 1
+    assert sorted(condensation.cycles()[0]) == [1, 2]
+    assert condensation.successors == [set()]
+    assert 'Lineage graph has 1 cycles' in caplog.text
@@ -26,7 +26,8 @@ def test_duplicate_edges(sample_nodes):
     graph = LineageGraphService().build_graph(sample_nodes, edges)
 
     assert (1, 2) in graph.edges()
-    assert graph.adj[1].count(2) == 2
+    assert graph.adj[1].count(2) == 1
+    assert graph.number_of_edges() == 1
 
 
 def test_empty_nodes():
@@ -1,6 +1,9 @@
+import random
+
 from omd_airflow_utils.lineage_core.services.lineage_graph_builder import (
     LineageGraphService,
 )
+from omd_airflow_utils.lineage_core.utils.simple_graph import SimpleDiGraph
 from omd_airflow_utils.tests.conftest import make_edge
 
 
@@ -28,3 +31,58 @@ def test_orphan_nodes(sample_nodes):
     assert graph.adj.get(3, []) == []
     assert all(3 not in dst for dst in graph.adj.values())
 
+
+def bounded_bridges(graph, src, skipped, path_cutoff):
+    reached, visited, frontier = set(), {src}, [src]
+    for _ in range(path_cutoff):
+        next_frontier = []
+        for node_id in frontier:
+            for succ in graph.successors(node_id):
+                if succ in visited:
+                    continue
+                visited.add(succ)
+                if succ in skipped:
+                    next_frontier.append(succ)
+                else:
+                    reached.add(succ)
+        frontier = next_frontier
+    return reached
+
+
+def assert_transitive_edges_match_bounded_walk(graph, skipped, path_cutoff):
+    service = LineageGraphService()
+    expected = {
+        (src, dst)
+        for src in graph.nodes() if src not in skipped
+        for dst in bounded_bridges(graph, src, skipped, path_cutoff) if dst != src
+    }
+
+    assert set(service.transitive_edges(graph, skipped, path_cutoff)) == expected
+    assert set(service.transitive_edges(graph, skipped, path_cutoff, service.condense(graph))) == expected
+
+
+def test_transitive_edges_match_bounded_walk_on_cyclic_graph():
+    rng = random.Random(3)
+    graph = SimpleDiGraph()
+    for node_id in range(80):
+        graph.add_node(node_id)
+    for _ in range(240):
+        graph.add_edge(rng.randrange(80), rng.randrange(80))
+    skipped = set(rng.sample(range(80), 50))
+
+    for path_cutoff in (1, 2, 4, 20):
+        assert_transitive_edges_match_bounded_walk(graph, skipped, path_cutoff)
+
+
+def test_transitive_edges_on_condensed_dag_match_bounded_walk():
+    rng = random.Random(5)
+    graph = SimpleDiGraph()
+    for node_id in range(80):
+        graph.add_node(node_id)
+    for _ in range(240):
+        src, dst = sorted(rng.sample(range(80), 2))
+        graph.add_edge(src, dst)
+    skipped = set(rng.sample(range(80), 50))
+
+    for path_cutoff in (1, 2, 4, 20, 80):
+        assert_transitive_edges_match_bounded_walk(graph, skipped, path_cutoff)
@@ -26,4 +26,15 @@ def test_disconnected_graph(sample_nodes):
     edges = []
     graph = LineageGraphService().build_graph(sample_nodes, edges)
     assert graph.number_of_nodes() == 3
-    assert graph.number_of_edges() == 0
\ No newline at end of file
+    assert graph.number_of_edges() == 0
+
+
+def test_node_payload_supports_dict_style_access(sample_nodes):
+    graph = LineageGraphService().build_graph(sample_nodes, [])
+    payload = graph.get_node(1)
+
+    assert payload['name'] == 'A'
+    assert payload.get('operator_id') is None
+    assert payload.get('unknown', 'default') == 'default'
+    with pytest.raises(KeyError):
+        payload['unknown']
@@ -0,0 +1,55 @@
+from omd_airflow_utils.lineage_core.domain.models import Node
+from omd_airflow_utils.lineage_core.services.lineage_graph_builder import (
+    LineageGraphService,
+)
+from omd_airflow_utils.tests.conftest import make_edge
+
+TRIGGER = 14
+
+
+def make_node(node_id: int, operator_id: int = None) -> Node:
+    return Node(
+        id=node_id, name=f't{node_id}', namespace_id=1, db_schema='s', updated=None, operator_id=operator_id
+    )
+
+
+def build(node_ids, trigger_ids, edges):
+    nodes = [make_node(i, TRIGGER if i in trigger_ids else None) for i in node_ids]
+    return LineageGraphService().build_graph(
+        nodes,
+        [make_edge(src, dst) for src, dst in edges],
+        collapse_triggers=True,
+        trigger_operator_id=TRIGGER,
+    )
+
+
+def test_trigger_is_replaced_by_direct_edges():
+    graph = build([1, 2, 3, 10], {10}, [(1, 10), (2, 10), (10, 3)])
+
+    assert set(graph.edges()) == {(1, 3), (2, 3)}
+    assert 10 not in graph.nodes()
+
+
+def test_trigger_chains_are_followed_transitively():
+    graph = build([1, 2, 3, 10, 11, 12], {10, 11, 12}, [(1, 10), (10, 11), (11, 12), (12, 2), (11, 3)])
+
+    assert set(graph.edges()) == {(1, 2), (1, 3)}
+
+
+def test_trigger_cycles_and_self_loops_are_handled():
+    graph = build([1, 2, 10, 11], {10, 11}, [(1, 10), (10, 11), (11, 10), (11, 2), (11, 1), (1, 2)])
+
+    assert set(graph.edges()) == {(1, 2)}
+
+
+def test_trigger_chain_shares_one_exit_set():
+    chain = list(range(10, 20))
+    edges = [(1, 10), *zip(chain, chain[1:]), (19, 2), (19, 3)]
+    graph = LineageGraphService().build_graph(
+        [make_node(i) for i in [1, 2, 3, *chain]], [make_edge(src, dst) for src, dst in edges]
+    )
+
+    exits = LineageGraphService._trigger_exits(graph, set(chain))
+
+    assert exits[10] == {2, 3}
+    assert all(exits[trigger_id] is exits[19] for trigger_id in chain)
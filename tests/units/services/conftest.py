@@ -0,0 +1,63 @@
+from omd_airflow_utils.lineage_core.adapters.config.config import LineageConfig
+from omd_airflow_utils.lineage_core.adapters.omd.exceptions import (
+    EntityNotFoundError,
+)
+from omd_airflow_utils.lineage_core.adapters.omd.omd_response_models import (
+    EntityLookupResult,
+    OMDResponseEntity,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResolver:
+    def remember_entities(self, entities):
+        pass
+
+
+class FakeClient:
+    """Sync OMD client stub: `existing_fqns` can be fetched or found by search, `schemas` can be listed."""
+
+    def __init__(self, existing_fqns=(), schemas=None, search_fails=False):
+        self.existing_fqns = set(existing_fqns)
+        self.schemas = schemas or {}
+        self.search_fails = search_fails
+        self.fetched = []
+        self.searched = []
+        self.listed = []
+        self.resolver = FakeResolver()
+        self.config = LineageConfig()
+
+    def get_entity(self, entity_type, fqn, fields=None):
+        self.fetched.append((fqn, fields))
+        if fqn not in self.existing_fqns:
+            raise EntityNotFoundError(f'Table with FQN {fqn} not found')
+        return self._entity(entity_type, fqn)
+
+    def find_entities_by_fqns(self, entity_type, fqns):
+        self.searched.append(list(fqns))
+        if self.search_fails:
+            raise RuntimeError('search unavailable')
+        return EntityLookupResult(
+            found={fqn: self._entity(entity_type, fqn) for fqn in fqns if fqn in self.existing_fqns},
+            missing={fqn for fqn in fqns if fqn not in self.existing_fqns},
+        )
+
+    def list_schema_entities(self, entity_type, schema_fqn, fields=None):
+        self.listed.append(schema_fqn)
+        if schema_fqn not in self.schemas:
+            raise RuntimeError('schema listing failed')
+        return [
+            OMDResponseEntity(id=f'id-{name}', fully_qualified_name=f'{schema_fqn}.{name}')
+            for name in self.schemas[schema_fqn]
+        ]
+
+    @staticmethod
+    def _entity(entity_type, fqn):
+        return OMDResponseEntity(id=f'id-{fqn}', type=entity_type.value, fully_qualified_name=fqn)
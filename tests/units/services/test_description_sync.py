@@ -0,0 +1,208 @@
+import asyncio
+from datetime import (
+    datetime,
+    UTC,
+)
+
+import pytest
+
+from omd_airflow_utils.lineage_core.adapters.omd.exceptions import (
+    EntityNotFoundError,
+)
+from omd_airflow_utils.lineage_core.adapters.omd.omd_response_models import (
+    OMDColumn,
+    OMDResponseEntity,
+)
+from omd_airflow_utils.lineage_core.domain.models import (
+    DatabaseContext,
+    Node,
+    NodeDescriptions,
+)
+from omd_airflow_utils.lineage_core.domain.types import EntityType
+from omd_airflow_utils.lineage_core.services.omd_use_cases.description_sync import (
+    DescriptionSyncService,
+)
+from omd_airflow_utils.lineage_core.services.omd_use_cases.lineage_metadata_cache import (
+    LineageMetadataService,
+)
+
+
+class FakeNodeRepository:
+    def __init__(self, columns_by_node):
+        self.columns_by_node = columns_by_node
+        self.batches = []
+
+    def fetch_descriptions(self, node_ids):
+        self.batches.append(list(node_ids))
+        return {
+            node_id: NodeDescriptions(node_id=node_id, columns=self.columns_by_node.get(node_id, {}))
+            for node_id in node_ids
+        }
+
+
+class FakeClient:
+    def __init__(self, tables, descriptions=None):
+        self.tables = tables
+        self.descriptions = descriptions or {}
+        self.fetched = []
+        self.patches = []
+
+    def get_entity(self, entity_type, fqn, fields=None):
+        self.fetched.append((fqn, fields))
+        if fqn not in self.tables:
+            raise EntityNotFoundError(f'Table with FQN {fqn} not found')
+        columns = [
+            OMDColumn(
+                name=name,
+                fully_qualified_name=f'{fqn}.{name}',
+                description=self.descriptions.get(f'{fqn}.{name}'),
+            )
+            for name in self.tables[fqn]
+        ] if fields else []
+        return OMDResponseEntity(
+            id=f'id-{fqn}', fully_qualified_name=fqn, description=self.descriptions.get(fqn), columns=columns
+        )
+
+    def patch_entity(self, entity_type, fqn, operations):
+        self.patches.append((fqn, operations))
+
+
+class FakeAsyncClient(FakeClient):
+    def __init__(self, tables):
+        super().__init__(tables)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get_entity(self, entity_type, fqn, fields=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return FakeClient.get_entity(self, entity_type, fqn, fields)
+
+    async def patch_entity(self, entity_type, fqn, operations):
+        FakeClient.patch_entity(self, entity_type, fqn, operations)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+
+def make_node(node_id, name, description=None):
+    return Node(
+        id=node_id, name=name, db_schema='raw', namespace_id=1,
+        updated=datetime.now(UTC), description=description,
+    )
+
+
+class TestDescriptionSyncService:
+
+    @pytest.fixture
+    def client(self):
+        return FakeClient({'s.d.raw.users': ['id', 'email', 'created_at']})
+
+    def make_service(self, client, columns_by_node, batch_size=1000):
+        return DescriptionSyncService(
+            node_repo=FakeNodeRepository(columns_by_node),
+            omd_client=client,
+            db_context=DatabaseContext(service_name='s', database_name='d'),
+            batch_size=batch_size,
+        )
+
+    def test_single_get_and_patch_per_table(self, client):
+        service = self.make_service(client, {1: {'email': 'User email', 'id': 'Key', 'unknown': 'x', 'created_at': ''}})
+
+        result = service.sync_descriptions_for_nodes([make_node(1, 'users', 'Users table')])
+
+        assert (result.patched, result.skipped) == (3, 0)
+        assert client.fetched == [('s.d.raw.users', ['columns'])]
+        assert client.patches == [('s.d.raw.users', [
+            {'op': 'add', 'path': '/description', 'value': 'Users table'},
+            {'op': 'add', 'path': '/columns/1/description', 'value': 'User email'},
+            {'op': 'add', 'path': '/columns/0/description', 'value': 'Key'},
+        ])]
+
+    def test_table_description_only_fetches_base_fields(self, client):
+        service = self.make_service(client, {})
+
+        service.sync_descriptions_for_nodes([make_node(1, 'users', 'Users table')])
+
+        assert client.fetched == [('s.d.raw.users', [])]
+        assert client.patches == [('s.d.raw.users', [
+            {'op': 'add', 'path': '/description', 'value': 'Users table'},
+        ])]
+
+    def test_search_stub_in_cache_is_not_compared(self):
+        client = FakeClient({'s.d.raw.users': ['id']}, descriptions={'s.d.raw.users': 'Same'})
+        metadata_service = LineageMetadataService()
+        stub = OMDResponseEntity(id='id-s.d.raw.users', fully_qualified_name='s.d.raw.users')
+        metadata_service._cache.cache_entity(EntityType.TABLE, 's.d.raw.users', stub, complete=False)
+        service = self.make_service(client, {})
+        service.metadata_service = metadata_service
+
+        result = service.sync_descriptions_for_nodes([make_node(1, 'users', 'Same')])
+
+        assert (result.patched, result.skipped) == (0, 1)
+        assert client.fetched == [('s.d.raw.users', [])]
+        assert client.patches == []
+
+    def test_missing_table_is_skipped(self, client):
+        service = self.make_service(client, {2: {'id': 'Key'}})
+
+        result = service.sync_descriptions_for_nodes([make_node(2, 'missing', 'Gone')])
+
+        assert client.patches == []
+        assert result.failed == 1
+
+    def test_unchanged_descriptions_are_not_patched(self):
+        client = FakeClient(
+            {'s.d.raw.users': ['id', 'email']},
+            descriptions={'s.d.raw.users': 'Users table', 's.d.raw.users.id': 'Key ', 's.d.raw.users.email': 'Old'},
+        )
+        service = self.make_service(client, {1: {'id': 'Key', 'email': 'User email'}})
+
+        result = service.sync_descriptions_for_nodes([make_node(1, 'users', 'Users table')])
+
+        assert (result.patched, result.skipped) == (1, 2)
+        assert client.patches == [('s.d.raw.users', [
+            {'op': 'add', 'path': '/columns/1/description', 'value': 'User email'},
+        ])]
+
+    def test_steady_state_sends_no_patches(self):
+        client = FakeClient({'s.d.raw.users': ['id']}, descriptions={'s.d.raw.users.id': 'Key'})
+        service = self.make_service(client, {1: {'id': 'Key'}})
+
+        result = service.sync_descriptions_for_nodes([make_node(1, 'users')])
+
+        assert client.patches == []
+        assert (result.patched, result.skipped) == (0, 1)
+
+    def test_descriptions_are_loaded_in_batches(self, client):
+        service = self.make_service(client, {1: {'id': 'Key'}}, batch_size=2)
+        nodes = [make_node(i, 'users' if i == 1 else f'missing_{i}') for i in range(1, 6)]
+
+        service.sync_descriptions_for_nodes(nodes)
+
+        assert service.node_repo.batches == [[1, 2], [3, 4], [5]]
+        assert len(client.patches) == 1
+
+    def test_concurrent_mode_bounds_parallelism(self):
+        tables = {f's.d.raw.t{i}': ['id'] for i in range(20)}
+        async_client = FakeAsyncClient(tables)
+        service = DescriptionSyncService(
+            node_repo=FakeNodeRepository({i: {'id': f'Key {i}'} for i in range(20)}),
+            omd_client=None,
+            db_context=DatabaseContext(service_name='s', database_name='d'),
+            async_client_factory=lambda: async_client,
+            batch_size=7,
+            parallelism=3,
+        )
+
+        result = service.sync_descriptions_for_nodes([make_node(i, f't{i}') for i in range(20)])
+
+        assert result.patched == 20
+        assert sorted(fqn for fqn, _ in async_client.patches) == sorted(tables)
+        assert 1 < async_client.peak <= 3
+        assert service.node_repo.batches == [list(range(0, 7)), list(range(7, 14)), list(range(14, 20))]
@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+
+from omd_airflow_utils.lineage_core.adapters.omd.omd_response_models import (
+    OMDResponseEntity,
+)
+from omd_airflow_utils.lineage_core.domain.types import (
+    EntityPair,
+    EntityType,
+    TypedFQN,
+)
+from omd_airflow_utils.lineage_core.services.lineage_executor import (
+    LineageOperationExecutor,
+)
+
+
+class FakeClient:
+    def __init__(self, fail_fqns=()):
+        self.fail_fqns = set(fail_fqns)
+        self.added = []
+        self.deleted = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _call(self, fqn):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.01)
+        with self._lock:
+            self.in_flight -= 1
+        if fqn in self.fail_fqns:
+            raise RuntimeError(f'failed {fqn}')
+
+    def add_lineage(self, from_entity, to_entity, from_fqn, to_fqn):
+        self._call(from_fqn)
+        self.added.append((from_fqn, to_fqn))
+
+    def delete_lineage_by_fqn(self, from_fqn, to_fqn):
+        self._call(from_fqn)
+        self.deleted.append((from_fqn, to_fqn))
+
+
+class TestLineageOperationExecutor:
+
+    @pytest.fixture
+    def pairs(self):
+        return [
+            EntityPair(TypedFQN(EntityType.TABLE, f'src{i}'), TypedFQN(EntityType.TABLE, f'dst{i}'))
+            for i in range(10)
+        ]
+
+    @pytest.fixture
+    def entity_cache(self, pairs):
+        cache = {}
+        for pair in pairs:
+            for entity in (pair.source, pair.target):
+                cache[(entity.type.value, entity.fqn)] = OMDResponseEntity(id=entity.fqn)
+        return cache
+
+    def test_concurrent_add_runs_in_parallel_and_keeps_order(self, pairs, entity_cache):
+        client = FakeClient(fail_fqns={'src3'})
+
+        result = LineageOperationExecutor(max_workers=4).execute_add_operations_concurrently(
+            pairs, entity_cache, client
+        )
+
+        assert result.total_operations == 10
+        assert result.successful_operations == 9
+        assert result.failed_operations == 1
+        assert [r.pair for r in result.results] == pairs
+        assert not result.results[3].success
+        assert 1 < client.peak <= 4
+
+    def test_concurrent_delete(self, pairs):
+        client = FakeClient()
+
+        result = LineageOperationExecutor(max_workers=2).execute_delete_operations_concurrently(pairs, client)
+
+        assert result.successful_operations == 10
+        assert sorted(client.deleted) == sorted((p.source.fqn, p.target.fqn) for p in pairs)
+
+    def test_concurrent_add_missing_entity_is_failure(self, pairs):
+        result = LineageOperationExecutor().execute_add_operations_concurrently(pairs[:1], {}, FakeClient())
+
+        assert result.failed_operations == 1
+        assert isinstance(result.results[0].error, ValueError)
+
+    def test_empty_pairs(self):
+        result = LineageOperationExecutor().execute_delete_operations_concurrently([], FakeClient())
+
+        assert result.total_operations == 0
@@ -0,0 +1,128 @@
+import pytest
+
+from omd_airflow_utils.lineage_core.adapters.cache.entity_store import (
+    SqliteEntityStore,
+)
+from omd_airflow_utils.lineage_core.adapters.omd.exceptions import (
+    EntityNotFoundError,
+)
+from omd_airflow_utils.lineage_core.domain.types import (
+    EntityType,
+    TypedFQN,
+)
+from omd_airflow_utils.lineage_core.services.omd_use_cases.lineage_metadata_cache import (
+    LineageMetadataService,
+)
+from omd_airflow_utils.tests.units.services.conftest import (
+    FakeClient,
+    FakeClock,
+)
+
+
+class TestSchemaPrefetch:
+
+    @pytest.fixture
+    def client(self):
+        return FakeClient(schemas={'s.d.raw': ['users', 'orders'], 's.d.marts': ['summary']})
+
+    def test_prefetch_fills_cache_for_preload(self, client):
+        service = LineageMetadataService()
+
+        prefetched = service.prefetch_schemas(client, ['s.d.raw', 's.d.marts'])
+        preloaded = service.preload_entities(client, [
+            TypedFQN(EntityType.TABLE, 's.d.raw.users'),
+            TypedFQN(EntityType.TABLE, 's.d.marts.summary'),
+        ])
+
+        assert prefetched == 3
+        assert {key: entity.id for key, entity in preloaded.items()} == {
+            ('table', 's.d.raw.users'): 'id-users',
+            ('table', 's.d.marts.summary'): 'id-summary',
+        }
+
+    def test_absent_from_listed_schema_is_known_missing(self, client):
+        service = LineageMetadataService()
+        service.prefetch_schemas(client, ['s.d.raw', 's.d.unlisted'])
+
+        existing = service.fetch_existing_entities(client, [
+            TypedFQN(EntityType.TABLE, 's.d.raw.users'),
+            TypedFQN(EntityType.TABLE, 's.d.raw.dropped'),
+            TypedFQN(EntityType.TABLE, 's.d.unlisted.table'),
+        ])
+
+        assert list(existing) == [('table', 's.d.raw.users')]
+        assert client.searched == [['s.d.unlisted.table']]
+
+    def test_prefetch_skips_already_listed_schemas(self, client):
+        service = LineageMetadataService()
+
+        service.prefetch_schemas(client, ['s.d.raw'])
+        service.prefetch_schemas(client, ['s.d.raw'])
+
+        assert client.listed == ['s.d.raw']
+
+
+class TestFieldProjection:
+
+    def test_cached_entity_is_reused_only_when_it_has_requested_fields(self):
+        client = FakeClient({'s.d.raw.users'})
+        service = LineageMetadataService()
+        entities = [TypedFQN(EntityType.TABLE, 's.d.raw.users')]
+
+        service.preload_entities(client, entities)
+        service.preload_entities(client, entities)
+        service.preload_entities(client, entities, fields=['columns'])
+        service.preload_entities(client, entities)
+
+        assert client.fetched == [('s.d.raw.users', None), ('s.d.raw.users', ['columns'])]
+
+
+class TestNegativeCache:
+
+    def test_missing_entity_is_requested_once(self):
+        client = FakeClient()
+        service = LineageMetadataService()
+        entity = TypedFQN(EntityType.TABLE, 's.d.raw.never_ingested')
+
+        for _ in range(3):
+            with pytest.raises(EntityNotFoundError):
+                service.fetch_entity(client, entity)
+        existing = service.fetch_existing_entities(client, [entity])
+
+        assert existing == {}
+        assert client.fetched == [('s.d.raw.never_ingested', None)]
+        assert client.searched == []
+        assert service.saved_lookups == 3
+
+    def test_only_misses_confirmed_by_direct_request_are_persisted(self, tmp_path):
+        client = FakeClient()
+        searched = TypedFQN(EntityType.TABLE, 's.d.raw.not_indexed_yet')
+        fetched = TypedFQN(EntityType.TABLE, 's.d.raw.never_ingested')
+
+        with SqliteEntityStore(str(tmp_path / 'entities.sqlite')) as store:
+            service = LineageMetadataService(entity_store=store)
+            service.fetch_existing_entities(client, [searched])
+            with pytest.raises(EntityNotFoundError):
+                service.fetch_entity(client, fetched)
+
+            assert service.fetch_existing_entities(client, [searched]) == {}
+            assert client.searched == [['s.d.raw.not_indexed_yet']]
+            assert not store.is_missing(EntityType.TABLE, searched.fqn)
+            assert store.is_missing(EntityType.TABLE, fetched.fqn)
+
+    def test_missing_entity_is_requested_again_after_negative_ttl(self):
+        client = FakeClient()
+        clock = FakeClock()
+        service = LineageMetadataService(negative_ttl_seconds=60, clock=clock)
+        entity = TypedFQN(EntityType.TABLE, 's.d.raw.late_arrival')
+
+        with pytest.raises(EntityNotFoundError):
+            service.fetch_entity(client, entity)
+        clock.now += 60
+        with pytest.raises(EntityNotFoundError, match='cached'):
+            service.fetch_entity(client, entity)
+        client.existing_fqns.add(entity.fqn)
+        clock.now += 1
+
+        assert service.fetch_entity(client, entity).id == 'id-s.d.raw.late_arrival'
+        assert client.fetched == [(entity.fqn, None), (entity.fqn, None)]
@@ -13,6 +13,10 @@ from omd_airflow_utils.lineage_core.domain.models import (
     EntityRef,
     DatabaseContext,
 )
+from omd_airflow_utils.lineage_core.services.omd_use_cases.lineage_metadata_cache import (
+    LineageMetadataService,
+)
+from omd_airflow_utils.tests.units.services.conftest import FakeClient
 from datetime import (
     datetime,
     UTC,
@@ -173,4 +177,148 @@ class TestLineagePairGenerationService:
             ('Sacristy.sacristy.raw.users', 'Sacristy.sacristy.marts.user_orders'),
             ('Sacristy.sacristy.raw.orders', 'Sacristy.sacristy.marts.user_orders'),
         }
-        assert pair_tuples == expected_pairs
\ No newline at end of file
+        assert pair_tuples == expected_pairs
+
+    @pytest.fixture
+    def graph_with_missing_node(self):
+        now = datetime.now(UTC)
+        nodes = [
+            Node(id=1, name='users', db_schema='raw', namespace_id=1, updated=now),
+            Node(id=2, name='missing', db_schema='raw', namespace_id=1, updated=now),
+            Node(id=3, name='user_orders', db_schema='marts', namespace_id=1, updated=now),
+        ]
+        edges = [
+            LineageEdge(
+                from_entity=EntityRef(id='1', type=EntityType.TABLE),
+                to_entity=EntityRef(id='3', type=EntityType.TABLE)
+            ),
+            LineageEdge(
+                from_entity=EntityRef(id='2', type=EntityType.TABLE),
+                to_entity=EntityRef(id='3', type=EntityType.TABLE)
+            ),
+        ]
+        return nodes, edges
+
+    def test_existence_filter_fills_cache_used_by_preload(self, graph_with_missing_node):
+        metadata_service = LineageMetadataService()
+        service = LineagePairGenerationService(metadata_service=metadata_service)
+        nodes, edges = graph_with_missing_node
+        client = FakeClient({'Sacristy.sacristy.raw.users', 'Sacristy.sacristy.marts.user_orders'})
+
+        pairs = service.extract_pairs_from_graph_paths(
+            nodes=nodes,
+            edges=edges,
+            db_context=DatabaseContext(),
+            client=client,
+        )
+        entities = [pairs[0].source, pairs[0].target]
+        preloaded = metadata_service.preload_entities(client, entities)
+
+        assert [(pair.source.fqn, pair.target.fqn) for pair in pairs] == [
+            ('Sacristy.sacristy.raw.users', 'Sacristy.sacristy.marts.user_orders'),
+        ]
+        assert len(preloaded) == 2
+        assert len(client.searched) == 1
+        assert client.fetched == []
+
+    def test_existence_filter_verifies_search_misses_when_enabled(self, graph_with_missing_node):
+        service = LineagePairGenerationService()
+        nodes, edges = graph_with_missing_node
+        client = FakeClient({'Sacristy.sacristy.raw.users', 'Sacristy.sacristy.marts.user_orders'})
+        client.config.search.verify_missing = True
+
+        existing_nodes, _ = service.filter_existing_nodes_only(nodes, edges, client, DatabaseContext())
+
+        assert [node.id for node in existing_nodes] == [1, 3]
+        assert client.fetched == [('Sacristy.sacristy.raw.missing', None)]
+
+    def test_existence_filter_falls_back_to_single_requests(self, graph_with_missing_node):
+        service = LineagePairGenerationService()
+        nodes, edges = graph_with_missing_node
+        client = FakeClient(
+            {'Sacristy.sacristy.raw.users', 'Sacristy.sacristy.marts.user_orders'},
+            search_fails=True,
+        )
+
+        existing_nodes, valid_edges = service.filter_existing_nodes_only(
+            nodes, edges, client, DatabaseContext()
+        )
+
+        assert [node.id for node in existing_nodes] == [1, 3]
+        assert len(valid_edges) == 1
+        assert len(client.fetched) == 3
+
+    @pytest.fixture
+    def layered_graph(self):
+        now = datetime.now(UTC)
+        nodes = [
+            Node(id=1, name='users', db_schema='raw', namespace_id=1, updated=now),
+            Node(id=2, name='users_clean', db_schema='stage', namespace_id=1, updated=now),
+            Node(id=3, name='users_dedup', db_schema='stage', namespace_id=1, updated=now),
+            Node(id=4, name='user_orders', db_schema='marts', namespace_id=1, updated=now),
+            Node(id=5, name='orders', db_schema='raw', namespace_id=1, updated=now),
+        ]
+        return nodes, [(1, 2), (2, 3), (3, 4), (5, 4), (3, 2)]
+
+    def test_skip_schemas_bridges_intermediate_layers(self, layered_graph):
+        nodes, edges = layered_graph
+
+        pairs = LineagePairGenerationService().extract_pairs_from_graph_paths(
+            nodes=nodes,
+            edges=edges,
+            db_context=DatabaseContext(),
+            validate_existence=False,
+            skip_schemas=['stage'],
+        )
+
+        assert {(pair.source.fqn, pair.target.fqn) for pair in pairs} == {
+            ('Sacristy.sacristy.raw.users', 'Sacristy.sacristy.marts.user_orders'),
+            ('Sacristy.sacristy.raw.orders', 'Sacristy.sacristy.marts.user_orders'),
+        }
+
+    def test_skip_schemas_respects_path_cutoff(self, layered_graph):
+        nodes, edges = layered_graph
+
+        pairs = LineagePairGenerationService().extract_pairs_from_graph_paths(
+            nodes=nodes,
+            edges=edges,
+            db_context=DatabaseContext(),
+            validate_existence=False,
+            skip_schemas=['stage'],
+            path_cutoff=2,
+        )
+
+        assert {(pair.source.fqn, pair.target.fqn) for pair in pairs} == {
+            ('Sacristy.sacristy.raw.orders', 'Sacristy.sacristy.marts.user_orders'),
+        }
+
+    def test_cycles_are_reported_during_pair_extraction(self, layered_graph, caplog):
+        nodes, edges = layered_graph
+
+        LineagePairGenerationService().extract_pairs_from_graph_paths(
+            nodes=nodes,
+            edges=edges,
+            db_context=DatabaseContext(),
+            validate_existence=False,
+        )
+
+        assert 'Lineage graph has 1 cycles covering 2 nodes, e.g. [2, 3]' in caplog.text
+
+    def test_skipped_nodes_are_not_checked_in_omd(self, layered_graph):
+        nodes, edges = layered_graph
+        client = FakeClient({
+            'Sacristy.sacristy.raw.users',
+            'Sacristy.sacristy.raw.orders',
+            'Sacristy.sacristy.marts.user_orders',
+        })
+
+        pairs = LineagePairGenerationService().extract_pairs_from_graph_paths(
+            nodes=nodes,
+            edges=edges,
+            db_context=DatabaseContext(),
+            client=client,
+            skip_schemas=['stage'],
+        )
+
+        assert len(pairs) == 2
+        assert not any('stage' in fqn for batch in client.searched for fqn in batch)
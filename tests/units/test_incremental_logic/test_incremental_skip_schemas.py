@@ -0,0 +1,105 @@
+import pytest
+
+from omd_airflow_utils.lineage_core.domain.models import (
+    DatabaseContext,
+    EdgeArray,
+    NodeRecord,
+    Settings,
+)
+from omd_airflow_utils.lineage_core.entrypoints.lineage_graph_fetcher import (
+    LineageGraphFetcher,
+)
+from omd_airflow_utils.lineage_core.services.omd_use_cases.lineage_pair_generator import (
+    LineagePairGenerationService,
+)
+
+SCHEMAS = {1: 'raw', 2: 'stage', 3: 'stage', 4: 'marts'}
+EDGES = [(1, 2), (2, 3), (3, 4)]
+
+
+class FakeRepo:
+    def __init__(self, changed_ids):
+        self.changed_ids = changed_ids
+        self.edge_requests = []
+
+    @staticmethod
+    def node(node_id):
+        return NodeRecord.create(node_id, f't{node_id}', 1, SCHEMAS[node_id], None)
+
+    def fetch_nodes_for_incremental(self, **kwargs):
+        return [self.node(node_id) for node_id in self.changed_ids], []
+
+    def fetch_graph(self, **kwargs):
+        edges = self._edges_touching(self.changed_ids)
+        boundary_ids = {node_id for edge in edges for node_id in edge} - set(self.changed_ids)
+        nodes = [self.node(node_id) for node_id in [*self.changed_ids, *sorted(boundary_ids)]]
+        return nodes, edges, boundary_ids
+
+    def fetch_edge_pairs(self, node_ids):
+        self.edge_requests.append(sorted(node_ids))
+        return self._edges_touching(node_ids)
+
+    @staticmethod
+    def _edges_touching(node_ids):
+        return EdgeArray(edge for edge in EDGES if edge[0] in node_ids or edge[1] in node_ids)
+
+    def fetch_nodes_additional_for_edges(self, operator_id, node_ids, state='accepted'):
+        return [self.node(node_id) for node_id in node_ids]
+
+
+def bridged_pairs(result):
+    pairs = LineagePairGenerationService().extract_pairs_from_graph_paths(
+        nodes=result.nodes,
+        edges=result.edges,
+        db_context=DatabaseContext(service_name='s', database_name='d'),
+        validate_existence=False,
+        skip_schemas=['stage'],
+    )
+    return {(pair.source.fqn, pair.target.fqn) for pair in pairs}
+
+
+@pytest.mark.parametrize('changed_id', [1, 4])
+def test_incremental_fetch_follows_skipped_schemas(changed_id):
+    fetcher = LineageGraphFetcher(Settings(), skip_schemas=['stage'])
+
+    result = fetcher._collect_incremental(FakeRepo([changed_id]))
+
+    assert set(result.edges) == set(EDGES)
+    assert bridged_pairs(result) == {('s.d.raw.t1', 's.d.marts.t4')}
+
+
+def test_incremental_fetch_without_skip_schemas_stays_local():
+    repo = FakeRepo([1])
+
+    result = LineageGraphFetcher(Settings())._collect_incremental(repo)
+
+    assert list(result.edges) == [(1, 2)]
+    assert repo.edge_requests == [[1]]
+
+
+def test_incremental_expansion_is_bounded_by_path_cutoff():
+    repo = FakeRepo([1])
+
+    result = LineageGraphFetcher(Settings(), skip_schemas=['stage'], path_cutoff=1)._collect_incremental(repo)
+
+    assert set(result.edges) == {(1, 2), (2, 3)}
+    assert repo.edge_requests == [[1], [2]]
+
+
+@pytest.mark.parametrize('changed_ids', [[1], [4], [2, 3]])
+def test_init_and_incremental_fetch_bridge_the_same_pairs(changed_ids):
+    fetcher = LineageGraphFetcher(Settings(), skip_schemas=['stage'])
+
+    init = fetcher._collect_init(FakeRepo(changed_ids))
+    incremental = fetcher._collect_incremental(FakeRepo(changed_ids))
+
+    assert set(init.edges) == set(incremental.edges) == set(EDGES)
+    assert bridged_pairs(init) == bridged_pairs(incremental) == {('s.d.raw.t1', 's.d.marts.t4')}
+
+
+def test_init_fetch_expands_only_boundary_nodes():
+    repo = FakeRepo([2, 3])
+
+    LineageGraphFetcher(Settings(), skip_schemas=['stage'])._collect_init(repo)
+
+    assert repo.edge_requests == []
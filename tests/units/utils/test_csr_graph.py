@@ -0,0 +1,58 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from omd_airflow_utils.lineage_core.domain.models import NodeRecord  # noqa: E402
+from omd_airflow_utils.lineage_core.domain.types import GraphEngine  # noqa: E402
+from omd_airflow_utils.lineage_core.services.lineage_graph_builder import (  # noqa: E402
+    LineageGraphService,
+)
+from omd_airflow_utils.lineage_core.utils.csr_graph import CSRGraph  # noqa: E402
+
+
+@pytest.fixture
+def graph():
+    return CSRGraph.from_edges(
+        node_ids=[30, 10, 20, 40, 50],
+        sources=[10, 10, 20, 30, 10, 99],
+        targets=[20, 30, 40, 40, 20, 10],
+        node_data=['c', 'a', 'b', 'd', 'e'],
+    )
+
+
+def test_builds_deduplicated_adjacency_for_known_nodes(graph):
+    assert graph.number_of_nodes() == 5
+    assert graph.number_of_edges() == 4
+    assert graph.successors(10) == [20, 30]
+    assert graph.predecessors(40) == [20, 30]
+    assert graph.has_edge(10, 30)
+    assert not graph.has_edge(30, 10)
+    assert graph.get_node(30) == 'c'
+    assert graph.sources() == {10, 50}
+    assert graph.sinks() == {40, 50}
+
+
+def test_bfs_downstream_upstream_and_depth(graph):
+    assert sorted(graph.bfs([20]).tolist()) == [20, 40]
+    assert sorted(graph.bfs([40], reverse=True).tolist()) == [10, 20, 30, 40]
+    assert sorted(graph.bfs([10], max_depth=1).tolist()) == [10, 20, 30]
+
+
+def test_weakly_connected_components(graph):
+    labels = graph.weakly_connected_components()
+
+    assert len(set(labels.tolist())) == 2
+    assert labels[graph.index_of([50])[0]] != labels[graph.index_of([10])[0]]
+
+
+def test_graph_service_builds_same_edges_with_csr_engine():
+    nodes = [NodeRecord(i, f't{i}', 1, 's', None, operator_id=14 if i == 3 else None) for i in range(1, 6)]
+    edges = [(1, 2), (2, 3), (3, 4), (4, 5), (1, 2)]
+
+    simple = LineageGraphService().build_graph(nodes, edges, collapse_triggers=True, trigger_operator_id=14)
+    csr = LineageGraphService(engine=GraphEngine.CSR).build_graph(
+        nodes, edges, collapse_triggers=True, trigger_operator_id=14
+    )
+
+    assert isinstance(csr, CSRGraph)
+    assert sorted(csr.edges()) == sorted(simple.edges()) == [(1, 2), (2, 4), (4, 5)]
@@ -0,0 +1,43 @@
+from omd_airflow_utils.lineage_core.utils.lru_cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert len(cache) == 2
+
+
+def test_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = LRUCache(ttl_seconds=10, clock=clock)
+    cache.set('a', 1)
+
+    clock.now = 5
+    assert cache.get('a') == 1
+    clock.now = 11
+    assert cache.get('a') is None
+
+
+def test_counts_hits_and_misses():
+    cache = LRUCache()
+    cache.set('a', 1)
+
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+
+    assert (cache.hits, cache.misses) == (2, 1)
@@ -0,0 +1,86 @@
+import pytest
+
+from omd_airflow_utils.lineage_core.utils.rate_limiter import (
+    AdaptiveTokenBucket,
+    RateLimiterRegistry,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAdaptiveTokenBucket:
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    def test_burst_is_free_then_waits_at_rate(self, clock):
+        bucket = AdaptiveTokenBucket(calls_per_second=10, burst=3, clock=clock)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.1)
+        assert bucket.reserve() == pytest.approx(0.2)
+
+    def test_tokens_refill_over_time(self, clock):
+        bucket = AdaptiveTokenBucket(calls_per_second=10, burst=1, clock=clock)
+        bucket.reserve()
+
+        clock.now += 0.1
+
+        assert bucket.reserve() == 0.0
+
+    def test_throttle_response_lowers_rate_and_honours_retry_after(self, clock):
+        bucket = AdaptiveTokenBucket(calls_per_second=10, burst=5, decrease_factor=0.5, clock=clock)
+
+        bucket.on_response(429, retry_after=2.0)
+
+        assert bucket.rate == pytest.approx(5.0)
+        assert bucket.reserve() == pytest.approx(2.0)
+
+    def test_success_grows_rate_up_to_max(self, clock):
+        bucket = AdaptiveTokenBucket(
+            calls_per_second=10, burst=20, max_calls_per_second=10.5, increase_step=0.2, clock=clock
+        )
+
+        for _ in range(5):
+            bucket.on_response(200)
+
+        assert bucket.rate == pytest.approx(10.5)
+
+    def test_non_adaptive_keeps_rate(self, clock):
+        bucket = AdaptiveTokenBucket(calls_per_second=10, burst=20, adaptive=False, clock=clock)
+
+        bucket.on_response(503, retry_after=1.0)
+
+        assert bucket.rate == 10
+
+
+def test_registry_shares_limiter_per_host():
+    RateLimiterRegistry.reset()
+    limits = {'calls_per_second': 10.0, 'burst': 20}
+
+    first = RateLimiterRegistry.get('http://omd-a', **limits)
+
+    assert RateLimiterRegistry.get('http://omd-a', **limits) is first
+    assert RateLimiterRegistry.get('http://omd-b', **limits) is not first
+
+
+def test_registry_warns_on_conflicting_limits(caplog):
+    RateLimiterRegistry.reset()
+    first = RateLimiterRegistry.get('http://omd-a', calls_per_second=10.0, burst=20)
+
+    assert RateLimiterRegistry.get('http://omd-a', calls_per_second=5.0, burst=20) is first
+    assert 'already registered' in caplog.text
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
@@ -0,0 +1,86 @@
+import base64
+import random
+from array import array
+
+from omd_airflow_utils.lineage_core.utils.reachability_index import (
+    ReachabilityIndex,
+    _decode,
+    _encode,
+)
+from omd_airflow_utils.lineage_core.utils.simple_graph import SimpleDiGraph
+
+
+def make_graph(edges, nodes=()):
+    graph = SimpleDiGraph()
+    for node_id in {*nodes, *(node for edge in edges for node in edge)}:
+        graph.add_node(node_id)
+    for src, dst in edges:
+        graph.add_edge(src, dst)
+    return graph
+
+
+def walk(graph, start, reverse=False):
+    step = graph.predecessors if reverse else graph.successors
+    seen, stack = set(), [start]
+    while stack:
+        for neighbor in step(stack.pop()):
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return seen
+
+
+def test_downstream_and_upstream_on_dag():
+    index = ReachabilityIndex.from_graph(make_graph([(1, 2), (2, 3), (1, 4), (5, 4)], nodes=[6]))
+
+    assert index.downstream(1) == {2, 3, 4}
+    assert index.upstream(4) == {1, 5}
+    assert index.downstream(6) == set()
+    assert index.is_reachable(1, 3)
+    assert not index.is_reachable(3, 1)
+    assert not index.is_reachable(1, 1)
+
+
+def test_cycle_members_reach_each_other():
+    index = ReachabilityIndex.from_graph(make_graph([(1, 2), (2, 3), (3, 2), (3, 4)]))
+
+    assert index.downstream(2) == {2, 3, 4}
+    assert index.upstream(3) == {1, 2, 3}
+    assert index.is_reachable(2, 2)
+
+
+def test_self_loop_reaches_itself():
+    index = ReachabilityIndex.from_graph(make_graph([(1, 1), (1, 2)]))
+
+    assert index.downstream(1) == {1, 2}
+    assert index.is_reachable(1, 1)
+    assert not index.is_reachable(2, 2)
+
+
+def test_matches_graph_walk_on_random_graph():
+    rng = random.Random(7)
+    edges = [(rng.randrange(60), rng.randrange(60)) for _ in range(150)] + [(7, 7)]
+    graph = make_graph(edges, nodes=range(60))
+    index = ReachabilityIndex.from_graph(graph)
+
+    for node_id in graph.nodes():
+        downstream = walk(graph, node_id)
+        assert index.downstream(node_id) == downstream
+        assert index.upstream(node_id) == walk(graph, node_id, reverse=True)
+        assert {dst for dst in graph.nodes() if index.is_reachable(node_id, dst)} == downstream
+
+
+def test_round_trips_through_file(tmp_path):
+    index = ReachabilityIndex.from_graph(make_graph([(1, 2), (2, 1), (2, 3)]))
+    path = tmp_path / 'reachability.json'
+
+    index.save(str(path))
+    restored = ReachabilityIndex.load(str(path))
+
+    assert restored.downstream(1) == index.downstream(1) == {1, 2, 3}
+    assert restored.upstream(3) == {1, 2}
+
+
+def test_serialized_arrays_are_little_endian_int32():
+    assert _decode(_encode([1, -1])) == array('i', [1, -1])
+    assert base64.b64decode(_encode([1, 258])) == b'\x01\x00\x00\x00\x02\x01\x00\x00'
@@ -0,0 +1,74 @@
+from omd_airflow_utils.lineage_core.utils.simple_graph import SimpleDiGraph
+
+
+def make_graph(edges, nodes=()):
+    graph = SimpleDiGraph()
+    for node_id in {*nodes, *(node for edge in edges for node in edge)}:
+        graph.add_node(node_id)
+    for src, dst in edges:
+        graph.add_edge(src, dst)
+    return graph
+
+
+def test_indexes_successors_and_predecessors():
+    graph = make_graph([(1, 2), (1, 3), (2, 3), (1, 3)])
+
+    assert graph.has_edge(1, 3)
+    assert not graph.has_edge(3, 1)
+    assert set(graph.successors(1)) == {2, 3}
+    assert set(graph.predecessors(3)) == {1, 2}
+    assert graph.number_of_edges() == 3
+    assert graph.in_degree() == {1: 0, 2: 1, 3: 2}
+    assert graph.out_degree() == {1: 2, 2: 1, 3: 0}
+
+
+def test_sources_and_sinks_include_isolated_nodes():
+    graph = make_graph([(1, 2)], nodes=[5])
+
+    assert graph.sources() == {1, 5}
+    assert graph.sinks() == {2, 5}
+
+
+def test_all_simple_paths_skips_cycles_and_respects_cutoff():
+    graph = make_graph([(1, 2), (2, 1), (2, 3), (1, 3), (3, 4), (2, 4)])
+
+    paths = sorted(graph.all_simple_paths(1, 4))
+
+    assert paths == [[1, 2, 3, 4], [1, 2, 4], [1, 3, 4]]
+    assert sorted(graph.all_simple_paths(1, 4, cutoff=2)) == [[1, 2, 4], [1, 3, 4]]
+
+
+def test_strongly_connected_components_in_reverse_topological_order():
+    graph = make_graph([(1, 2), (2, 3), (3, 2), (3, 4)], nodes=[5])
+
+    components = [sorted(component) for component in graph.strongly_connected_components()]
+
+    assert sorted(components) == [[1], [2, 3], [4], [5]]
+    assert components.index([4]) < components.index([2, 3]) < components.index([1])
+    assert [sorted(component) for component in graph.strongly_connected_components(within={1, 2})] == [[2], [1]]
+
+
+def test_condensation_collapses_cycles_into_dag():
+    graph = make_graph([(1, 2), (2, 3), (3, 2), (3, 4), (4, 4), (1, 5)])
+    condensation = graph.condensation()
+    component = condensation.component_of
+
+    assert len(condensation) == 4
+    assert sorted(map(sorted, condensation.cycles())) == [[2, 3], [4]]
+    assert condensation.successors[component[1]] == {component[2], component[5]}
+    assert condensation.successors[component[2]] == {component[4]}
+    assert condensation.predecessors[component[4]] == {component[3]}
+    order = list(condensation.topological_order())
+    assert order.index(component[1]) < order.index(component[3]) < order.index(component[4])
+    assert [sorted(layer) for layer in condensation.generations()] == [
+        [component[1]], sorted([component[2], component[5]]), [component[4]]
+    ]
+
+
+def test_keyword_attributes_are_stored_as_dict_payload():
+    graph = SimpleDiGraph()
+    graph.add_node(1, name='users', db_schema='raw')
+    graph.add_node(2)
+
+    assert graph.get_node(1) == {'name': 'users', 'db_schema': 'raw'}
+    assert graph.get_node(2) == {}